@@ -1,6 +1,6 @@
 grammar FriendlyDate;
 
-import Timezone, Unknown;
+import Timezone;
 
 friendlyDateTime : dateTime EOF ;
 
@@ -14,9 +14,8 @@ dateTime
 
 now : NOW ;
 
-anyTz : tz | tzAbbreviation | tzOffset;
+anyTz : tz | tzOffset;
 tz : TIMEZONE ;
-tzAbbreviation: TIMEZONE_ABBREVIATION ;
 tzOffset : (DASH | PLUS) hour12 (COLON? minute2)? ;
 
 friendlyDate : dateAlone EOF ;
@@ -0,0 +1,21 @@
+grammar Timezone;
+
+// Timezone names and abbreviations are lexed by their shape and
+// resolved against the pytz database and tz_abbreviations by the
+// visitor, so updating tzdata does not require regenerating the lexer.
+//
+// As TIMEZONE matches any word, it must be defined after every
+// keyword: on matches of the same length the first rule wins.
+
+TIMEZONE
+    : TZ_WORD ('/' TZ_WORD)* ('/' TZ_GMT)?
+    | TZ_GMT
+    | TZ_POSIX
+    ;
+
+fragment TZ_WORD : [a-z] [a-z_]* ('-' [a-z] [a-z_]*)* ;
+
+// gmt0, gmt+0, etc/gmt-14...
+fragment TZ_GMT : 'gmt' [+-]? [0-9] [0-9]? ;
+
+fragment TZ_POSIX : 'cst6cdt' | 'est5edt' | 'mst7mdt' | 'pst8pdt' ;
@@ -1,3 +0,0 @@
-grammar Unknown;
-
-UNKNOWN: [a-z]+ ;
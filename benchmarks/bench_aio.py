@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Measures the event loop latency while a burst of parse requests is
+being served: inline (calling `parse_datetime` from the coroutines),
+through `friendlydateparser.aio` on a thread pool and on a process pool.
+
+A ticker coroutine sleeping 1ms reports the p50/p99/max lag of its
+wake-ups, and the total time to serve the burst. The last column tells
+whether the worst lag stays within the budget of a non-blocked loop:
+50ms or a quarter of the total time, whatever is larger.
+
+Usage: PYTHONPATH=src python benchmarks/bench_aio.py [requests]
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime
+
+from friendlydateparser import DateParser, aio
+from friendlydateparser.parallel import make_executor
+
+now = datetime(2023, 10, 12)
+
+def _texts(n, salt):
+    # distinct inputs so that the plan cache does not hide the parse cost
+    return [f"{i} weeks after the last day of next month at {i % 12 + 1}:{salt:02d}pm" for i in range(n)]
+
+async def _measure(parse, texts):
+    lags = []
+    done = False
+    async def ticker():
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+    task = asyncio.ensure_future(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(parse(text) for text in texts))
+    elapsed = time.perf_counter() - start
+    done = True
+    await task
+    lags.sort()
+    return elapsed, lags[len(lags) // 2], lags[int(len(lags) * 0.99)], lags[-1]
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    inline_parser = DateParser()
+
+    async def inline(text):
+        return inline_parser.parse_datetime(text, now=now)
+
+    threads = aio.AsyncParser()
+    executor = make_executor()
+    processes = aio.AsyncParser(executor)
+    cases = {
+        "inline": inline,
+        "aio threads": lambda text: threads.parse_datetime(text, now=now),
+        "aio processes": lambda text: processes.parse_datetime(text, now=now),
+    }
+    print(f"{'mode':<14} {'total ms':>9} {'lag p50':>9} {'lag p99':>9} {'lag max':>9} {'budget':>7}")
+    try:
+        for salt, (name, parse) in enumerate(cases.items()):
+            elapsed, p50, p99, worst = asyncio.run(_measure(parse, _texts(n, salt)))
+            budget = "ok" if worst < max(0.05, elapsed / 4) else "over"
+            print(f"{name:<14} {elapsed * 1e3:9.1f} {p50 * 1e3:9.2f} {p99 * 1e3:9.2f} {worst * 1e3:9.2f} "
+                  f"{budget:>7}")
+    finally:
+        threads.close()
+        executor.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Measures the throughput of `find_dates` on documents of growing size
+made of prose with a date expression every few sentences. Throughput
+should stay flat as the size grows.
+
+Usage: PYTHONPATH=src python benchmarks/bench_extract.py
+"""
+
+import time
+from datetime import datetime
+
+from friendlydateparser import find_dates, warmup
+
+now = datetime(2023, 10, 12)
+
+paragraph = (
+    "Hi team, following up on ticket #4521 opened 3 days ago by the support desk. "
+    "The customer (ACME Corp.) says the invoice was due on 2024-01-31 but payment failed twice; "
+    "they would like to reschedule the call for next friday at 10:00 cest, or tomorrow at noon "
+    "if that works better for everyone. Please also note the contract renews on the last day of "
+    "next month and the audit is planned for march 15, 2024. Thanks, Bob.\n"
+)
+
+def main():
+    warmup()
+    print(f"{'size KB':>8} {'matches':>8} {'seconds':>8} {'KB/s':>8}")
+    for repeat in (10, 100, 1000):
+        doc = paragraph * repeat
+        start = time.perf_counter()
+        matches = sum(1 for _ in find_dates(doc, now=now))
+        elapsed = time.perf_counter() - start
+        size = len(doc) / 1024
+        print(f"{size:>8.0f} {matches:>8} {elapsed:>8.3f} {size / elapsed:>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Measures the throughput of parse_many over a growing number of worker
+processes.
+
+Usage: PYTHONPATH=src python benchmarks/bench_parallel.py [rows] [max_workers]
+"""
+
+import os
+import sys
+import time
+
+from friendlydateparser import parse_many, plan_cache
+from friendlydateparser.parallel import make_executor, parse_many as parse_many_parallel
+
+templates = [
+    "{n} days before the first of next month",
+    "{n} hours after next sunday at midnight cest",
+    "the {n}th day of 2023",
+    "2024-03-{d:02}t10:{m:02}+02:00",
+    "last friday of october {y}",
+    "wed week {w} {y}",
+]
+
+def corpus(rows):
+    return [templates[i % len(templates)].format(n=i % 97 + 4, d=i % 28 + 1, m=i % 60,
+                                                 y=1900 + i % 300, w=i % 52 + 1)
+            for i in range(rows)]
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    items = corpus(rows)
+    now = "2023-10-12"
+
+    # the plan cache is inherited by forked workers, start every run cold
+    plan_cache.clear()
+    start = time.perf_counter()
+    parse_many(items, now=now)
+    serial = time.perf_counter() - start
+    print(f"serial:     {rows / serial:10.0f} rows/s")
+
+    workers = 1
+    while workers <= max_workers:
+        plan_cache.clear()
+        with make_executor(workers) as executor:
+            parse_many_parallel(items[:100], now=now, executor=executor)
+            start = time.perf_counter()
+            parse_many_parallel(items, now=now, executor=executor, chunksize=500)
+            elapsed = time.perf_counter() - start
+        print(f"{workers:3} workers: {rows / elapsed:10.0f} rows/s ({serial / elapsed:.2f}x)")
+        workers *= 2
+
+if __name__ == "__main__":
+    main()
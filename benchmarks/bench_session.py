@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Compares the per-call cost of building a fresh lexer/parser/visitor set
+for every input against reusing a DateParser session. The session is
+created without the plan cache and the fast path, and with the same
+full LL prediction as the fresh parsers, so that every call still
+lexes, parses and visits its input and only the reuse of the objects
+is measured.
+
+Usage: PYTHONPATH=src python benchmarks/bench_session.py [repetitions]
+"""
+
+import sys
+import timeit
+from datetime import datetime
+
+from antlr4 import InputStream, CommonTokenStream
+
+from friendlydateparser import DateParser, _ErrorListener
+from friendlydateparser.antlr.FriendlyDateLexer import FriendlyDateLexer
+from friendlydateparser.antlr.FriendlyDateParser import FriendlyDateParser
+from friendlydateparser.antlr.FriendlyDateVisitorPy import FriendlyDateVisitorPy
+
+now = datetime(2023, 10, 12)
+
+inputs = [
+    "2024-12-31t13:01+02:00",
+    "10/3/2017 14:30",
+    "the last day of next month",
+    "2 days before the first of next month",
+    "wed week 20 2018",
+    "tomorrow at midnight europe/paris",
+]
+
+def parse_fresh(text):
+    lexer = FriendlyDateLexer(InputStream(text))
+    parser = FriendlyDateParser(CommonTokenStream(lexer))
+    parser.removeErrorListeners()
+    parser.addErrorListener(_ErrorListener())
+    tree = parser.friendlyDateTime()
+    visitor = FriendlyDateVisitorPy(now=now, month_first=True, default_tz=None)
+    return visitor.visit(tree)
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    session = DateParser(cache=None, fast_path=False, prediction="ll")
+
+    # warm the shared DFA caches so that both sides are measured in steady state
+    for text in inputs:
+        parse_fresh(text)
+        session.parse_datetime(text, now=now)
+
+    calls = repetitions * len(inputs)
+    fresh = min(timeit.repeat(lambda: [parse_fresh(text) for text in inputs], number=repetitions, repeat=5))
+    reused = min(timeit.repeat(lambda: [session.parse_datetime(text, now=now) for text in inputs],
+                               number=repetitions, repeat=5))
+
+    print(f"fresh objects per call: {fresh / calls * 1e6:8.1f} us/call")
+    print(f"reused DateParser:      {reused / calls * 1e6:8.1f} us/call")
+    print(f"saving:                 {(fresh - reused) / calls * 1e6:8.1f} us/call ({(1 - reused / fresh) * 100:.1f}%)")
+
+if __name__ == "__main__":
+    main()
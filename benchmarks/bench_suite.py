@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for friendlydateparser.
+
+Runs a corpus grouped by grammar area and reports, for every group,
+throughput and p50/p99 latency end to end (through `DateParser` with and
+without the plan cache) and split into lexing, parsing and visiting.
+Cold timings are the first pass over the corpus in a fresh process,
+one for the stages and one for each end to end session, so that the
+ANTLR DFA caches and the plan cache start empty; warm timings are
+taken in this process after an untimed first pass.
+
+Usage:
+
+    PYTHONPATH=src python benchmarks/bench_suite.py [--rounds N]
+        [--save FILE] [--compare FILE]
+
+`--save` stores the results as JSON and `--compare` prints the ratio
+against a stored run (`make bench` compares against
+benchmarks/baseline.json, `make bench-baseline` refreshes it).
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+_import_start = time.perf_counter()
+from friendlydateparser import DateParser
+_import_time = time.perf_counter() - _import_start
+
+from datetime import datetime
+
+now = datetime(2023, 10, 12, 10, 30)
+
+corpus = {
+    "iso": [
+        "2024-12-31t13:01+02:00",
+        "2021-08-20t13:14:01.7z",
+        "2023-10-12",
+        "2012-w10-1",
+        "2012-365t10:01+00:30",
+        "2024 - 041",
+    ],
+    "numeric": [
+        "10/3/2017",
+        "10/3/2017 14:30",
+        "10/3",
+        "2017/12/3",
+        "10/2017",
+        "20240131",
+    ],
+    "month_names": [
+        "january 1, 2017 at 14:30",
+        "tuesday, 15 october 2024 14:45",
+        "3-october-2017",
+        "the 3rd of october, 2017",
+        "march 15, 2017 11:59 pm",
+        "jul 3rd at noon",
+    ],
+    "relative": [
+        "the first of next month",
+        "the last day of next jan",
+        "tomorrow at midnight",
+        "the day after tomorrow",
+        "the first of october last year",
+        "last monday by tomorrow",
+    ],
+    "week_day_position": [
+        "wed week 20 2018",
+        "monday week 4 april 2023",
+        "last week of jan 2029",
+        "second sunday of january 2023",
+        "2nd saturday next september",
+        "131st day of 2023",
+    ],
+    "deltas": [
+        "2 days before the last day of next month",
+        "1h15m after next sunday at midnight",
+        "3 weeks -1 day before today",
+        "1 month after january 30",
+        "1h 0.1s ago",
+        "1d 4h after next monday at noon",
+    ],
+    "timezones": [
+        "tomorrow at midnight europe/paris",
+        "jul 3rd at noon cest",
+        "1 october 12:00 est",
+        "2 days after today at 1:00pm america/argentina/buenos_aires",
+        "today at 10:00 +05:30",
+        "next friday 9:00am utc",
+    ],
+}
+
+def _percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+def _stats(samples):
+    total = sum(samples)
+    return {
+        "ops": len(samples) / total if total > 0 else 0.0,
+        "p50_us": _percentile(samples, 0.50) * 1e6,
+        "p99_us": _percentile(samples, 0.99) * 1e6,
+    }
+
+def _stages(session, text):
+    perf_counter = time.perf_counter
+    t0 = perf_counter()
+    session._reset(text)
+    session._token_stream.fill()
+    t1 = perf_counter()
+    tree = session._parser.friendlyDateTime()
+    t2 = perf_counter()
+    if session._error_listener.count:
+        raise ValueError(f"Invalid datetime '{text}'")
+    visitor = session._visitor
+    visitor.evaluate(visitor.compile(tree), now, None)
+    t3 = perf_counter()
+    return t1 - t0, t2 - t1, t3 - t2
+
+def _timed(func, text):
+    start = time.perf_counter()
+    func(text)
+    return time.perf_counter() - start
+
+# kinds of measurement, each one run cold in its own process
+_kinds = ("stages", "uncached", "cached")
+
+def _sessions():
+    return {
+        "stages": DateParser(cache=None, fast_path=False),
+        "uncached": DateParser(cache=None),
+        "cached": DateParser(),
+    }
+
+def _measure(kind, session, text):
+    if kind == "stages":
+        return dict(zip(("lex", "parse", "visit"), _stages(session, text)))
+    return {kind: _timed(lambda t: session.parse_datetime(t, now=now), text)}
+
+def _cold_pass(kind):
+    # first pass over the corpus, meant to run in a fresh process
+    session = _sessions()[kind]
+    samples = {}
+    for group, texts in corpus.items():
+        samples[group] = {}
+        for text in texts:
+            for key, value in _measure(kind, session, text).items():
+                samples[group].setdefault(key, []).append(value)
+    return samples
+
+def _cold():
+    samples = {group: {} for group in corpus}
+    for kind in _kinds:
+        out = subprocess.run([sys.executable, __file__, "--cold-pass", kind],
+                             capture_output=True, text=True, check=True)
+        for group, values in json.loads(out.stdout).items():
+            samples[group].update(values)
+    return samples
+
+def run(rounds):
+    sessions = _sessions()
+    cold = _cold()
+
+    results = {"import_s": _import_time, "groups": {}}
+    for group, texts in corpus.items():
+        samples = {key: [] for key in ("lex", "parse", "visit", "uncached", "cached")}
+        for round in range(rounds + 1):
+            for text in texts:
+                for kind in _kinds:
+                    values = _measure(kind, sessions[kind], text)
+                    if round > 0:
+                        for key, value in values.items():
+                            samples[key].append(value)
+        results["groups"][group] = {
+            "warm": {key: _stats(values) for key, values in samples.items()},
+            "cold": {key: _stats(cold[group][key]) for key in samples},
+        }
+    return results
+
+def report(results, baseline=None):
+    print(f"import: {results['import_s'] * 1e3:.1f} ms")
+    header = f"{'group':<18} {'stage':<9} {'ops/s':>10} {'p50 us':>9} {'p99 us':>9} {'cold p50':>9}"
+    if baseline:
+        header += f" {'vs base':>8}"
+    print(header)
+    for group, data in results["groups"].items():
+        for key, warm in data["warm"].items():
+            line = (f"{group:<18} {key:<9} {warm['ops']:>10.0f} {warm['p50_us']:>9.1f} "
+                    f"{warm['p99_us']:>9.1f} {data['cold'][key]['p50_us']:>9.1f}")
+            if baseline:
+                try:
+                    base = baseline["groups"][group]["warm"][key]["ops"]
+                    line += f" {warm['ops'] / base:>7.2f}x"
+                except (KeyError, ZeroDivisionError):
+                    line += f" {'-':>8}"
+            print(line)
+
+def main():
+    p = argparse.ArgumentParser(description="friendlydateparser benchmark suite")
+    p.add_argument("--rounds", type=int, default=50, help="warm rounds over the corpus")
+    p.add_argument("--save", help="store the results as JSON in the given file")
+    p.add_argument("--compare", help="compare against the results stored in the given file")
+    p.add_argument("--cold-pass", choices=_kinds, help=argparse.SUPPRESS)
+    args = p.parse_args()
+
+    if args.cold_pass:
+        json.dump(_cold_pass(args.cold_pass), sys.stdout)
+        return
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare) as f:
+                baseline = json.load(f)
+        except FileNotFoundError:
+            print(f"baseline {args.compare} not found, run 'make bench-baseline' first", file=sys.stderr)
+
+    results = run(args.rounds)
+    report(results, baseline)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+
+if __name__ == "__main__":
+    main()
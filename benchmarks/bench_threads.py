@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Measures how parsing throughput scales with the number of threads,
+each one using its own session from a `threads.ParserPool`.
+
+With the GIL throughput stays flat; on free-threaded builds (3.13t
+and later, `python3.13t`) it should grow with the number of cores.
+
+Usage: PYTHONPATH=src python benchmarks/bench_threads.py [inputs]
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from friendlydateparser import warmup
+from friendlydateparser.threads import ParserPool
+
+now = datetime(2023, 10, 12)
+
+def _texts(n, salt):
+    return [f"{i} weeks after the last day of next month at {i % 12 + 1}:{salt:02d}pm" for i in range(n)]
+
+def run(threads, texts):
+    pool = ParserPool(cache=None)
+    chunks = [texts[i::threads] for i in range(threads)]
+    def work(chunk):
+        parser = pool.get()
+        for text in chunk:
+            parser.parse_datetime(text, now=now)
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        list(executor.map(work, chunks))
+        return time.perf_counter() - start
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    warmup()
+    base = None
+    print(f"{'threads':>7} {'parses/s':>10} {'speedup':>8}")
+    for salt, threads in enumerate((1, 2, 4, 8)):
+        elapsed = run(threads, _texts(n, salt))
+        rate = n / elapsed
+        base = base or rate
+        print(f"{threads:>7} {rate:>10.0f} {rate / base:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Measures the per-call cost of timezone-heavy parsing: `parse_timezone`,
+a string `default_tz` and inputs carrying zone names, abbreviations
+and offsets, both with the plan cache and without it (so that every
+timezone is resolved again), for every timezone backend. The
+`localize` rows measure attaching a zone to a naive datetime alone.
+
+Usage: PYTHONPATH=src python benchmarks/bench_tz.py [repetitions]
+"""
+
+import sys
+import timeit
+from datetime import datetime
+
+from friendlydateparser import DateParser
+from friendlydateparser import tz as tz_cache
+
+now = datetime(2023, 10, 12)
+
+zones = ["Europe/Paris", "cest", "+05:30", "z", "america/argentina/buenos_aires", "EST"]
+
+inputs = [
+    "tomorrow at midnight europe/paris",
+    "jul 3rd at noon cest",
+    "1 october 12:00 est",
+    "2 days after today at 1:00pm america/argentina/buenos_aires",
+    "today at 10:00 +05:30",
+    "2024-12-31t13:01+02:00",
+]
+
+local_times = [datetime(2023, month, 12, 10) for month in range(1, 7)]
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{'':<16} {'pytz':>8} {'zoneinfo':>8}  us/call")
+    results = {}
+    for backend in ("pytz", "zoneinfo"):
+        cached = DateParser(tz_backend=backend)
+        uncached = DateParser(cache=None, tz_backend=backend)
+        paris = tz_cache.from_name("europe/paris", backend)
+        cest = tz_cache.from_name("cest", backend)
+
+        cases = {
+            "parse_timezone": lambda: [cached.parse_timezone(z) for z in zones],
+            "default_tz": lambda: [cached.parse_datetime("tomorrow", now=now, default_tz=z) for z in zones],
+            "inputs cached": lambda: [cached.parse_datetime(t, now=now) for t in inputs],
+            "inputs uncached": lambda: [uncached.parse_datetime(t, now=now) for t in inputs],
+            "localize zone": lambda: [tz_cache.localize(paris, d) for d in local_times],
+            "localize offset": lambda: [tz_cache.localize(cest, d) for d in local_times],
+        }
+        for name, case in cases.items():
+            case()
+            best = min(timeit.repeat(case, number=repetitions, repeat=3))
+            results.setdefault(name, []).append(best / (repetitions * 6) * 1e6)
+    for name, (a, b) in results.items():
+        print(f"{name:<16} {a:8.2f} {b:8.2f}")
+
+if __name__ == "__main__":
+    main()
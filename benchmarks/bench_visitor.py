@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Measures the cost of turning parse trees into plans: time per visit
+and the peak of the memory allocated while visiting (as traced by
+tracemalloc).
+
+Usage: PYTHONPATH=src python benchmarks/bench_visitor.py [repetitions]
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from friendlydateparser import DateParser
+
+inputs = [
+    "january 1, 2017 at 14:30",
+    "2 days before the last day of next month",
+    "1d 4h 3m 2s after next monday at noon cest",
+    "3 weeks -1 day, 2 months before today",
+    "wed week 20 2018 at 10:00:01.5 pm",
+    "the last day of next jan by october 2020",
+    "2021-08-20t13:14:01.7z",
+]
+
+def _trees():
+    session = DateParser(cache=None, fast_path=False)
+    trees = []
+    for text in inputs:
+        session._reset(text)
+        trees.append(session._parser.friendlyDateTime())
+        # parse trees keep a reference to the token stream, which is
+        # reused by the session, so take a new session for every tree
+        session = DateParser(cache=None, fast_path=False)
+    return trees
+
+def _allocations(visitor, tree):
+    tracemalloc.start()
+    try:
+        visitor.compile(tree)
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        visitor.compile(tree)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - base
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    visitor = DateParser()._visitor
+    total_time = 0
+    for text, tree in zip(inputs, _trees()):
+        visitor.compile(tree)
+        elapsed = min(timeit.repeat(lambda: visitor.compile(tree), number=repetitions, repeat=5)) / repetitions
+        total_time += elapsed
+        peak = _allocations(visitor, tree)
+        print(f"{text:<45} {elapsed * 1e6:8.1f} us {peak:8d} B peak")
+    print(f"{'mean':<45} {total_time / len(inputs) * 1e6:8.1f} us")
+
+if __name__ == "__main__":
+    main()
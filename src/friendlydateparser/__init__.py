@@ -2,16 +2,32 @@
 Friendly Date Parser - A Python library for parsing human-readable date and time expressions.
 """
 
-import friendlydateparser.antlr.FriendlyDateLexer
-
-from antlr4 import InputStream, CommonTokenStream
-from antlr4.error.ErrorListener import ErrorListener
-from friendlydateparser.antlr.FriendlyDateLexer import FriendlyDateLexer
-from friendlydateparser.antlr.FriendlyDateParser import FriendlyDateParser
-from friendlydateparser.antlr.FriendlyDateVisitorPy import FriendlyDateVisitorPy
+from friendlydateparser.cache import PlanCache
+from friendlydateparser import instrument
+from friendlydateparser import tz as tz_cache
 
+from collections import namedtuple
 from datetime import datetime, date
-import logging
+from time import perf_counter
+import os
+import threading
+
+def _load():
+    # The ANTLR runtime, the generated lexer and parser (which
+    # deserialize their ATNs when imported) and the visitor are loaded
+    # when the first DateParser is created instead of on import.
+    global InputStream, CommonTokenStream, PredictionMode, BailErrorStrategy
+    global ParseCancellationException, FriendlyDateLexer, FriendlyDateParser
+    global FriendlyDateVisitorPy, compile_fast, could_match, install_locks
+    from antlr4 import InputStream, CommonTokenStream, PredictionMode
+    from antlr4.error.ErrorStrategy import BailErrorStrategy
+    from antlr4.error.Errors import ParseCancellationException
+    from friendlydateparser.antlr.FriendlyDateLexer import FriendlyDateLexer
+    from friendlydateparser.antlr.FriendlyDateParser import FriendlyDateParser
+    from friendlydateparser.antlr.FriendlyDateVisitorPy import FriendlyDateVisitorPy
+    from friendlydateparser.fastpath import compile_fast
+    from friendlydateparser.prefilter import could_match
+    from friendlydateparser.locking import install as install_locks
 
 def _resolve_now(now, default_tz):
     if now is None:
@@ -40,52 +56,508 @@ def _resolve_tz(tz):
         return parse_timezone(tz)
     return tz
 
-def _parse_anything(text, what, now=None, month_first=True, default_tz=None):
+outputs = ("datetime", "epoch_us", "ordinal", "iso", "tuple")
+
+def _check_output(output):
+    if output not in outputs:
+        raise ValueError(f"Invalid value for 'output' parameter: {output}")
+
+def _resolve(now, month_first, default_tz, context):
+    if context is not None:
+        return context.resolve()
     default_tz = _resolve_tz(default_tz)
-    now = _resolve_now(now, default_tz)
-    month_first = _resolve_month_first(month_first)
-    input_stream = InputStream(text.lower())
-    lexer = FriendlyDateLexer(input_stream)
-    token_stream = CommonTokenStream(lexer)
-    parser = FriendlyDateParser(token_stream)
-    error_listener = _ErrorListener()
-    parser.removeErrorListeners()
-    parser.addErrorListener(error_listener)
-
-    if what == "date":
-        tree = parser.friendlyDate()
-    elif what == "datetime":
-        tree = parser.friendlyDateTime()
-    elif what == "timezone":
-        tree = parser.friendlyTimezone()
-    else:
-        raise ValueError(f"Invalid value for 'what' parameter: {what}")
-
-    if error_listener.count > 0:
-        raise ValueError(f"Invalid {what} '{text}', {error_listener.first_error()}, partial result: {tree.toStringTree(recog=parser)}")
-
-    visitor = FriendlyDateVisitorPy(now=now, month_first=month_first, default_tz=default_tz)
-    return visitor.visit(tree)
-
-def parse_date(text, now=None, month_first=True):
-    return _parse_anything(text, "date", now=now, month_first=month_first)
-
-def parse_datetime(text, now=None, month_first=True, default_tz=None):
-    return _parse_anything(text, "datetime", now=now, month_first=month_first, default_tz=default_tz)
+    return _resolve_now(now, default_tz), _resolve_month_first(month_first), default_tz
+
+class ParseContext(namedtuple('ParseContext', ['now', 'month_first', 'default_tz', 'clock'])):
+    """
+    Immutable set of `now`, `month_first` and `default_tz` values
+    resolved once (strings parsed, `"locale"` looked up) which can be
+    passed as `context` to the parsing functions instead of resolving
+    them on every call.
+
+    When `now` is `None`, `clock` (`datetime.now` by default) is called
+    on every parse to get the reference time.
+    """
+    __slots__ = ()
+
+    def __new__(cls, now=None, month_first=True, default_tz=None, clock=None):
+        default_tz = _resolve_tz(default_tz)
+        if now is not None:
+            now = _resolve_now(now, default_tz)
+        return super().__new__(cls, now, _resolve_month_first(month_first), default_tz,
+                               datetime.now if clock is None else clock)
+
+    def resolve(self):
+        """
+        Returns the `(now, month_first, default_tz)` tuple for a parse.
+        """
+        now = self.now
+        if now is None:
+            now = self.clock()
+        return now, self.month_first, self.default_tz
+
+plan_cache = PlanCache()
+
+PredictionInfo = namedtuple('PredictionInfo', ['sll', 'fallbacks'])
+
+class DateParser:
+    """
+    Parser session owning a long-lived lexer, parser and visitor set
+    which is reset and reused for every input.
+
+    Compiled plans are looked up in `cache` (the process-wide
+    `plan_cache` by default, `None` disables caching) so that
+    repeated expressions are only parsed once.
+
+    Machine-written layouts (ISO 8601, `20240131`, `10/3/2017 14:30`)
+    are recognized by a regex fast path which skips ANTLR, unless
+    `fast_path` is false. Their plans are not cached as they rarely
+    repeat.
+
+    With `prediction="two_stage"` (the default) inputs are first parsed
+    in ANTLR's faster SLL prediction mode, stopping at the first syntax
+    error, and only those which fail are parsed again in full LL mode.
+    `prediction="ll"` always uses full LL.
+
+    The `try_parse_*` methods return `None` instead of raising for
+    invalid input. Texts rejected by a prefilter on the lexer
+    vocabulary never reach ANTLR, and the rest stop at the first syntax
+    error without building the error message.
+
+    Timezones are built by `tz_backend`, `"pytz"` or `"zoneinfo"` (see
+    `friendlydateparser.tz`), the default backend when not given.
+
+    Sessions are not thread-safe, use one per thread (see
+    `friendlydateparser.threads`). The DFAs, plan cache and timezone
+    cache that all the sessions share are safe to use concurrently.
+    """
+
+    def __init__(self, cache=plan_cache, fast_path=True, prediction="two_stage", tz_backend=None):
+        if prediction not in ("two_stage", "ll"):
+            raise ValueError(f"Invalid value for 'prediction' parameter: {prediction}")
+        _load()
+        self._cache = cache
+        self._fast_path = fast_path
+        self._two_stage = prediction == "two_stage"
+        self._sll = 0
+        self._fallbacks = 0
+        self._lexer = FriendlyDateLexer(InputStream(""))
+        self._token_stream = CommonTokenStream(self._lexer)
+        self._parser = FriendlyDateParser(self._token_stream)
+        install_locks(self._lexer, self._parser)
+        self._error_listener = _ErrorListener()
+        self._parser.removeErrorListeners()
+        self._parser.addErrorListener(self._error_listener)
+        self._default_strategy = self._parser._errHandler
+        self._bail_strategy = BailErrorStrategy()
+        self._tz = tz_cache.get_backend(tz_backend)
+        self._visitor = FriendlyDateVisitorPy(now=datetime.now(), month_first=True, default_tz=None,
+                                              tz_backend=self._tz)
+
+    def prediction_info(self):
+        """
+        Returns the number of grammar parses resolved in SLL mode and the
+        number which had to fall back to full LL.
+        """
+        return PredictionInfo(self._sll, self._fallbacks)
+
+    def parse_date(self, text, now=None, month_first=True, context=None, output="datetime"):
+        return self._parse_anything(text, "date", now=now, month_first=month_first, context=context,
+                                    output=output)
+
+    def parse_datetime(self, text, now=None, month_first=True, default_tz=None, context=None, output="datetime"):
+        return self._parse_anything(text, "datetime", now=now, month_first=month_first, default_tz=default_tz,
+                                    context=context, output=output)
+
+    def parse_timezone(self, text):
+        if (tz := self._tz.lookup_text(text)) is not None:
+            return tz
+        tz = self._parse_anything(text, "timezone")
+        self._tz.store_text(text, tz)
+        return tz
+
+    def try_parse_date(self, text, now=None, month_first=True, context=None, output="datetime"):
+        return self._try_parse(text, "date", now=now, month_first=month_first, context=context, output=output)
+
+    def try_parse_datetime(self, text, now=None, month_first=True, default_tz=None, context=None,
+                           output="datetime"):
+        return self._try_parse(text, "datetime", now=now, month_first=month_first, default_tz=default_tz,
+                               context=context, output=output)
+
+    def try_parse_timezone(self, text):
+        if isinstance(text, str) and (tz := self._tz.lookup_text(text)) is not None:
+            return tz
+        if (tz := self._try_parse(text, "timezone")) is not None:
+            self._tz.store_text(text, tz)
+        return tz
+
+    def parse_many(self, items, what="datetime", now=None, month_first=True, default_tz=None, context=None,
+                   output="datetime"):
+        """
+        Parses every string in `items` against one shared context and
+        returns the results in order.
+
+        `now`, `month_first` and `default_tz` are resolved only once and
+        identical inputs are parsed only once. Rows which can not be
+        parsed do not abort the batch; the `ValueError` describing the
+        problem is returned in their place instead.
+        """
+        if what not in ("date", "datetime", "timezone"):
+            raise ValueError(f"Invalid value for 'what' parameter: {what}")
+        _check_output(output)
+        now, month_first, default_tz = self._resolve(now, month_first, default_tz, context)
+        seen = {}
+        results = []
+        for text in items:
+            if not isinstance(text, str):
+                results.append(ValueError(f"Invalid {what} {text!r}, a string was expected"))
+                continue
+            try:
+                result = seen[text]
+            except KeyError:
+                result = seen[text] = self._parse_one(text, what, now, month_first, default_tz, output)
+            results.append(result)
+        return results
+
+    def parse_dates(self, items, now=None, month_first=True, context=None, output="datetime"):
+        return self.parse_many(items, "date", now=now, month_first=month_first, context=context, output=output)
+
+    def parse_datetimes(self, items, now=None, month_first=True, default_tz=None, context=None,
+                        output="datetime"):
+        return self.parse_many(items, "datetime", now=now, month_first=month_first, default_tz=default_tz,
+                               context=context, output=output)
+
+    def _parse_one(self, text, what, now, month_first, default_tz, output="datetime"):
+        try:
+            return self._parse_resolved(text, what, now, month_first, default_tz, output=output)
+        except ValueError as e:
+            return e
+
+    def _resolve(self, now, month_first, default_tz, context):
+        # default_tz names are resolved with the timezone backend of the
+        # session
+        if context is None and isinstance(default_tz, str):
+            default_tz = self.parse_timezone(default_tz)
+        return _resolve(now, month_first, default_tz, context)
+
+    def _reset(self, text):
+        self._lexer.inputStream = InputStream(text)
+        self._token_stream.setTokenSource(self._lexer)
+        self._parser.setTokenStream(self._token_stream)
+        self._error_listener.reset()
+
+    def _parse_anything(self, text, what, now=None, month_first=True, default_tz=None, context=None,
+                        output="datetime"):
+        _check_output(output)
+        now, month_first, default_tz = self._resolve(now, month_first, default_tz, context)
+        return self._parse_resolved(text, what, now, month_first, default_tz, output=output)
+
+    def _try_parse(self, text, what, now=None, month_first=True, default_tz=None, context=None,
+                   output="datetime"):
+        _check_output(output)
+        if not isinstance(text, str) or not could_match(text, what):
+            return None
+        now, month_first, default_tz = self._resolve(now, month_first, default_tz, context)
+        try:
+            return self._parse_resolved(text, what, now, month_first, default_tz, bail=True, output=output)
+        except ValueError:
+            return None
+
+    def _parse_resolved(self, text, what, now, month_first, default_tz, bail=False, output="datetime"):
+        if instrument.hooks and instrument.enabled():
+            return self._parse_instrumented(text, what, now, month_first, default_tz, bail, output)
+        if bail:
+            plan = self.compile(text, what, month_first, bail=True)
+        else:
+            plan = self.compile(text, what, month_first)
+        return self._visitor.evaluate(plan, now, default_tz, output)
+
+    def _parse_instrumented(self, text, what, now, month_first, default_tz, bail=False, output="datetime"):
+        event = instrument.ParseEvent(text, what)
+        visitor = self._visitor
+        start = perf_counter()
+        try:
+            plan = self.compile(text, what, month_first, event=event, bail=bail)
+            evaluate_start = perf_counter()
+            visitor._event = event
+            result = visitor.evaluate(plan, now, default_tz, output)
+            event.evaluate = perf_counter() - evaluate_start
+            return result
+        except ValueError as e:
+            event.error = str(e)
+            raise
+        finally:
+            visitor._event = None
+            event.total = perf_counter() - start
+            instrument.emit(event)
+
+    def evaluate(self, plan, now=None, default_tz=None, context=None, output="datetime"):
+        """
+        Evaluates a plan returned by `compile` against the given reference
+        time and default timezone.
+        """
+        _check_output(output)
+        now, _, default_tz = self._resolve(now, None, default_tz, context)
+        return self._visitor.evaluate(plan, now, default_tz, output)
+
+    def compile(self, text, what, month_first=True, event=None, bail=False):
+        """
+        Returns the plan for the given text, which can then be
+        evaluated against any `now` and `default_tz` values.
+
+        When an `instrument.ParseEvent` is given, it is filled with the
+        details of the compilation. With `bail`, lexing and parsing stop
+        at the first error and the `ValueError` raised does not describe
+        it.
+        """
+        lower = text.lower()
+        if self._fast_path:
+            if (plan := compile_fast(self._visitor, lower, what, month_first)) is not None:
+                if event is not None:
+                    event.source = "fast"
+                return plan
+        cache = self._cache
+        if cache is not None:
+            key = (lower, what, month_first, self._tz.name)
+            if (plan := cache.get(key)) is not None:
+                if event is not None:
+                    event.source = "cache"
+                return plan
+        plan = self._compile(text, lower, what, month_first, event, bail)
+        if cache is not None:
+            cache.put(key, plan)
+        return plan
+
+    def _compile(self, text, lower, what, month_first, event=None, bail=False):
+        self._reset(lower)
+        parser = self._parser
+        error_listener = self._error_listener
+
+        if event is not None:
+            event.source = "grammar"
+            start = perf_counter()
+            self._token_stream.fill()
+            event.lex = perf_counter() - start
+            event.tokens = len(self._token_stream.tokens) - 1
+            start = perf_counter()
+
+        if what == "date":
+            entry = parser.friendlyDate
+        elif what == "datetime":
+            entry = parser.friendlyDateTime
+        elif what == "timezone":
+            entry = parser.friendlyTimezone
+        else:
+            raise ValueError(f"Invalid value for 'what' parameter: {what}")
+
+        if bail:
+            tree = self._parse_bail(entry, event, what, text)
+        elif self._two_stage:
+            tree = self._parse_two_stage(entry, event)
+        else:
+            tree = entry()
+
+        if event is not None:
+            event.parse = perf_counter() - start
+            event.full_context = error_listener.full_context
+            event.context_sensitivity = error_listener.context_sensitivity
+            event.rule = instrument.matched_rule(tree)
+
+        if error_listener.count > 0:
+            raise ValueError(f"Invalid {what} '{text}', {error_listener.first_error()}, partial result: {tree.toStringTree(recog=parser)}")
+
+        visitor = self._visitor
+        visitor.set_month_first(month_first)
+        if event is None:
+            return visitor.compile(tree)
+        start = perf_counter()
+        plan = visitor.compile(tree)
+        event.visit = perf_counter() - start
+        return plan
+
+    def _parse_bail(self, entry, event, what, text):
+        lexer = self._lexer
+        parser = self._parser
+        listeners = lexer._listeners
+        lexer._listeners = [_bail_lexer_listener]
+        try:
+            if self._two_stage:
+                return self._parse_two_stage(entry, event, bail=True)
+            parser._errHandler = self._bail_strategy
+            return entry()
+        except ParseCancellationException:
+            raise ValueError(f"Invalid {what} '{text}'") from None
+        finally:
+            lexer._listeners = listeners
+            parser._errHandler = self._default_strategy
+
+    def _parse_two_stage(self, entry, event, bail=False):
+        parser = self._parser
+        interp = parser._interp
+        interp.predictionMode = PredictionMode.SLL
+        parser._errHandler = self._bail_strategy
+        try:
+            tree = entry()
+            self._sll += 1
+            return tree
+        except ParseCancellationException:
+            pass
+        finally:
+            interp.predictionMode = PredictionMode.LL
+            parser._errHandler = self._default_strategy
+
+        # SLL failed, the input may still be valid for full LL
+        self._fallbacks += 1
+        if event is not None:
+            event.fallback = True
+        self._token_stream.seek(0)
+        parser.setTokenStream(self._token_stream)
+        self._error_listener.reset()
+        if bail:
+            parser._errHandler = self._bail_strategy
+        return entry()
+
+_local = threading.local()
+
+def _default_parser():
+    try:
+        parser = _local.parser
+    except AttributeError:
+        parser = _local.parser = DateParser()
+        return parser
+    if parser._tz is not tz_cache.default_backend():
+        # the default backend was changed
+        parser = _local.parser = DateParser()
+    return parser
+
+def _parse_anything(text, what, now=None, month_first=True, default_tz=None, context=None, output="datetime"):
+    return _default_parser()._parse_anything(text, what, now=now, month_first=month_first, default_tz=default_tz,
+                                             context=context, output=output)
+
+def parse_date(text, now=None, month_first=True, context=None, output="datetime"):
+    return _parse_anything(text, "date", now=now, month_first=month_first, context=context, output=output)
+
+def parse_datetime(text, now=None, month_first=True, default_tz=None, context=None, output="datetime"):
+    return _parse_anything(text, "datetime", now=now, month_first=month_first, default_tz=default_tz,
+                           context=context, output=output)
 
 def parse_timezone(text):
-    return _parse_anything(text, "timezone")
+    if (tz := tz_cache.default_backend().lookup_text(text)) is not None:
+        return tz
+    return _default_parser().parse_timezone(text)
+
+def _try_parse(text, what, now=None, month_first=True, default_tz=None, context=None, output="datetime"):
+    return _default_parser()._try_parse(text, what, now=now, month_first=month_first, default_tz=default_tz,
+                                        context=context, output=output)
+
+def try_parse_date(text, now=None, month_first=True, context=None, output="datetime"):
+    return _try_parse(text, "date", now=now, month_first=month_first, context=context, output=output)
+
+def try_parse_datetime(text, now=None, month_first=True, default_tz=None, context=None, output="datetime"):
+    return _try_parse(text, "datetime", now=now, month_first=month_first, default_tz=default_tz,
+                      context=context, output=output)
+
+def try_parse_timezone(text):
+    return _default_parser().try_parse_timezone(text)
+
+def parse_many(items, what="datetime", now=None, month_first=True, default_tz=None,
+               workers=None, chunksize=1000, context=None, output="datetime"):
+    if workers is not None:
+        from friendlydateparser.parallel import parse_many as parse_many_parallel
+        return parse_many_parallel(items, what, now=now, month_first=month_first, default_tz=default_tz,
+                                   workers=workers, chunksize=chunksize, context=context, output=output)
+    return _default_parser().parse_many(items, what, now=now, month_first=month_first, default_tz=default_tz,
+                                        context=context, output=output)
+
+def parse_dates(items, now=None, month_first=True, context=None, output="datetime"):
+    return parse_many(items, "date", now=now, month_first=month_first, context=context, output=output)
+
+def parse_datetimes(items, now=None, month_first=True, default_tz=None, context=None, output="datetime"):
+    return parse_many(items, "datetime", now=now, month_first=month_first, default_tz=default_tz,
+                      context=context, output=output)
+
+def find_dates(text, what="datetime", now=None, month_first=True, default_tz=None, context=None):
+    """
+    Yields a `(start, end, value)` tuple for every date expression found
+    in `text` (see `friendlydateparser.extract`).
+    """
+    from friendlydateparser.extract import find_dates
+    return find_dates(text, what, now=now, month_first=month_first, default_tz=default_tz, context=context)
+
+WarmupInfo = namedtuple('WarmupInfo', ['inputs', 'lexer_states', 'parser_states'])
+
+def warmup(corpus=None):
+    """
+    Loads the grammar and runs `corpus` (by default a built-in one which
+    covers the whole grammar) through the three entry rules, building
+    the lexer and parser DFA states that ANTLR otherwise computes
+    lazily while serving the first requests.
+
+    The DFAs are shared by all the parsers of the process, so calling it
+    before forking worker processes lets them inherit the warmed states
+    copy-on-write. Returns a `WarmupInfo` with the number of inputs run
+    and of DFA states built.
+    """
+    if corpus is None:
+        from friendlydateparser.corpus import warmup_corpus as corpus
+    parser = DateParser(cache=None, fast_path=False)
+    lexer_dfa = parser._lexer._interp.decisionToDFA
+    parser_dfa = parser._parser._interp.decisionToDFA
+    lexer_states = _dfa_states(lexer_dfa)
+    parser_states = _dfa_states(parser_dfa)
+    inputs = 0
+    for text in corpus:
+        for what in ("date", "datetime", "timezone"):
+            try:
+                parser.compile(text, what)
+            except ValueError:
+                pass
+        inputs += 1
+    return WarmupInfo(inputs,
+                      _dfa_states(lexer_dfa) - lexer_states,
+                      _dfa_states(parser_dfa) - parser_states)
+
+def _dfa_states(decision_to_dfa):
+    return sum(len(dfa._states) for dfa in decision_to_dfa)
+
+class _ErrorListener:
+    # implements the antlr4 ErrorListener interface without inheriting
+    # from it so that the runtime does not need to be loaded on import
 
-class _ErrorListener(ErrorListener):
     def __init__(self):
+        self.reset()
+
+    def reset(self):
         self.errors = []
         self.count = 0
+        self.full_context = 0
+        self.context_sensitivity = 0
 
     def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
         self.errors.append(f"Syntax error at line {line}, column {column}: {msg}")
         self.count += 1
 
+    def reportAttemptingFullContext(self, recognizer, dfa, startIndex, stopIndex, conflictingAlts, configs):
+        self.full_context += 1
+
+    def reportContextSensitivity(self, recognizer, dfa, startIndex, stopIndex, prediction, configs):
+        self.context_sensitivity += 1
+
+    def reportAmbiguity(self, recognizer, dfa, startIndex, stopIndex, exact, ambigAlts, configs):
+        pass
+
     def first_error(self):
         if len(self.errors) > 0:
             return self.errors[0]
         return None
+
+class _BailLexerListener:
+    # stops lexing at the first unrecognized character
+
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        raise ParseCancellationException(msg)
+
+_bail_lexer_listener = _BailLexerListener()
+
+if os.environ.get("FRIENDLYDATEPARSER_TRACE", "0") == "1":
+    instrument.add_hook(instrument.logging_hook)
@@ -0,0 +1,142 @@
+"""
+Command line tool converting dates line by line.
+
+    python -m friendlydateparser [options] [file ...]
+
+Every input line (from the given files or stdin) is parsed and the
+result written as a line to stdout. Input is processed in batches so
+memory usage is constant regardless of the input size.
+"""
+
+import argparse
+import mmap
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from friendlydateparser import DateParser, ParseContext
+
+_epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_microsecond = timedelta(microseconds=1)
+
+def main(argv=None):
+    args = _parse_args(argv)
+
+    # all the lines share the same reference time
+    now = datetime.now() if args.now is None else args.now
+    context = ParseContext(now, args.month_first, args.default_tz)
+    format = _formatters[args.format]
+
+    if args.jobs > 1:
+        from friendlydateparser.parallel import make_executor, parse_many
+        executor = make_executor(args.jobs)
+        def parse(batch):
+            return parse_many(batch, args.kind, chunksize=args.chunksize, executor=executor, context=context)
+    else:
+        executor = None
+        parser = DateParser()
+        def parse(batch):
+            return parser.parse_many(batch, args.kind, context=context)
+
+    out = sys.stdout.buffer
+    lines = errors = 0
+    start = time.perf_counter()
+    try:
+        for batch in _batches(_read_lines(args.files), args.batch_size):
+            results = parse(batch)
+            chunk = []
+            for result in results:
+                if isinstance(result, ValueError):
+                    errors += 1
+                    message = str(result).replace("\t", " ")
+                    chunk.append(f"\t{message}\n" if args.error_column else "\n")
+                else:
+                    chunk.append(f"{format(result)}\t\n" if args.error_column else f"{format(result)}\n")
+            out.write("".join(chunk).encode())
+            lines += len(batch)
+        out.flush()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if args.stats:
+        elapsed = time.perf_counter() - start
+        rate = lines / elapsed if elapsed > 0 else 0
+        print(f"{lines} lines, {errors} errors in {elapsed:.3f}s ({rate:.0f} lines/s)", file=sys.stderr)
+    return 1 if errors and args.strict else 0
+
+def _parse_args(argv):
+    p = argparse.ArgumentParser(prog="python -m friendlydateparser",
+                                description="Parse dates and times, one per line.")
+    p.add_argument("files", nargs="*", help="input files, stdin when none is given")
+    p.add_argument("--kind", choices=("date", "datetime", "timezone"), default="datetime")
+    p.add_argument("--now", help="reference date and time for relative expressions")
+    p.add_argument("--month-first", choices=("true", "false", "locale"), default="true",
+                   help="whether numeric dates put the month first")
+    p.add_argument("--default-tz", help="timezone used when the text does not include one")
+    p.add_argument("--format", choices=sorted(_formatters), default="iso",
+                   help="output format, epoch values are seconds and naive datetimes are taken as UTC")
+    p.add_argument("--error-column", action="store_true",
+                   help="add a tab separated column with the error message")
+    p.add_argument("--strict", action="store_true", help="exit with status 1 if any line fails")
+    p.add_argument("--jobs", "-j", type=int, default=1, help="number of worker processes")
+    p.add_argument("--batch-size", type=int, default=10000, help="lines parsed per batch")
+    p.add_argument("--chunksize", type=int, default=1000, help="lines sent to a worker at once")
+    p.add_argument("--stats", action="store_true", help="print a throughput summary to stderr")
+    args = p.parse_args(argv)
+    args.month_first = {"true": True, "false": False}.get(args.month_first, args.month_first)
+    return args
+
+def _read_lines(files):
+    if not files:
+        for line in sys.stdin.buffer:
+            yield _decode(line)
+        return
+    for name in files:
+        with open(name, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                continue
+            with mm:
+                for line in iter(mm.readline, b""):
+                    yield _decode(line)
+
+def _decode(line):
+    return line.decode("utf-8", errors="replace").rstrip("\r\n")
+
+def _batches(lines, size):
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _format_iso(v):
+    if isinstance(v, date):
+        return v.isoformat()
+    return str(v)
+
+def _format_epoch(v):
+    if isinstance(v, datetime):
+        if v.tzinfo is None:
+            v = v.replace(tzinfo=timezone.utc)
+        delta = v - _epoch
+    elif isinstance(v, date):
+        delta = v - _epoch.date()
+    else:
+        return str(v)
+    us = delta // _microsecond
+    seconds, fraction = divmod(abs(us), 1000000)
+    sign = "-" if us < 0 else ""
+    if fraction:
+        return f"{sign}{seconds}.{fraction:06d}".rstrip("0")
+    return f"{sign}{seconds}"
+
+_formatters = { "iso": _format_iso, "epoch": _format_epoch }
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+asyncio API.
+
+Parsing is CPU-bound and a complex expression can take milliseconds,
+so calling the parser from a coroutine would block the event loop.
+Here it runs on an executor instead: requests arriving within a short
+window which share the same `what`, `now`, `month_first` and
+`default_tz` values are gathered into a single bulk parse, and a
+semaphore limits the number of bulk parses running at once. Requests
+with a `ParseContext` without a fixed `now` are batched together and
+its clock is read once per batch.
+"""
+
+import asyncio
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from friendlydateparser import parse_many as _parse_many, _check_output, ParseContext
+from friendlydateparser import tz as tz_cache
+
+class AsyncParser:
+    """
+    Batches the requests of the coroutines running on one event loop
+    and parses them on `executor`.
+
+    By default the executor is a thread pool with `max_concurrency`
+    workers. As parsing holds the GIL, the event loop still competes
+    with the worker threads for it; a process pool (such as the one
+    returned by `friendlydateparser.parallel.make_executor`) keeps it
+    out of the way entirely.
+
+    Requests are gathered for `window` seconds or until `max_batch` of
+    them are pending, whatever happens first.
+    """
+
+    def __init__(self, executor=None, max_concurrency=4, window=0.002, max_batch=1000):
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                          thread_name_prefix="friendlydateparser")
+            self._owns_executor = True
+        else:
+            self._owns_executor = False
+        self._executor = executor
+        self._process = isinstance(executor, ProcessPoolExecutor)
+        # created on first use, in the running loop
+        self._semaphore = None
+        self._loop = None
+        self._max_concurrency = max_concurrency
+        self._window = window
+        self._max_batch = max_batch
+        self._pending = {}
+        self._tasks = set()
+
+    async def parse_date(self, text, now=None, month_first=True, context=None, output="datetime"):
+        return await self._submit(text, "date", now, month_first, None, context, output)
+
+    async def parse_datetime(self, text, now=None, month_first=True, default_tz=None, context=None,
+                             output="datetime"):
+        return await self._submit(text, "datetime", now, month_first, default_tz, context, output)
+
+    async def parse_timezone(self, text):
+        return await self._submit(text, "timezone", None, True, None, None, "datetime")
+
+    async def parse_many(self, items, what="datetime", now=None, month_first=True, default_tz=None,
+                         context=None, output="datetime"):
+        """
+        Same as `friendlydateparser.parse_many`, split in chunks of
+        `max_batch` items.
+        """
+        if what not in ("date", "datetime", "timezone"):
+            raise ValueError(f"Invalid value for 'what' parameter: {what}")
+        args = _read_clock(_args(what, now, month_first, default_tz, context, output))
+        items = list(items)
+        size = self._max_batch
+        chunks = await asyncio.gather(*(self._run(items[i:i + size], args)
+                                        for i in range(0, len(items), size)))
+        return [result for chunk in chunks for result in chunk]
+
+    def close(self):
+        """
+        Shuts down the executor when it was created by this object.
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def _submit(self, text, what, now, month_first, default_tz, context, output):
+        args = _args(what, now, month_first, default_tz, context, output)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        try:
+            batch = self._pending[args]
+        except KeyError:
+            batch = self._pending[args] = []
+            loop.call_later(self._window, self._flush, args)
+        batch.append((text, future))
+        if len(batch) >= self._max_batch:
+            self._flush(args)
+        result = await future
+        if isinstance(result, ValueError):
+            raise result
+        return result
+
+    def _flush(self, args):
+        if batch := self._pending.pop(args, None):
+            task = asyncio.ensure_future(self._run_batch(batch, _read_clock(args)))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch, args):
+        try:
+            results = await self._run([text for text, _ in batch], args)
+        except BaseException as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _run(self, items, args):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._loop = loop
+        async with self._semaphore:
+            if self._process:
+                from friendlydateparser.parallel import _parse_chunk, _decode
+                backend = tz_cache.default_backend()
+                encoded = await loop.run_in_executor(self._executor, _parse_chunk, (items, *args, backend.name))
+                if args[-1] != "datetime":
+                    return encoded
+                return [_decode(v, backend) for v in encoded]
+            return await loop.run_in_executor(self._executor, _parse_batch, items, *args)
+
+def _args(what, now, month_first, default_tz, context, output):
+    # batching key: a context without a fixed now stays in place of now
+    # until the batch is flushed, other values are resolved by the
+    # workers
+    _check_output(output)
+    if context is not None:
+        if context.now is None:
+            return (what, context, context.month_first, context.default_tz, output)
+        now, month_first, default_tz = context.resolve()
+    return (what, now, month_first, default_tz, output)
+
+def _read_clock(args):
+    what, now, month_first, default_tz, output = args
+    if isinstance(now, ParseContext):
+        now = now.clock()
+    return (what, now, month_first, default_tz, output)
+
+def _parse_batch(items, what, now, month_first, default_tz, output):
+    # runs on a worker thread, using its own default parser
+    return _parse_many(items, what, now=now, month_first=month_first, default_tz=default_tz, output=output)
+
+# the module-level coroutines use one AsyncParser per event loop, all
+# of them sharing the same thread pool
+
+_parsers = weakref.WeakKeyDictionary()
+_executor = None
+
+def _default_parser():
+    global _executor
+    loop = asyncio.get_running_loop()
+    try:
+        return _parsers[loop]
+    except KeyError:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="friendlydateparser")
+        parser = _parsers[loop] = AsyncParser(_executor)
+        return parser
+
+async def parse_date(text, now=None, month_first=True, context=None, output="datetime"):
+    return await _default_parser().parse_date(text, now=now, month_first=month_first, context=context,
+                                              output=output)
+
+async def parse_datetime(text, now=None, month_first=True, default_tz=None, context=None, output="datetime"):
+    return await _default_parser().parse_datetime(text, now=now, month_first=month_first,
+                                                  default_tz=default_tz, context=context, output=output)
+
+async def parse_timezone(text):
+    return await _default_parser().parse_timezone(text)
+
+async def parse_many(items, what="datetime", now=None, month_first=True, default_tz=None, context=None,
+                     output="datetime"):
+    return await _default_parser().parse_many(items, what, now=now, month_first=month_first,
+                                              default_tz=default_tz, context=context, output=output)
@@ -1,16 +1,11 @@
 from .FriendlyDateVisitor import FriendlyDateVisitor
 from .FriendlyDateParser import FriendlyDateParser
-import functools
 from datetime import datetime, time, date, timedelta
-from dateutil.relativedelta import relativedelta
-import pytz
-from calendar import monthrange
-import logging
-import os
+from time import perf_counter
 
-from friendlydateparser.tz_abbreviations import tz_abbreviations
-
-traceme = os.environ.get("FRIENDLYDATEPARSER_TRACE", "0") == "1"
+from friendlydateparser.plan import PlanNode, _plan
+from friendlydateparser import tz as tz_cache
+from friendlydateparser import ordinal
 
 ordinals = [ 'first', 'second', 'third', 'fourth', 'fifth', 'sixth',
              'seventh', 'eighth', 'ninth', 'tenth', 'eleventh', 'twelfth',
@@ -39,36 +34,50 @@ ordinals = [ 'first', 'second', 'third', 'fourth', 'fifth', 'sixth',
              'ninety-ninth' ]
 ordinal2number = {ordinal: index + 1 for index, ordinal in enumerate(ordinals)}
 
+_epoch_ordinal = date(1970, 1, 1).toordinal()
+_day_us = 86_400_000_000
+_minute = timedelta(minutes=1)
+_microsecond = timedelta(microseconds=1)
+
 weekdays = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
-def tz_abbreviation2pytz(abv):
-    offset = tz_abbreviations[abv.upper()]
-    return pytz.FixedOffset(offset)
-
-def trace(func):
-    if traceme:
-        @functools.wraps(func)
-        def wrapper(self, ctx, *args, **kwargs):
-            tree = ctx.toStringTree(recog=ctx.parser) if ctx else "None"
-            logging.debug(f">>> method call {func.__name__}({tree})...")
-            try:
-                result = func(self, ctx, *args, **kwargs)
-                logging.debug(f"<<<  method call {func.__name__}({tree}) ---> {result}")
-                return result
-            except Exception as e:
-                logging.exception(f"<<<  method call {func.__name__}({tree}) EXCEPTION!")
-                raise
-        return wrapper
-    else:
-        return func
+# months added to the current one by "last month", "this month" and "next month"
+_month_shifts = {"last": -1, "this": 0, "next": 1}
+
+def _format_offset(offset):
+    # same as the offset in datetime.isoformat
+    sign = "-" if offset.days < 0 else "+"
+    seconds = abs(offset) // timedelta(seconds=1)
+    microseconds = abs(offset).microseconds
+    text = f"{sign}{seconds // 3600:02d}:{seconds // 60 % 60:02d}"
+    if seconds % 60 or microseconds:
+        text += f":{seconds % 60:02d}"
+        if microseconds:
+            text += f".{microseconds:06d}"
+    return text
 
 class FriendlyDateVisitorPy(FriendlyDateVisitor):
-    def __init__(self, now, month_first, default_tz):
+    def __init__(self, now=None, month_first=True, default_tz=None, context=None, tz_backend=None):
+        self._tz = tz_cache.get_backend(tz_backend)
+        self.reset(now, month_first, default_tz, context)
+
+    def reset(self, now=None, month_first=True, default_tz=None, context=None):
+        """
+        Sets the values used by `visit`, taken from `context` (a
+        `ParseContext`) when given.
+        """
+        if context is not None:
+            now, month_first, default_tz = context.resolve()
         if not isinstance(now, datetime):
             raise ValueError(f"now must be a datetime object instead of one with type {type(now).__name__}")
         self._now = now
-        self._month_first = month_first
         self._default_tz = default_tz
+        self._output = "datetime"
+        self._event = None
+        self.set_month_first(month_first)
+
+    def set_month_first(self, month_first):
+        self._month_first = month_first
         self._left_slot = 'month' if month_first else 'day'
         self._right_slot = 'day' if month_first else 'month'
 
@@ -81,272 +90,242 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
             return aggregate + nextResult
         return nextResult
 
-    # @trace
-    # def visitChildren(self, ctx):
-    #    return super().visitChildren(ctx)
-
-    @trace
     def visit(self, ctx):
+        return self._evaluate(self.compile(ctx))
+
+    def compile(self, ctx):
+        """
+        Converts the parse tree into a plan which does not depend on
+        `now` or `default_tz` and can be evaluated repeatedly.
+        """
         return super().visit(ctx)
 
-    @trace
+    def compile_rule(self, ctx, name):
+        """
+        Same as `compile` for a parse tree of an inner rule which stores
+        its result in the `name` field (`dateTime` and `datetime`,
+        `dateAlone` and `date`).
+        """
+        return ctx.accept(self)[name]
+
+    def evaluate(self, plan, now, default_tz, output="datetime"):
+        """
+        Evaluates `plan`, returning the result in the `output`
+        representation (`"datetime"`, `"epoch_us"`, `"ordinal"`, `"iso"`
+        or `"tuple"`).
+        """
+        if not isinstance(now, datetime):
+            raise ValueError(f"now must be a datetime object instead of one with type {type(now).__name__}")
+        self._now = now
+        self._default_tz = default_tz
+        self._output = output
+        return self._evaluate(plan)
+
+    def _evaluate(self, plan):
+        if not isinstance(plan, PlanNode):
+            return plan
+        r = dict(plan.fields)
+        for key in ('date', 'datetime'):
+            if isinstance(v := r.get(key), PlanNode):
+                r[key] = self._evaluate(v)
+        return self._evaluators[plan.kind](self, r)
+
     def visitFriendlyDate(self, ctx:FriendlyDateParser.FriendlyDateContext):
         return self.visitChildren(ctx)['date']
 
-    @trace
     def visitFriendlyDateTime(self, ctx:FriendlyDateParser.FriendlyDateTimeContext):
         return self.visitChildren(ctx)['datetime']
 
-    @trace
     def visitFriendlyTimezone(self, ctx:FriendlyDateParser.FriendlyTimezoneContext):
         return self.visitChildren(ctx)['tz']
 
-    @trace
     def visitNow(self, ctx:FriendlyDateParser.NowContext):
-        return {'datetime': self._now}
+        return {'datetime': _plan('now', None)}
 
-    @trace
     def visitTime(self, ctx:FriendlyDateParser.TimeContext):
         return {'time': self._make_time(self.visitChildren(ctx))}
 
-    @trace
     def visitIso8601Time(self, ctx:FriendlyDateParser.Iso8601TimeContext):
         return {'time': self._make_time(self.visitChildren(ctx))}
 
-    @trace
     def visitIso8601Month(self, ctx:FriendlyDateParser.Iso8601MonthContext):
         return {'month': self.visitNumber2(ctx.number2())}
 
-    @trace
     def visitIso8601YearWeek(self, ctx:FriendlyDateParser.Iso8601YearWeekContext):
         return { 'week': self.visitNumber2(ctx.number2()) }
 
-    @trace
     def visitIso8601WeekDay(self, ctx:FriendlyDateParser.Iso8601WeekDayContext):
         return { 'weekday': self.visitNumber1(ctx.number1()) - 1 }
 
-    @trace
     def visitIso8601YearDay(self, ctx:FriendlyDateParser.Iso8601YearDayContext):
         return { 'day_position': self.visitNumber3(ctx.number3()) }
 
-    @trace
     def visitIso8601MonthDay(self, ctx:FriendlyDateParser.Iso8601MonthDayContext):
         return { 'day': self.visitNumber2(ctx.number2()) }
 
-    @trace
     def visitDateRelativeByDate(self, ctx:FriendlyDateParser.DateRelativeByDateContext):
-        return {'date': self._make_date_relative(self.visitChildren(ctx))}
+        return {'date': _plan('date_relative', self.visitChildren(ctx))}
 
-    @trace
     def visitDateAbsolute(self, ctx:FriendlyDateParser.DateAbsoluteContext):
-        return {'date': self._make_date_absolute(self.visitChildren(ctx))}
+        return {'date': _plan('date_absolute', self.visitChildren(ctx))}
 
-    @trace
     def visitDateAlone(self, ctx:FriendlyDateParser.DateAloneContext):
-        return {'date': self._make_date_alone(self.visitChildren(ctx))}
+        return {'date': _plan('date_alone', self.visitChildren(ctx))}
 
-
-    @trace
     def visitIso8601Date(self, ctx:FriendlyDateParser.Iso8601DateContext):
-        return {'date': self._make_date_absolute(self.visitChildren(ctx))}
+        return {'date': _plan('date_absolute', self.visitChildren(ctx))}
 
-    @trace
     def visitDateTime(self, ctx:FriendlyDateParser.FriendlyDateTimeContext):
-        return {'datetime': self._make_datetime(self.visitChildren(ctx))}
+        return {'datetime': _plan('datetime', self.visitChildren(ctx))}
 
-    @trace
     def visitTz(self, ctx:FriendlyDateParser.TzContext):
-        return {'tz': pytz.timezone(ctx.getText())}
-
-    @trace
-    def visitTzAbbreviation(self, ctx:FriendlyDateParser.TzAbbreviationContext):
-        return {'tz': tz_abbreviation2pytz(ctx.getText())}
+        return {'tz': self._tz.from_name(ctx.getText())}
 
-    @trace
     def visitTzOffset(self, ctx:FriendlyDateParser.TzOffsetContext):
         r = self.visitChildren(ctx)
         offset = r['hour']*60 + r.get('minute', 0)
         if ctx.DASH():
             offset = -offset
-        return {'tz': pytz.FixedOffset(offset)}
+        return {'tz': self._tz.from_offset(offset)}
 
-    @trace
     def visitTzZ(self, ctx:FriendlyDateParser.TzZContext):
-        return {'tz': pytz.UTC}
+        return {'tz': self._tz.from_offset(0)}
 
-    @trace
     def visitLastDay(self, ctx:FriendlyDateParser.LastDayContext):
         return {'day': -1 }
 
-    @trace
     def visitLastWeek(self, ctx:FriendlyDateParser.LastWeekContext):
         return {'week': -1 }
 
-    @trace
     def visitMidnight(self, ctx:FriendlyDateParser.MidnightContext):
         return {'hour': 0, 'minute': 0, 'second': 0, 'microsecond': 0}
 
-    @trace
     def visitNoon(self, ctx:FriendlyDateParser.NoonContext):
         return {'hour': 12, 'minute': 0, 'second': 0, 'microsecond': 0}
 
-    @trace
     def visitHour2(self, ctx:FriendlyDateParser.Hour2Context):
         return {'hour': self.visitNumber2(ctx.number2())}
 
-    @trace
     def visitHour12(self, ctx:FriendlyDateParser.Hour12Context):
         return {'hour': self.visitNumber12(ctx.number12())}
 
-    @trace
     def visitMinute2(self, ctx:FriendlyDateParser.Minute2Context):
         return {'minute': self.visitNumber2(ctx.number2())}
 
-    @trace
     def visitMinute12(self, ctx:FriendlyDateParser.Minute12Context):
         return {'minute': self.visitNumber12(ctx.number12())}
 
-    @trace
     def visitSecond2(self, ctx:FriendlyDateParser.Second2Context):
         a, b = self.visitFloat2(ctx.float2())
         return {'second': a, 'microsecond': b}
 
-    @trace
     def visitSecond12(self, ctx:FriendlyDateParser.Second12Context):
         a, b = self.visitFloat12(ctx.float12())
         return {'second': a, 'microsecond': b}
 
-    @trace
     def visitDateTimeDelta(self, ctx:FriendlyDateParser.DateTimeDeltaContext):
         return {'datetime_delta': self._make_datetime_delta(self.visitChildren(ctx))}
 
-    @trace
     def visitDateDelta(self, ctx:FriendlyDateParser.DateDeltaContext):
         return {'date_delta': self._make_datetime_delta(self.visitChildren(ctx))}
 
-    @trace
     def visitYearsDelta(self, ctx:FriendlyDateParser.YearsDeltaContext):
         return [{'years': self.visitZNumber(ctx.zNumber())}]
 
-    @trace
     def visitMonthsDelta(self, ctx:FriendlyDateParser.MonthsDeltaContext):
         return [{'months': self.visitZNumber(ctx.zNumber())}]
 
-    @trace
     def visitWeeksDelta(self, ctx:FriendlyDateParser.WeeksDeltaContext):
         return [{'weeks': self.visitZNumber(ctx.zNumber())}]
 
-    @trace
     def visitDaysDelta(self, ctx:FriendlyDateParser.DaysDeltaContext):
         return [{'days': self.visitZNumber(ctx.zNumber())}]
 
-    @trace
     def visitHoursDelta(self, ctx:FriendlyDateParser.HoursDeltaContext):
         return [{'hours': self.visitZNumber(ctx.zNumber())}]
 
-    @trace
     def visitMinutesDelta(self, ctx:FriendlyDateParser.MinutesDeltaContext):
         return [{'minutes': self.visitZNumber(ctx.zNumber())}]
 
-    @trace
     def visitSecondsDelta(self, ctx:FriendlyDateParser.SecondsDeltaContext):
         a, b = self.visitQNumber(ctx.qNumber())
         return [{'seconds': a, 'microseconds': b}]
 
-    @trace
     def visitAm(self, ctx:FriendlyDateParser.AmContext):
         return {'am': True}
 
-    @trace
     def visitPm(self, ctx:FriendlyDateParser.PmContext):
         return {'pm': True}
 
-    @trace
     def visitNumber12Left(self, ctx:FriendlyDateParser.Number12LeftContext):
         return {self._left_slot: self.visitNumber12(ctx.number12())}
 
-    @trace
     def visitNumber12Right(self, ctx:FriendlyDateParser.Number12RightContext):
         return {self._right_slot: self.visitNumber12(ctx.number12())}
 
-    @trace
+    def visitDateLongNumber(self, ctx:FriendlyDateParser.DateLongNumberContext):
+        txt = ctx.EIGHT_DIGIT_NUMBER().getText()
+        return {'year': int(txt[:4]), 'month': int(txt[4:6]), 'day': int(txt[6:])}
+
     def visitYear4(self, ctx:FriendlyDateParser.Year4Context):
         return {'year': self.visitNumber4(ctx.number4())}
 
-    @trace
     def visitMonthAsName(self, ctx:FriendlyDateParser.MonthAsNameContext):
         return {'month': ctx.value}
 
-    @trace
     def visitMonthAsNumber(self, ctx:FriendlyDateParser.MonthAsNumberContext):
         return {'month': self.visitNumber12(ctx.number12())}
 
-    @trace
     def visitWeekNumber(self, ctx:FriendlyDateParser.WeekNumberContext):
         return {'week': self.visitNumber12(ctx.number12())}
 
-    @trace
     def visitWeekDay(self, ctx:FriendlyDateParser.WeekDayContext):
         return { 'weekday': self.visitOneDigitNumber(ctx.oneDigitNumber()) }
 
-    @trace
     def visitDayAsOrdinal(self, ctx:FriendlyDateParser.DayAsOrdinalContext):
         return {'day': self.visitChildren(ctx)}
 
-    @trace
     def visitDayPositionOrdinal(self, ctx:FriendlyDateParser.DayPositionOrdinalContext):
         return {'day_position': self.visitChildren(ctx)}
 
-    @trace
     def visitDayPositionNumber(self, ctx:FriendlyDateParser.DayPositionNumberContext):
         return {'day_position': self.visitChildren(ctx)}
 
-    @trace
     def visitWeekDayPositionLast(self, ctx:FriendlyDateParser.WeekDayPositionLastContext):
         r = self.visitChildren(ctx)
         r['day_position'] = -1
         return r
 
-    @trace
     def visitOrdinalDigits(self, ctx:FriendlyDateParser.OrdinalDigitsContext):
         return int(ctx.ORDINAL_DIGITS().getText()[:-2])
 
-    @trace
     def visitWordOrdinal(self, ctx:FriendlyDateParser.WordOrdinalContext):
         if ctx.SECOND():
             return 2
         return ordinal2number[ctx.ORDINAL_WORDS().getText()]
 
-    @trace
     def visitDayAsNumber(self, ctx:FriendlyDateParser.DayAsNumberContext):
         return {'day': self.visitNumber12(ctx.number12())}
 
-    @trace
     def visitZNumber(self, ctx:FriendlyDateParser.ZNumberContext):
         v = self.visitNumber(ctx.number())
         return -v if ctx.DASH() else v
 
-    @trace
     def visitNumber1(self, ctx:FriendlyDateParser.Number1Context):
         return int(ctx.ONE_DIGIT_NUMBER().getText())
 
-    @trace
     def visitNumber2(self, ctx:FriendlyDateParser.Number2Context):
         return int(ctx.TWO_DIGIT_NUMBER().getText())
 
-    @trace
     def visitNumber3(self, ctx:FriendlyDateParser.Number3Context):
         return int(ctx.THREE_DIGIT_NUMBER().getText())
 
-    @trace
     def visitNumber4(self, ctx:FriendlyDateParser.Number4Context):
         return int(ctx.FOUR_DIGIT_NUMBER().getText())
 
-    @trace
     def visitNumber(self, ctx:FriendlyDateParser.NumberContext):
         return int(ctx.getText())
 
-    @trace
     def visitQNumber(self, ctx:FriendlyDateParser.QNumberContext):
         a, b = self.visitFloat(ctx.float_())
         if ctx.DASH():
@@ -359,113 +338,90 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
         b += "000000"
         return int(a), int(b[:6])
 
-    @trace
     def visitFloat2(self, ctx:FriendlyDateParser.Float2Context):
         return self._split_float(ctx.getText())
 
-    @trace
     def visitFloat12(self, ctx:FriendlyDateParser.Float12Context):
         return self._split_float(ctx.getText())
 
-    @trace
     def visitFloat(self, ctx:FriendlyDateParser.FloatContext):
         return self._split_float(ctx.getText())
 
-    @trace
     def visitBefore(self, ctx:FriendlyDateParser.BeforeContext):
         return {'delta_before': True}
 
-    @trace
     def visitAgo(self, ctx:FriendlyDateParser.AgoContext):
         return {'delta_before': True}
 
-    @trace
     def visitToday(self, ctx:FriendlyDateParser.TodayContext):
         return {'rule': 'today', 'delta': 0}
 
-    @trace
     def visitTomorrow(self, ctx:FriendlyDateParser.TomorrowContext):
         return {'rule': 'today', 'delta': 1}
 
-    @trace
     def visitYesterday(self, ctx:FriendlyDateParser.YesterdayContext):
         return {'rule': 'today', 'delta': -1}
 
-    @trace
     def visitTheDayAfterTomorrow(self, ctx:FriendlyDateParser.TheDayAfterTomorrowContext):
         return {'rule': 'today', 'delta': 2}
 
-    @trace
     def visitTheDayBeforeYesterday(self, ctx:FriendlyDateParser.TheDayBeforeYesterdayContext):
         return {'rule': 'today', 'delta': -2}
 
-    @trace
     def visitDateRelativeDay(self, ctx:FriendlyDateParser.DateRelativeDayContext):
         r = self.visitChildren(ctx)
         r['rule'] = 'day'
         return r
 
-    @trace
     def visitDateRelativeWeek(self, ctx:FriendlyDateParser.DateRelativeWeekContext):
         r = self.visitChildren(ctx)
         r['rule'] = 'week'
         return r
 
-    @trace
     def visitDateRelativeMonth(self, ctx:FriendlyDateParser.DateRelativeMonthContext):
         r = self.visitChildren(ctx)
         r['rule'] = 'month'
         return r
 
-    @trace
     def visitDateRelativeYearWithMonth(self, ctx:FriendlyDateParser.DateRelativeYearWithMonthContext):
         r = self.visitChildren(ctx)
         r['rule'] = 'year'
         return r
 
-    @trace
     def visitDateRelativeYearWithoutMonth(self, ctx:FriendlyDateParser.DateRelativeYearWithoutMonthContext):
         r = self.visitChildren(ctx)
         r['rule'] = 'year'
         return r
 
-    @trace
     def visitDateRelativeMonthWeek(self, ctx:FriendlyDateParser.DateRelativeMonthWeekContext):
         r = self.visitChildren(ctx)
         r['rule'] = 'month_week'
         return r
 
-    @trace
     def visitDateRelativeYearWeek(self, ctx:FriendlyDateParser.DateRelativeYearWeekContext):
         r = self.visitChildren(ctx)
         r['rule'] = 'year_week'
         return r
 
-    @trace
     def visitDateRelativeMonthDayPosition(self, ctx:FriendlyDateParser.DateRelativeMonthDayPositionContext):
         r = self.visitChildren(ctx)
         r['rule'] = 'month_day_position'
         return r
 
-    @trace
     def visitDateRelativeYearDayPosition(self, ctx:FriendlyDateParser.DateRelativeYearDayPositionContext):
         r = self.visitChildren(ctx)
         r['rule'] = 'year_day_position'
         return r
 
-    @trace
     def visitWeekDay(self, ctx:FriendlyDateParser.WeekDayContext):
         return {'weekday': ctx.value}
 
-    @trace
     def visitLastR(self, ctx:FriendlyDateParser.LastRContext):
         return {'modifier': 'last'}
 
-    @trace
     def visitNextR(self, ctx:FriendlyDateParser.NextRContext):
         return {'modifier': 'next'}
 
-    @trace
     def visitThisR(self, ctx:FriendlyDateParser.ThisRContext):
         return {'modifier': 'this'}
 
@@ -494,6 +450,9 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
 
         return time(hour, minute, second, microsecond)
 
+    def _make_now(self, r):
+        return self._now
+
     def _make_date_absolute(self, r):
         if r.get('week') is not None:
             return self._make_date_absolute_by_week(r)
@@ -518,7 +477,7 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
         elif month == 0 or month > 12:
             raise ValueError("Invalid date: month value out of range")
 
-        last_day = monthrange(year, month)[1]
+        last_day = ordinal.month_length(year, month)
         if day is None:
             day = 1
         elif day == -1:
@@ -543,63 +502,42 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
             raise ValueError("Invalid date: month value out of range")
         weekday = r.get('weekday', 0)
 
+        index = ordinal.calendar_index
         if week == -1:
-            week = 0
-            if month is None:
-                year += 1
-            elif month < 12:
-                month += 1
-            elif month == 12:
-                month = 1
-                year += 1
-
-        first_day = date(year, month or 1, 1)
-        first_weekday = first_day.weekday()
-        if first_weekday <= 3:
-            week -= 1
-
-        monday = first_day + timedelta(days=7*week-first_weekday)
-        wednesday = monday + timedelta(days=3)
-
-        if wednesday.year > year or \
-           (month is not None and wednesday.year == year and wednesday.month > month):
-            raise ValueError("Invalid date: week value out of range")
+            # the week before the first one of the next month or year
+            monday = index.week_one(year, (month or 12) + 1) - 7
+        else:
+            monday = index.week_one(year, month or 1) + 7*(week-1)
+            # the week must start (on its Wednesday) inside the month or year
+            if monday + 3 >= index.month_start(year, (month or 12) + 1):
+                raise ValueError("Invalid date: week value out of range")
 
-        return monday + timedelta(days=weekday)
+        return date.fromordinal(monday + weekday)
 
     def _make_date_absolute_by_day_position(self, r):
         day_position = r['day_position']
         weekday = r.get('weekday', None)
         year = r.get('year', self._now.year)
         month = r.get('month')
-        month1, year1 = month, year # For checking if the day is out of range later
 
         if month is not None and (month == 0 or month > 12):
             raise ValueError("Invalid date: month value out of range")
 
+        start, end = ordinal.calendar_index.span(year, month)
         if day_position == -1:
-            if month is None:
-                year += 1
-            elif month < 12:
-                month += 1
-            else:
-                month = 1
-                year += 1
-            day_position = 0
-
-        first_day = date(year, month or 1, 1)
+            # counted back from the next month or year
+            d, day_position = end, 0
+        else:
+            d = start
         if weekday is None:
-            d = first_day + timedelta(days=day_position-1)
+            d += day_position - 1
         else:
-            first_weekday = first_day.weekday()
-            off = weekday - first_weekday
-            if off < 0:
-                off += 7
-            d = first_day + timedelta(days=off + 7*(day_position-1))
+            # ordinal 1 is a Monday
+            d += (weekday - (d - 1) % 7) % 7 + 7*(day_position-1)
 
-        if d.year != year1 or (month1 is not None and d.month != month1):
+        if not start <= d < end:
             raise ValueError("Invalid date: day ordinal out of range")
-        return d
+        return date.fromordinal(d)
 
     def _make_datetime_delta(self, l):
         r = { 'years': 0, 'months': 0, 'weeks': 0, 'days': 0,
@@ -607,17 +545,17 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
         for d in l:
             for k, v in d.items():
                 r[k] += v
-        return relativedelta(**r)
+        return ordinal.delta(**r)
 
     def _make_date_alone(self, r):
         d = r.get('date', self._now.date())
-        if (delta := r.get('date_delta')) is None:
-            return d
-
-        if r.get('delta_before', False):
-            d -= delta
-        else:
-            d += delta
+        if (delta := r.get('date_delta')) is not None:
+            if r.get('delta_before', False):
+                d = ordinal.subtract(d, delta)
+            else:
+                d = ordinal.add(d, delta)
+        if self._output != "datetime":
+            return self._format_date(d)
         return d
 
     def _make_datetime(self, r):
@@ -628,16 +566,62 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
             d = datetime.combine(d, t)
         if (delta := r.get('datetime_delta')) is not None:
             if r.get('delta_before', False):
-                d -= delta
+                d = ordinal.subtract(d, delta)
             else:
-                d += delta
+                d = ordinal.add(d, delta)
 
         if (tz := r.get('tz')) is not None:
             assert d.tzinfo is None, "Internal error: datetime already has a timezone"
-            d = tz.localize(d)
         elif d.tzinfo is None:
-             if (tz := self._default_tz) is not None:
-                 d = tz.localize(d)
+            tz = self._default_tz
+        if self._output != "datetime":
+            return self._format_datetime(d, tz)
+        if tz is not None:
+            d = self._localize(tz, d)
+        return d
+
+    def _format_date(self, d):
+        output = self._output
+        if output == "ordinal":
+            return d.toordinal()
+        if output == "epoch_us":
+            return (d.toordinal() - _epoch_ordinal) * _day_us
+        if output == "iso":
+            return d.isoformat()
+        return (d.year, d.month, d.day)
+
+    def _format_datetime(self, d, tz):
+        # builds the output from the naive datetime and its offset,
+        # without creating the localized datetime
+        output = self._output
+        if output == "ordinal":
+            return d.toordinal()
+        if d.tzinfo is not None:
+            offset = d.utcoffset()
+            d = d.replace(tzinfo=None)
+        elif tz is None:
+            offset = None
+        elif (offset := tz.utcoffset(None)) is None:
+            offset = self._localize(tz, d).utcoffset()
+        if output == "epoch_us":
+            us = (((d.toordinal() - _epoch_ordinal) * 24 + d.hour) * 60 + d.minute) * 60 + d.second
+            us = us * 1_000_000 + d.microsecond
+            if offset is not None:
+                us -= offset // _microsecond
+            return us
+        if output == "iso":
+            if offset is None:
+                return d.isoformat()
+            return d.isoformat() + _format_offset(offset)
+        return (d.year, d.month, d.day, d.hour, d.minute, d.second, d.microsecond,
+                None if offset is None else offset // _minute)
+
+    def _localize(self, tz, d):
+        if (event := self._event) is None:
+            return tz_cache.localize(tz, d)
+        start = perf_counter()
+        d = tz_cache.localize(tz, d)
+        event.tz += perf_counter() - start
         return d
 
     def _make_date_relative(self, r):
@@ -664,7 +648,7 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
         raise ValueError(f"Internal error: Invalid rule: {rule}")
 
     def _make_date_relative_day_delta(self, r, now, delta):
-        return now + relativedelta(days=delta)
+        return ordinal.shift_days(now, delta)
 
     def _make_date_relative_day(self, r, now):
         weekday = r['weekday']
@@ -674,26 +658,26 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
         if modifier == 'next':
             if delta < 1:
                 delta += 7
-            return now + relativedelta(days=delta)
+            return ordinal.shift_days(now, delta)
         if modifier == 'last':
             if delta > 0:
                 delta -= 7
-            return now + relativedelta(days=delta)
+            return ordinal.shift_days(now, delta)
         return self._this_weekday(now, weekday)
 
     def _make_date_relative_week(self, r, now):
         date = self._this_weekday(now, r.get('weekday', 0))
         if r['modifier'] == 'last':
-            return date - relativedelta(days=7)
+            return ordinal.shift_days(date, -7)
         if r['modifier'] == 'next':
-            return date + relativedelta(days=7)
+            return ordinal.shift_days(date, 7)
         return date
 
         today = now.weekday()
         delta = weekday - today
         if delta < 1:
             delta += 7
-        return now + relativedelta(days=delta)
+        return ordinal.shift_days(now, delta)
 
     def _make_date_relative_month(self, r, now):
         year = now.year
@@ -702,9 +686,9 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
         if month is None:
             d = date(year, now.month, 1)
             if r['modifier'] == 'last':
-                d = d - relativedelta(months=1)
+                d = ordinal.shift_months(d, -1)
             elif r['modifier'] == 'next':
-                d = d + relativedelta(months=1)
+                d = ordinal.shift_months(d, 1)
 
             year = d.year
             month = d.month
@@ -716,7 +700,7 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
                 if month <= now.month:
                     year += 1
 
-        last_day = monthrange(year, month)[1]
+        last_day = ordinal.month_length(year, month)
         day = r.get('day', 1)
         if day == -1:
             day = last_day
@@ -734,7 +718,7 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
         day = r.get('day', 1)
         month = r.get('month', 12 if day == -1 else 1)
 
-        last_day = monthrange(year, month)[1]
+        last_day = ordinal.month_length(year, month)
         if day == -1:
             day = last_day
 
@@ -742,13 +726,7 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
 
     def _make_date_relative_month_week(self, r, now):
         if (month := r.get('month')) is None:
-            d = date(now.year, now.month, 1)
-            if r['modifier'] == 'last':
-                d = d - relativedelta(months=1)
-            elif r['modifier'] == 'next':
-                d = d + relativedelta(months=1)
-            r['year'] = d.year
-            r['month'] = d.month
+            r['year'], r['month'] = ordinal.add_months(now.year, now.month, _month_shifts.get(r['modifier'], 0))
         else:
             if r['modifier'] == 'last':
                 if month >= now.month:
@@ -767,13 +745,7 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
 
     def _make_date_relative_month_day_position(self, r, now):
         if (month := r.get('month')) is None:
-            d = date(now.year, now.month, 1)
-            if r['modifier'] == 'last':
-                d = d - relativedelta(months=1)
-            elif r['modifier'] == 'next':
-                d = d + relativedelta(months=1)
-            r['year'] = d.year
-            r['month'] = d.month
+            r['year'], r['month'] = ordinal.add_months(now.year, now.month, _month_shifts.get(r['modifier'], 0))
         else:
             if r['modifier'] == 'last':
                 if month >= now.month:
@@ -791,7 +763,13 @@ class FriendlyDateVisitorPy(FriendlyDateVisitor):
         return self._make_date_absolute_by_day_position(r)
 
     def _this_monday(self, date):
-        return date - relativedelta(days=date.weekday())
+        return ordinal.this_weekday(date, 0)
 
     def _this_weekday(self, date, weekday):
-        return date - relativedelta(days=date.weekday() - weekday)
+        return ordinal.this_weekday(date, weekday)
+
+    _evaluators = { 'now': _make_now,
+                    'date_absolute': _make_date_absolute,
+                    'date_alone': _make_date_alone,
+                    'date_relative': _make_date_relative,
+                    'datetime': _make_datetime }
@@ -0,0 +1,66 @@
+"""
+Bounded LRU cache of compiled expression plans.
+"""
+
+from collections import OrderedDict, namedtuple
+import threading
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+class PlanCache:
+    """
+    Thread-safe LRU mapping of `(text, what, month_first)` keys to
+    compiled plans. Plans are immutable so they can be shared between
+    sessions and threads.
+    """
+
+    def __init__(self, maxsize=4096):
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            try:
+                plan = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return plan
+
+    def put(self, key, plan):
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = plan
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def resize(self, maxsize):
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._data) > max(maxsize, 0):
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self._maxsize, len(self._data))
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self):
+        return len(self._data)
@@ -0,0 +1,149 @@
+"""
+Built-in corpus used by `warmup`. Between them, the expressions go
+through every alternative of the grammar rules and use every token of
+the lexer vocabulary.
+"""
+
+warmup_corpus = [
+    # now, relative days and deltas
+    "now",
+    "today",
+    "tomorrow at midnight",
+    "yesterday at noon",
+    "the day after tomorrow at midday",
+    "the day before yesterday",
+    "2 days ago",
+    "12345 days ago",
+    "1h 15m 30s ago",
+    "3 weeks -1 day, 2 months before today",
+    "1 year, 2 mos +3 ws 4 ds after tomorrow",
+    "1 y 1 ys 1 years 1 mo 1 months 1 w 1 weeks 1 d 1 days before today",
+    "1 hr 2 mins 3 secs after now",
+    "1 hours 1 minute 1 second 1.5 seconds after now",
+    "1 hrs 1 min 1 sec 0.25 s 12.5 s 123.5 ss after now",
+    "-1.5 seconds after next monday",
+    "2 days after the first of next month at 10:00",
+    # weekdays
+    "monday",
+    "next tuesday",
+    "last wednesday",
+    "this thursday",
+    "this comming friday",
+    "saturday of this week",
+    "sunday next week",
+    "last week",
+    # relative months and years
+    "the 1st of next month",
+    "the last day of this month",
+    "the 2nd of next jan",
+    "the third of last february",
+    "last day of next year",
+    "the last day of march next year",
+    "april this year",
+    "the 4th of may, last year",
+    "the fifteenth of june of next year",
+    "week 2 of next month",
+    "the monday of week 3 of next july",
+    "the last week of this year",
+    "the wednesday of week 10 of august next year",
+    "the second sunday of next september",
+    "the 3rd day of this october",
+    "the last friday of next year",
+    "day 100 of this year",
+    "the 5th monday of november next year",
+    "the twenty-first day of last december",
+    "last sunday by 2024-01-01",
+    "next monday by the last day of next month",
+    # absolute dates with month names
+    "1 january 2017",
+    "monday, 2 jan 2017",
+    "3-feb-2017",
+    "4/mar/2017",
+    "january 5, 2017",
+    "tue, january-10-2017",
+    "feb-14-2017",
+    "2017-march-15",
+    "2017/apr/16",
+    "the 21st of may, 2017",
+    "22nd of jun of 2017",
+    "the last day of jul 2017",
+    "the last day of february",
+    "aug 23rd, 2017",
+    "sep twenty-fourth 2017",
+    "oct 25",
+    "nov 2017",
+    "dec/2017",
+    "december",
+    # absolute numeric dates
+    "10/3",
+    "10/3/2017",
+    "wed, 10-3-2017",
+    "2017/10/3",
+    "10/2017",
+    "20170103",
+    "2017",
+    "the last day of 2017",
+    "last day of 2017",
+    # weeks and day positions
+    "week 20 2018",
+    "wed week 20 2018",
+    "the monday of week 4 of april 2023",
+    "week 4 of 4/2023",
+    "week 4 of april",
+    "week 4 of 2023",
+    "last week of jan 2029",
+    "the sunday of last week of 1/2029",
+    "last week of 2029",
+    "second sunday of january 2023",
+    "the 2nd day of 1/2023",
+    "last monday of march",
+    "last friday of 2023",
+    "day 131 of 2023",
+    "131st day of 2023",
+    "the 99th day of 2023",
+    # ISO 8601
+    "2024-12-31",
+    "2012-w10-1",
+    "2012-365",
+    "2024-12-31t13:01z",
+    "2024-12-31t13:01:02+02:00",
+    "2021-08-20t13:14:01.7-05:30",
+    "2012-w10-1t10:12z",
+    "2012-365t10:01+00:30",
+    # times
+    "today at 10:00",
+    "today at 10:00:15",
+    "today 10:00:15.123",
+    "today at 9:05 am",
+    "today 11:59:59.999 pm",
+    "today at 10h",
+    "today at 10h 30m",
+    "today at 10 hours 30 minutes 15 seconds pm",
+    "today at 10 h 30 m 15.5 s am",
+    "today at 10 h 30 m 15 second",
+    "today at 10 h 30 m 5.5 s",
+    # timezones
+    "tomorrow at noon europe/paris",
+    "today at 1:00pm america/argentina/buenos_aires",
+    "today at 10:00 utc",
+    "today at 10:00 cest",
+    "today at 10:00 +05:30",
+    "today at 10:00 -08:00",
+    "today at 10:00 +2",
+    "today at 10:00 etc/gmt+5",
+    "z",
+    "utc",
+    "europe/madrid",
+    "est",
+    "+01:00",
+    "-5",
+    # partial and invalid input, to build the DFA states of error paths
+    "next",
+    "the last",
+    "10/",
+    "2024-",
+    "today at",
+    "1 day",
+    "foo bar",
+    "in the beginning of the end; from here",
+]
@@ -0,0 +1,171 @@
+"""
+Extraction of date expressions from free text.
+
+The document is lexed once. The token stream is cut into segments at
+anything which can not be part of a date (characters the lexer does
+not recognize and words which are not timezone names), and inside
+every segment the `dateTime` (or `dateAlone`) rule is tried at the
+tokens which can start it. Matches are the leftmost longest ones, do
+not overlap and are yielded as soon as their segment is complete, so
+the cost grows linearly with the size of the document.
+"""
+
+import re
+import threading
+from datetime import datetime
+
+from antlr4 import InputStream, CommonTokenStream, PredictionMode, Token
+from antlr4.ListTokenSource import ListTokenSource
+from antlr4.error.ErrorStrategy import BailErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+
+from friendlydateparser import _resolve
+from friendlydateparser import tz as tz_cache
+from friendlydateparser.antlr.FriendlyDateLexer import FriendlyDateLexer
+from friendlydateparser.antlr.FriendlyDateParser import FriendlyDateParser
+from friendlydateparser.antlr.FriendlyDateVisitorPy import FriendlyDateVisitorPy
+from friendlydateparser.locking import lock_lexer, lock_parser
+
+# inner rule, field where the visitor stores its result and the entry
+# rule wrapping it with EOF
+_rules = {
+    "date": (FriendlyDateParser.RULE_dateAlone, 'date', 'friendlyDate'),
+    "datetime": (FriendlyDateParser.RULE_dateTime, 'datetime', 'friendlyDateTime'),
+}
+
+_retries = 3
+
+# a period ending a sentence would otherwise be lexed as part of a
+# number ("in 2017." as the float "2017.")
+_final_period_re = re.compile(r'(?<=[0-9])\.(?=\s|$)')
+
+class DateExtractor:
+    """
+    Session owning the parser and visitor used to extract dates of the
+    given kind (`"date"` or `"datetime"`), with timezones built by
+    `tz_backend` (the default backend when not given). Like `DateParser`
+    sessions, it must not be used from several threads at once, but the
+    generators returned by `find` can be consumed interleaved.
+    """
+
+    def __init__(self, what="datetime", tz_backend=None):
+        try:
+            rule, self._field, entry = _rules[what]
+        except KeyError:
+            raise ValueError(f"Invalid value for 'what' parameter: {what}") from None
+        self._parser = FriendlyDateParser(CommonTokenStream(self._lexer()))
+        self._parser.removeErrorListeners()
+        lock_parser(self._parser)
+        self._parser._interp.predictionMode = PredictionMode.SLL
+        self._parser._errHandler = BailErrorStrategy()
+        self._inner = getattr(self._parser, FriendlyDateParser.ruleNames[rule])
+        self._entry = getattr(self._parser, entry)
+        atn = self._parser.atn
+        self._first = {t for r in atn.nextTokens(atn.ruleToStartState[rule]).intervals for t in r}
+        self._tz = tz_cache.get_backend(tz_backend)
+        self._visitor = FriendlyDateVisitorPy(now=datetime.now(), month_first=True, default_tz=None,
+                                              tz_backend=self._tz)
+
+    def find(self, text, now=None, month_first=True, default_tz=None, context=None):
+        """
+        Yields a `(start, end, value)` tuple for every date expression
+        in `text`, where `text[start:end]` is the expression.
+        """
+        now, month_first, default_tz = _resolve(now, month_first, default_tz, context)
+        for segment in self._segments(text):
+            yield from self._matches(segment, now, month_first, default_tz)
+
+    def _lexer(self, text=""):
+        # every document gets its own lexer so that generators can be
+        # interleaved
+        lexer = FriendlyDateLexer(InputStream(text))
+        lexer.removeErrorListeners()
+        lock_lexer(lexer)
+        return lexer
+
+    def _segments(self, text):
+        lower = text.lower()
+        if len(lower) != len(text):
+            # keep the offsets of characters whose lowercase is longer
+            lower = "".join(c if len(l := c.lower()) != 1 else l for c in text)
+        lower = _final_period_re.sub(" ", lower)
+        lexer = self._lexer(lower)
+        is_tz_name = self._tz.is_name
+        segment = []
+        end = 0
+        while True:
+            token = lexer.nextToken()
+            if token.type == Token.EOF:
+                break
+            if segment and end < token.start and not lower[end:token.start].isspace():
+                yield segment
+                segment = []
+            end = token.stop + 1
+            if token.type == FriendlyDateLexer.TIMEZONE and not is_tz_name(token.text):
+                if segment:
+                    yield segment
+                    segment = []
+                continue
+            segment.append(token)
+        if segment:
+            yield segment
+
+    def _matches(self, segment, now, month_first, default_tz):
+        first = self._first
+        i = 0
+        while i < len(segment):
+            if segment[i].type in first and \
+               (match := self._match(segment, i, now, month_first, default_tz)) is not None:
+                length, value = match
+                yield segment[i].start, segment[i + length - 1].stop + 1, value
+                i += length
+            else:
+                i += 1
+
+    def _match(self, segment, i, now, month_first, default_tz):
+        # the inner rule stops where the date ends, when it fails (or
+        # its value is not valid) the entry rule is tried on the tokens
+        # before that point, a few times at most
+        visitor = self._visitor
+        visitor.set_month_first(month_first)
+        tokens = segment[i:]
+        try:
+            tree = self._parse(tokens, self._inner)
+        except ParseCancellationException as e:
+            limit = e.args[0].offendingToken.tokenIndex
+        else:
+            length = tree.stop.tokenIndex + 1
+            try:
+                return length, visitor.evaluate(visitor.compile_rule(tree, self._field), now, default_tz)
+            except ValueError:
+                limit = length - 1
+        for _ in range(_retries):
+            if limit < 1:
+                break
+            try:
+                tree = self._parse(tokens[:limit], self._entry)
+                return limit, visitor.evaluate(visitor.compile(tree), now, default_tz)
+            except ParseCancellationException as e:
+                limit = min(limit - 1, e.args[0].offendingToken.tokenIndex)
+            except ValueError:
+                limit -= 1
+        return None
+
+    def _parse(self, tokens, rule):
+        stream = CommonTokenStream(ListTokenSource(tokens))
+        self._parser.setTokenStream(stream)
+        return rule()
+
+_local = threading.local()
+
+def find_dates(text, what="datetime", now=None, month_first=True, default_tz=None, context=None):
+    try:
+        extractors = _local.extractors
+    except AttributeError:
+        extractors = _local.extractors = {}
+    key = (what, tz_cache.default_backend())
+    try:
+        extractor = extractors[key]
+    except KeyError:
+        extractor = extractors[key] = DateExtractor(what)
+    return extractor.find(text, now=now, month_first=month_first, default_tz=default_tz, context=context)
@@ -0,0 +1,93 @@
+"""
+Regex based recognizer for the machine-written layouts that make up
+most of the input in practice (ISO 8601 dates and datetimes, long
+numbers and numeric dates), which builds the same plans as the grammar
+without going through ANTLR.
+
+Anything not matching exactly is left to the grammar.
+"""
+
+import re
+
+from friendlydateparser.plan import _plan
+
+_ws = r'[ \t\r\n]'
+
+_iso_date = r'(?P<year>\d{4})-(?P<month>\d\d?)-(?P<day>\d\d?)'
+
+_iso_time = r'(?P<hour>\d\d):(?P<minute>\d\d)(?::(?P<second>\d\d(?:\.\d*)?))?'
+
+_iso_tz = r'(?:(?P<z>z)|(?P<sign>[-+])(?P<tz_hour>\d\d?)(?::(?P<tz_minute>\d\d))?)'
+
+_long_number = r'(?P<year>\d{4})(?P<month>0[1-9]|1[0-2])(?P<day>0[1-9]|[12]\d|3[01])'
+
+_numeric_date = r'(?P<left>\d\d?)[-/](?P<right>\d\d?)(?:[-/](?P<year>\d{4}))?'
+
+_numeric_time = r'(?P<hour>\d\d?):(?P<minute>\d\d)(?::(?P<second>\d\d(?:\.\d*)?))?'
+
+_iso_date_re = re.compile(_iso_date, re.ASCII)
+_iso_datetime_re = re.compile(f'{_iso_date}t{_iso_time}{_iso_tz}', re.ASCII)
+_long_number_re = re.compile(_long_number, re.ASCII)
+_numeric_date_re = re.compile(_numeric_date, re.ASCII)
+_numeric_datetime_re = re.compile(f'{_numeric_date}{_ws}+{_numeric_time}', re.ASCII)
+
+def compile_fast(visitor, text, what, month_first):
+    """
+    Returns the plan for `text` (already lowercased) when it has one of
+    the recognized layouts or `None` otherwise.
+
+    `visitor` is used for the time and float conversions so that
+    values out of range raise the same errors as the grammar path, and
+    its timezone backend for the offsets.
+    """
+    text = text.strip(' \t\r\n')
+    if what == "date":
+        if (date := _match_date(text, month_first)) is None:
+            return None
+        return _plan('date_alone', {'date': date})
+    if what == "datetime":
+        if (date := _match_date(text, month_first)) is not None:
+            return _plan('datetime', {'date': date})
+        if (m := _iso_datetime_re.fullmatch(text)) is not None:
+            return _plan('datetime', {'date': _date_absolute(m),
+                                      'time': _time(visitor, m),
+                                      'tz': _tz(visitor, m)})
+        if (m := _numeric_datetime_re.fullmatch(text)) is not None:
+            return _plan('datetime', {'date': _date_numeric(m, month_first),
+                                      'time': _time(visitor, m)})
+    return None
+
+def _match_date(text, month_first):
+    if (m := _iso_date_re.fullmatch(text)) is not None:
+        return _date_absolute(m)
+    if (m := _long_number_re.fullmatch(text)) is not None:
+        return _date_absolute(m)
+    if (m := _numeric_date_re.fullmatch(text)) is not None:
+        return _date_numeric(m, month_first)
+    return None
+
+def _date_absolute(m):
+    return _plan('date_absolute', {'year': int(m['year']),
+                                   'month': int(m['month']),
+                                   'day': int(m['day'])})
+
+def _date_numeric(m, month_first):
+    left, right = int(m['left']), int(m['right'])
+    r = {'month': left, 'day': right} if month_first else {'day': left, 'month': right}
+    if (year := m['year']) is not None:
+        r['year'] = int(year)
+    return _plan('date_absolute', r)
+
+def _time(visitor, m):
+    r = {'hour': int(m['hour']), 'minute': int(m['minute'])}
+    if (second := m['second']) is not None:
+        r['second'], r['microsecond'] = visitor._split_float(second)
+    return visitor._make_time(r)
+
+def _tz(visitor, m):
+    if m['z'] is not None:
+        return visitor._tz.from_offset(0)
+    offset = int(m['tz_hour'])*60 + int(m['tz_minute'] or 0)
+    if m['sign'] == '-':
+        offset = -offset
+    return visitor._tz.from_offset(offset)
@@ -0,0 +1,105 @@
+"""
+Instrumentation hooks.
+
+Callables registered with `add_hook` receive a `ParseEvent` describing
+every parse call: where the plan came from, the time spent on every
+stage, the number of tokens, the number of full LL prediction attempts,
+whether the two-stage parse fell back from SLL to LL and the grammar
+rule which matched.
+
+When no hook is registered the parser only pays for a truth test on
+the hook list. Hooks can be added and removed at any time, and
+`set_sample_rate` limits instrumentation to a fraction of the calls.
+"""
+
+hooks = []
+
+_sample_rate = 1.0
+
+class ParseEvent:
+    """
+    Timings are in seconds and are zero for the stages which did not
+    run: plans served by the cache (`source == "cache"`) or by the fast
+    path (`source == "fast"`) skip lexing, parsing and visiting.
+    """
+    __slots__ = ('text', 'what', 'source', 'rule', 'tokens',
+                 'lex', 'parse', 'visit', 'evaluate', 'tz', 'total',
+                 'full_context', 'context_sensitivity', 'fallback', 'error')
+
+    def __init__(self, text, what):
+        self.text = text
+        self.what = what
+        self.source = None
+        self.rule = None
+        self.tokens = 0
+        self.lex = 0.0
+        self.parse = 0.0
+        self.visit = 0.0
+        self.evaluate = 0.0
+        self.tz = 0.0
+        self.total = 0.0
+        self.full_context = 0
+        self.context_sensitivity = 0
+        self.fallback = False
+        self.error = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"ParseEvent({fields})"
+
+def add_hook(hook):
+    hooks.append(hook)
+
+def remove_hook(hook):
+    hooks.remove(hook)
+
+def set_sample_rate(rate):
+    """
+    Sets the fraction of parse calls (between 0 and 1) which are
+    instrumented while some hook is registered.
+    """
+    global _sample_rate
+    _sample_rate = rate
+
+def enabled():
+    if not hooks:
+        return False
+    if _sample_rate >= 1.0:
+        return True
+    from random import random
+    return random() < _sample_rate
+
+def emit(event):
+    for hook in list(hooks):
+        hook(event)
+
+_containers = { 'friendlyDate', 'friendlyDateTime', 'friendlyTimezone', 'dateTime',
+                'dateAlone', 'date', 'dateRelativeByDate', 'dateRelative',
+                'dateAbsolute', 'iso8601Date', 'anyTz' }
+
+def matched_rule(tree):
+    """
+    Returns the name of the most specific grammar rule describing the
+    parse tree (for instance `dateWithWeek` or `dateRelativeMonth`).
+    """
+    from antlr4 import ParserRuleContext
+    ctx = tree
+    while True:
+        names = ctx.parser.ruleNames
+        rules = [c for c in ctx.getChildren() if isinstance(c, ParserRuleContext)]
+        if not rules:
+            return names[ctx.getRuleIndex()]
+        for child in rules:
+            if names[child.getRuleIndex()] in _containers:
+                ctx = child
+                break
+        else:
+            return names[rules[0].getRuleIndex()]
+
+def logging_hook(event):
+    """
+    Hook writing every event to the `friendlydateparser` logger at
+    debug level.
+    """
+    import logging
+    logging.getLogger("friendlydateparser").debug("%r", event)
@@ -0,0 +1,58 @@
+"""
+ATN simulators serializing the updates of the DFAs shared by all the
+lexers and parsers of the grammar.
+
+ANTLR's Python runtime reads and extends those DFAs (and the parser's
+prediction context cache) without any locking. Two sessions missing
+the same DFA state at once could both add it, leaving edges which
+point to a state that is not the one registered in the DFA, or drop
+edges when both allocate the edge table of a state. Here every update
+checks for an existing state and inserts under one process-wide lock.
+Lookups stay lock free, and once the DFAs are warm updates are rare.
+
+This holds on free-threaded builds too, where the runtime's unlocked
+read-modify-write sequences would otherwise interleave freely.
+"""
+
+import threading
+
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+
+dfa_lock = threading.RLock()
+
+class LockedLexerATNSimulator(LexerATNSimulator):
+
+    def addDFAEdge(self, from_, tk, to=None, cfgs=None):
+        with dfa_lock:
+            return super().addDFAEdge(from_, tk, to, cfgs)
+
+    def addDFAState(self, configs):
+        with dfa_lock:
+            return super().addDFAState(configs)
+
+class LockedParserATNSimulator(ParserATNSimulator):
+
+    def addDFAEdge(self, dfa, from_, t, to):
+        with dfa_lock:
+            return super().addDFAEdge(dfa, from_, t, to)
+
+    def addDFAState(self, dfa, D):
+        with dfa_lock:
+            return super().addDFAState(dfa, D)
+
+def install(lexer, parser):
+    """
+    Replaces the simulators of the given lexer and parser with the
+    locking ones.
+    """
+    lock_lexer(lexer)
+    lock_parser(parser)
+
+def lock_lexer(lexer):
+    lexer._interp = LockedLexerATNSimulator(lexer, lexer.atn, lexer.decisionsToDFA,
+                                            lexer._interp.sharedContextCache)
+
+def lock_parser(parser):
+    parser._interp = LockedParserATNSimulator(parser, parser.atn, parser.decisionsToDFA,
+                                              parser.sharedContextCache)
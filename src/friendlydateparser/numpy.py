@@ -0,0 +1,417 @@
+"""
+NumPy support: parsing of string arrays into datetime64 arrays and
+evaluation of one expression against arrays of reference times.
+
+Requires numpy, which is an optional dependency
+(`pip install friendlydateparser[numpy]`).
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+
+from friendlydateparser import DateParser, _resolve_month_first, _resolve_tz
+from friendlydateparser import tz as tz_cache
+from friendlydateparser.plan import PlanNode
+
+_epoch = datetime(1970, 1, 1)
+_epoch_ordinal = _epoch.toordinal()
+_microsecond = timedelta(microseconds=1)
+_nat = np.iinfo(np.int64).min
+
+_units = { "date": "D", "datetime": "us" }
+
+_day = 86_400_000_000
+
+# days of date.min and date.max since the epoch
+_min_day = date.min.toordinal() - _epoch_ordinal
+_max_day = date.max.toordinal() - _epoch_ordinal
+
+def parse_array(arr, kind="datetime", now=None, month_first=True, default_tz=None, parser=None,
+                context=None):
+    """
+    Parses an array of strings into a `datetime64[us]` array (or
+    `datetime64[D]` when `kind` is `"date"`) with the same shape.
+
+    Every distinct value is parsed only once and the results are
+    scattered back using the inverse indices from `np.unique`, so the
+    cost depends on the cardinality of the input rather than on its
+    size.
+
+    Values which can not be parsed become `NaT`, `np.isnat` on the
+    result gives the mask of failures. Timezone-aware results are
+    converted to UTC as datetime64 values are always naive.
+    """
+    if (unit := _units.get(kind)) is None:
+        raise ValueError(f"Invalid value for 'kind' parameter: {kind}")
+    arr = np.asarray(arr)
+    if arr.dtype.kind != 'U':
+        arr = arr.astype(str)
+    uniques, inverse = np.unique(arr.ravel(), return_inverse=True)
+    if parser is None:
+        parser = DateParser()
+    values = parser.parse_many(uniques.tolist(), kind, now=now, month_first=month_first, default_tz=default_tz,
+                               context=context)
+    convert = _date_to_int if kind == "date" else _datetime_to_int
+    ints = np.fromiter((convert(v) for v in values), dtype=np.int64, count=len(values))
+    return ints[inverse].view(f"datetime64[{unit}]").reshape(arr.shape)
+
+def _date_to_int(d):
+    if not isinstance(d, date):
+        return _nat
+    return d.toordinal() - _epoch_ordinal
+
+def _datetime_to_int(d):
+    if not isinstance(d, datetime):
+        return _nat
+    if d.tzinfo is not None:
+        d = d.astimezone(timezone.utc).replace(tzinfo=None)
+    return (d - _epoch) // _microsecond
+
+def evaluate_array(text, now, kind="datetime", month_first=True, default_tz=None, parser=None):
+    """
+    Parses `text` once and evaluates it against every reference time in
+    `now` (a datetime64 array or anything convertible to one), returning
+    a `datetime64[us]` array (or `datetime64[D]` when `kind` is
+    `"date"`) with the same shape.
+
+    The plan is evaluated with array operations on all the reference
+    times at once instead of once per element. Elements for which the
+    expression has no valid value (for instance "the 31st of next
+    month" when next month is shorter, or results past the year 9999)
+    and `NaT` reference times become `NaT`. Results carrying a timezone
+    are converted to UTC.
+    """
+    if (unit := _units.get(kind)) is None:
+        raise ValueError(f"Invalid value for 'kind' parameter: {kind}")
+    if parser is None:
+        parser = DateParser()
+    plan = parser.compile(text, kind, _resolve_month_first(month_first))
+    now = np.asarray(now)
+    if now.dtype.kind != 'M':
+        now = now.astype("datetime64[us]")
+    shape = now.shape
+    evaluator = _ArrayEvaluator(now.astype("datetime64[us]").ravel().view(np.int64), _resolve_tz(default_tz))
+    values = evaluator.evaluate(plan)
+    values = np.where(evaluator.bad, _nat, values)
+    return values.view(f"datetime64[{unit}]").reshape(shape)
+
+# Dates are handled as int64 days and datetimes as int64 microseconds
+# since the epoch, months as int64 counts since January 1970.
+
+def _month_start(months):
+    return np.asarray(months, dtype=np.int64).astype("datetime64[M]").astype("datetime64[D]").view(np.int64)
+
+def _month_length(months):
+    return _month_start(months + 1) - _month_start(months)
+
+def _month_index(year, month):
+    return (year - 1970) * 12 + (month - 1)
+
+def _ymd(days):
+    days = np.asarray(days, dtype=np.int64)
+    months = days.astype("datetime64[D]").astype("datetime64[M]").view(np.int64)
+    return months // 12 + 1970, months % 12 + 1, days - _month_start(months) + 1
+
+def _weekday(days):
+    return (days + 3) % 7
+
+class _ArrayEvaluator:
+    """
+    Counterpart of the `_make_*` methods of the visitor working on
+    arrays of reference times. Elements without a valid value are
+    flagged in `bad` instead of raising.
+    """
+
+    def __init__(self, now, default_tz):
+        self.bad = now == _nat
+        self._now = np.where(self.bad, 0, now)
+        self._today = self._now // _day
+        self._default_tz = default_tz
+
+    def evaluate(self, plan):
+        r = dict(plan.fields)
+        for key in ('date', 'datetime'):
+            if isinstance(v := r.get(key), PlanNode):
+                r[key] = self.evaluate(v)
+        return self._evaluators[plan.kind](self, r)
+
+    def _check(self, invalid):
+        self.bad = self.bad | invalid
+
+    def _in_range(self, d, unit=1):
+        # flags the days (or microseconds when unit is _day) outside the
+        # years 1 to 9999
+        self._check((d < _min_day * unit) | (d >= (_max_day + 1) * unit))
+        return d
+
+    def _make_days(self, year, month, day):
+        # date(year, month, day) flagging invalid elements
+        months = _month_index(year, month)
+        last_day = _month_length(months)
+        self._check((year < 1) | (year > 9999) | (month < 1) | (month > 12) |
+                    (day < 1) | (day > last_day))
+        return _month_start(months) + day - 1
+
+    def _make_now(self, r):
+        return self._now
+
+    def _make_date_absolute(self, r):
+        if r.get('week') is not None:
+            return self._in_range(self._make_date_absolute_by_week(r))
+
+        if r.get('day_position') is not None:
+            return self._in_range(self._make_date_absolute_by_day_position(r))
+
+        year = r.get('year')
+        month = r.get('month')
+        day = r.get('day')
+
+        if year is None:
+            year, now_month, now_day = _ymd(self._today)
+            if month is None:
+                month = now_month
+                if day is None:
+                    day = now_day
+
+        if month is None:
+            month = 12 if day == -1 else 1
+
+        if day is None:
+            day = 1
+        elif np.ndim(day) == 0 and day == -1:
+            day = _month_length(_month_index(year, month))
+
+        d = self._make_days(year, month, day)
+        if (weekday := r.get('weekday')) is not None:
+            self._check(_weekday(d) != weekday)
+        return d
+
+    def _make_date_absolute_by_week(self, r, year=None, month=None):
+        week = r['week']
+        if year is None:
+            year = r.get('year')
+            if year is None:
+                year = _ymd(self._today)[0]
+        if month is None:
+            month = r.get('month')
+        weekday = r.get('weekday', 0)
+        month1 = month
+        self._check(np.full(self._now.shape, week == 0))
+        if month is not None:
+            self._check((month < 1) | (month > 12))
+
+        if week == -1:
+            week = 0
+            if month is None:
+                year = year + 1
+            else:
+                year, month = divmod(_month_index(year, month) + 1, 12)
+                year, month = year + 1970, month + 1
+
+        first_day = _month_start(_month_index(year, 1 if month is None else month))
+        first_weekday = _weekday(first_day)
+        week = week - (first_weekday <= 3)
+
+        monday = first_day + 7 * week - first_weekday
+        wednesday_year, wednesday_month, _ = _ymd(monday + 3)
+        invalid = wednesday_year > year
+        if month1 is not None:
+            invalid |= (wednesday_year == year) & (wednesday_month > month)
+        self._check(invalid)
+        return monday + weekday
+
+    def _make_date_absolute_by_day_position(self, r, year=None, month=None):
+        day_position = r['day_position']
+        weekday = r.get('weekday')
+        if year is None:
+            year = r.get('year')
+            if year is None:
+                year = _ymd(self._today)[0]
+        if month is None:
+            month = r.get('month')
+        month1, year1 = month, year
+
+        if month is not None:
+            self._check((month < 1) | (month > 12))
+
+        if day_position == -1:
+            if month is None:
+                year = year + 1
+            else:
+                year, month = divmod(_month_index(year, month) + 1, 12)
+                year, month = year + 1970, month + 1
+            day_position = 0
+
+        first_day = _month_start(_month_index(year, 1 if month is None else month))
+        if weekday is None:
+            d = first_day + day_position - 1
+        else:
+            d = first_day + (weekday - _weekday(first_day)) % 7 + 7 * (day_position - 1)
+
+        d_year, d_month, _ = _ymd(d)
+        invalid = d_year != year1
+        if month1 is not None:
+            invalid |= d_month != month1
+        self._check(invalid)
+        return d
+
+    def _add_delta(self, d, delta, before, unit):
+        # same as ordinal.add: months move the calendar month, clipping
+        # the day to its length, the rest is a fixed duration
+        if before:
+            delta = -delta
+        months = delta.months
+        if unit == 1:
+            rest = delta.days
+        else:
+            rest = delta.days * _day + delta.microseconds
+        if abs(rest) > (_max_day - _min_day + 1) * unit:
+            # longer than the calendar, and than int64 may hold
+            self._check(np.full(d.shape, True))
+            rest = 0
+        if months:
+            days, time_of_day = divmod(d, unit)
+            year, month, day = _ymd(days)
+            index = _month_index(year, month) + months
+            self._check((index < _month_index(1, 1)) | (index > _month_index(9999, 12)))
+            index = np.clip(index, _month_index(1, 1), _month_index(9999, 12))
+            days = _month_start(index) + np.minimum(day, _month_length(index)) - 1
+            d = days * unit + time_of_day
+        return self._in_range(d + rest, unit)
+
+    def _make_date_alone(self, r):
+        d = r.get('date', self._today)
+        if (delta := r.get('date_delta')) is None:
+            return d
+        return self._add_delta(d, delta, r.get('delta_before', False), 1)
+
+    def _make_datetime(self, r):
+        if (d := r.get('date')) is None:
+            d = self._now
+        else:
+            t = r.get('time')
+            d = d * _day
+            if t is not None:
+                d = d + ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+        if (delta := r.get('datetime_delta')) is not None:
+            d = self._add_delta(d, delta, r.get('delta_before', False), _day)
+
+        if (tz := r.get('tz')) is None:
+            tz = self._default_tz
+        if tz is not None:
+            d = self._to_utc(tz, d)
+        return d
+
+    def _to_utc(self, tz, d):
+        if (offset := tz.utcoffset(None)) is not None:
+            return d - offset // _microsecond
+        # zones with DST rules are localized once per distinct local time
+        local, inverse = np.unique(np.where(self.bad, 0, d), return_inverse=True)
+        utc = np.empty_like(local)
+        for i, v in enumerate(local.tolist()):
+            try:
+                d = _epoch + timedelta(microseconds=v)
+                utc[i] = (d - tz_cache.localize(tz, d).utcoffset() - _epoch) // _microsecond
+            except OverflowError:
+                utc[i] = _nat
+        utc = utc[inverse]
+        self._check(utc == _nat)
+        return utc
+
+    def _make_date_relative(self, r):
+        return self._in_range(self._relative_date(r))
+
+    def _relative_date(self, r):
+        base = r.get('date', self._today)
+        rule = r['rule']
+        if rule == 'today':
+            return base + r['delta']
+        if rule == 'day':
+            return self._make_date_relative_day(r, base)
+        if rule == 'week':
+            return self._make_date_relative_week(r, base)
+        if rule == 'month':
+            return self._make_date_relative_month(r, base)
+        if rule == 'year':
+            return self._make_date_relative_year(r, base)
+        if rule == 'month_week':
+            return self._make_date_absolute_by_week(r, *self._relative_month(r, base))
+        if rule == 'year_week':
+            return self._make_date_absolute_by_week(r, self._relative_year(r, base))
+        if rule == 'month_day_position':
+            return self._make_date_absolute_by_day_position(r, *self._relative_month(r, base))
+        if rule == 'year_day_position':
+            return self._make_date_absolute_by_day_position(r, self._relative_year(r, base))
+        raise ValueError(f"Internal error: Invalid rule: {rule}")
+
+    def _make_date_relative_day(self, r, base):
+        weekday = r['weekday']
+        delta = weekday - _weekday(base)
+        modifier = r.get('modifier')
+        if modifier == 'next':
+            return base + np.where(delta < 1, delta + 7, delta)
+        if modifier == 'last':
+            return base + np.where(delta > 0, delta - 7, delta)
+        return base + delta
+
+    def _make_date_relative_week(self, r, base):
+        d = base + r.get('weekday', 0) - _weekday(base)
+        if r['modifier'] == 'last':
+            return d - 7
+        if r['modifier'] == 'next':
+            return d + 7
+        return d
+
+    def _relative_month(self, r, base):
+        # year and month selected by "this/last/next month" or
+        # "last/next <month name>"
+        year, base_month, _ = _ymd(base)
+        if (month := r.get('month')) is None:
+            index = _month_index(year, base_month)
+            if r['modifier'] == 'last':
+                index = index - 1
+            elif r['modifier'] == 'next':
+                index = index + 1
+            return index // 12 + 1970, index % 12 + 1
+        if r['modifier'] == 'last':
+            year = year - (month >= base_month)
+        elif r['modifier'] == 'next':
+            year = year + (month <= base_month)
+        elif r['rule'] != 'month':
+            # the week and day position rules keep the year of now
+            year = _ymd(self._today)[0]
+        return year, np.full(base.shape, month)
+
+    def _relative_year(self, r, base):
+        year = _ymd(base)[0]
+        if r['modifier'] == 'last':
+            return year - 1
+        if r['modifier'] == 'next':
+            return year + 1
+        return _ymd(self._today)[0]
+
+    def _make_date_relative_month(self, r, base):
+        year, month = self._relative_month(r, base)
+        day = r.get('day', 1)
+        if day == -1:
+            day = _month_length(_month_index(year, month))
+        return self._make_days(year, month, day)
+
+    def _make_date_relative_year(self, r, base):
+        year = _ymd(base)[0]
+        if r['modifier'] == 'last':
+            year = year - 1
+        elif r['modifier'] == 'next':
+            year = year + 1
+        day = r.get('day', 1)
+        month = r.get('month', 12 if day == -1 else 1)
+        if day == -1:
+            day = _month_length(_month_index(year, month))
+        return self._make_days(year, month, day)
+
+    _evaluators = { 'now': _make_now,
+                    'date_absolute': _make_date_absolute,
+                    'date_alone': _make_date_alone,
+                    'date_relative': _make_date_relative,
+                    'datetime': _make_datetime }
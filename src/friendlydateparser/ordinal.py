@@ -0,0 +1,248 @@
+"""
+Calendar arithmetic on proleptic Gregorian ordinals and integer fields.
+
+Implements the part of `dateutil.relativedelta` used when evaluating
+plans, with the same semantics but without building relativedelta
+objects: months are shifted first, clamping the day to the length of
+the target month, and then a fixed duration of days and microseconds
+is added. Results outside the years 1 to 9999 raise `ValueError`.
+
+Lookups of month starts, weekdays and week numbers go through
+`calendar_index`, tables covering the months of a range of years
+(1900 to 2200 by default, see `set_index_range`) which are built the
+first time they are needed. Dates outside the range are computed.
+"""
+
+from array import array
+from collections import namedtuple
+from datetime import date, datetime, time, timedelta
+
+_day_us = 86_400_000_000
+
+_month_lengths = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+def month_length(year, month):
+    """
+    Returns the number of days of the given month, as
+    `calendar.monthrange(year, month)[1]`.
+    """
+    if not 1 <= month <= 12:
+        raise ValueError(f"bad month number {month}; must be 1-12")
+    if month == 2 and is_leap(year):
+        return 29
+    return _month_lengths[month]
+
+def add_months(year, month, months):
+    """
+    Returns the `(year, month)` pair `months` months after the given one.
+    """
+    year, month = divmod(year * 12 + month - 1 + months, 12)
+    return year, month + 1
+
+def _out_of_range():
+    return ValueError("Invalid date: date value out of range")
+
+def shift_days(d, days):
+    try:
+        return d + timedelta(days=days)
+    except OverflowError:
+        raise _out_of_range() from None
+
+def shift_months(d, months):
+    """
+    Moves the date or datetime `d` by `months` calendar months, clamping
+    the day to the end of the target month.
+    """
+    year, month = divmod(d.year * 12 + d.month - 1 + months, 12)
+    month += 1
+    if not 1 <= year <= 9999:
+        raise _out_of_range()
+    day = d.day
+    if day > 28:
+        day = min(day, month_length(year, month))
+    return d.replace(year=year, month=month, day=day)
+
+def this_weekday(d, weekday):
+    """
+    Returns the day with the given weekday (0 for Monday) in the week of
+    `d`.
+    """
+    return shift_days(d, weekday - d.weekday())
+
+class Delta(namedtuple('Delta', ['months', 'days', 'microseconds'])):
+    """
+    Immutable calendar delta: a number of months and a fixed duration of
+    days and microseconds. `microseconds` is only non-zero when the
+    duration is not a whole number of days, in which case adding the
+    delta to a date returns a datetime, as relativedelta does.
+    """
+    __slots__ = ()
+
+    def __neg__(self):
+        return Delta(-self.months, -self.days, -self.microseconds)
+
+def delta(years=0, months=0, weeks=0, days=0, hours=0, minutes=0, seconds=0, microseconds=0):
+    """
+    Returns the `Delta` equivalent to
+    `relativedelta(years=..., months=..., ...)` with integer arguments.
+    """
+    days += weeks * 7
+    microseconds += ((hours * 60 + minutes) * 60 + seconds) * 1_000_000
+    if microseconds % _day_us == 0:
+        days += microseconds // _day_us
+        microseconds = 0
+    return Delta(years * 12 + months, days, microseconds)
+
+def add(d, delta):
+    """
+    Returns `d + delta` for a date or datetime `d`.
+    """
+    months, days, microseconds = delta
+    if months:
+        d = shift_months(d, months)
+    if microseconds:
+        if not isinstance(d, datetime):
+            d = datetime.combine(d, time())
+        try:
+            return d + timedelta(days=days, microseconds=microseconds)
+        except OverflowError:
+            raise _out_of_range() from None
+    if days:
+        return shift_days(d, days)
+    return d
+
+def subtract(d, delta):
+    """
+    Returns `d - delta` for a date or datetime `d`.
+    """
+    return add(d, -delta)
+
+class CalendarIndex:
+    """
+    Tables for the months of the years `first_year` to `last_year`,
+    indexed by `(year - first_year) * 12 + month - 1`:
+
+    - `starts`: ordinal of the first day (one extra entry holds the
+      first day after the range),
+    - `weekdays`: weekday of the first day (0 for Monday),
+    - `lengths`: number of days,
+    - `year_days`: day of the year of the first day, from 0,
+    - `week_ones`: ordinal of the Monday of week 1, the week holding
+      the first Thursday of the month (for January, the ISO week 1).
+
+    Months past December roll over to the next year. All the methods
+    accept months outside the range and compute them instead.
+    """
+
+    def __init__(self, first_year=1900, last_year=2200):
+        if not 1 <= first_year <= last_year <= 9998:
+            raise ValueError(f"Invalid calendar index range: {first_year}-{last_year}")
+        self.first_year = first_year
+        self.last_year = last_year
+        self.size = (last_year - first_year + 1) * 12
+        self._tables = None
+
+    def tables(self):
+        """
+        Returns the `(starts, weekdays, lengths, year_days, week_ones)`
+        arrays, building them on the first call.
+        """
+        if (tables := self._tables) is None:
+            tables = self._tables = self._build()
+        return tables
+
+    def _build(self):
+        starts = array('l')
+        weekdays = array('B')
+        lengths = array('B')
+        year_days = array('H')
+        week_ones = array('l')
+        start = date(self.first_year, 1, 1).toordinal()
+        for year in range(self.first_year, self.last_year + 1):
+            year_day = 0
+            for month in range(1, 13):
+                length = month_length(year, month)
+                weekday = (start - 1) % 7
+                starts.append(start)
+                weekdays.append(weekday)
+                lengths.append(length)
+                year_days.append(year_day)
+                week_ones.append(_week_one(start, weekday))
+                start += length
+                year_day += length
+        starts.append(start)
+        return starts, weekdays, lengths, year_days, week_ones
+
+    def month_start(self, year, month):
+        """
+        Returns the ordinal of the first day of the month.
+        """
+        i = (year - self.first_year) * 12 + month - 1
+        if 0 <= i < self.size:
+            return (self._tables or self.tables())[0][i]
+        return _month_start(year, month)
+
+    def span(self, year, month=None):
+        """
+        Returns the ordinals of the first day of the month (of the year
+        when `month` is `None`) and of the first day after it.
+        """
+        i = (year - self.first_year) * 12 + (month or 1) - 1
+        j = i + (1 if month else 12)
+        if 0 <= i and j <= self.size:
+            starts = (self._tables or self.tables())[0]
+            return starts[i], starts[j]
+        return _month_start(year, month or 1), _month_start(year, (month or 12) + 1)
+
+    def first_weekday(self, year, month):
+        i = (year - self.first_year) * 12 + month - 1
+        if 0 <= i < self.size:
+            return (self._tables or self.tables())[1][i]
+        return (_month_start(year, month) - 1) % 7
+
+    def month_length(self, year, month):
+        i = (year - self.first_year) * 12 + month - 1
+        if 0 <= i < self.size:
+            return (self._tables or self.tables())[2][i]
+        year, month = add_months(year, month, 0)
+        return month_length(year, month)
+
+    def year_day(self, year, month):
+        i = (year - self.first_year) * 12 + month - 1
+        if 0 <= i < self.size:
+            return (self._tables or self.tables())[3][i]
+        year, month = add_months(year, month, 0)
+        return _month_start(year, month) - _month_start(year, 1)
+
+    def week_one(self, year, month):
+        """
+        Returns the ordinal of the Monday of the first week of the month.
+        """
+        i = (year - self.first_year) * 12 + month - 1
+        if 0 <= i < self.size:
+            return (self._tables or self.tables())[4][i]
+        start = _month_start(year, month)
+        return _week_one(start, (start - 1) % 7)
+
+def _month_start(year, month):
+    year, month = add_months(year, month, 0)
+    if year == date.max.year + 1 and month == 1:
+        return date.max.toordinal() + 1
+    return date(year, month, 1).toordinal()
+
+def _week_one(start, weekday):
+    # the week of the first Thursday
+    return start - weekday + (7 if weekday > 3 else 0)
+
+calendar_index = CalendarIndex()
+
+def set_index_range(first_year, last_year):
+    """
+    Replaces `calendar_index` with one covering the years `first_year`
+    to `last_year`.
+    """
+    global calendar_index
+    calendar_index = CalendarIndex(first_year, last_year)
@@ -0,0 +1,189 @@
+"""
+Parallel bulk parsing on a pool of worker processes.
+
+Parsing is CPU-bound pure Python code, so a single process is capped
+by the GIL. Here the distinct inputs are split in chunks which are
+parsed by worker processes holding a warmed up parser, and results
+travel back in a compact encoding (integers and zone names) instead of
+pickled datetime and tzinfo objects. Workers use the timezone backend
+that is the default in the calling process when `parse_many` is
+called. Results in any other `output`
+representation are already compact and are sent as they are.
+
+Calls without an `executor` share one pool per number of workers,
+created on first use and kept until `shutdown` (or the end of the
+process).
+"""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, timedelta
+
+from friendlydateparser import DateParser, warmup, _resolve, _check_output
+from friendlydateparser import tz as tz_cache
+
+_epoch = datetime(1970, 1, 1)
+_microsecond = timedelta(microseconds=1)
+
+# sessions of a worker, by timezone backend name
+_parsers = {}
+_warm = False
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+def _warmup():
+    # once per process, forked workers inherit the flag with the DFAs
+    global _warm
+    if not _warm:
+        warmup()
+        _warm = True
+
+def _init_worker():
+    _warmup()
+    _worker_parser(tz_cache.default_backend().name)
+
+def _worker_parser(backend):
+    try:
+        return _parsers[backend]
+    except KeyError:
+        parser = _parsers[backend] = DateParser(tz_backend=backend)
+        return parser
+
+def make_executor(workers=None):
+    """
+    Returns a `ProcessPoolExecutor` whose workers load the parser and
+    warm it up at startup. It can be passed to `parse_many` to reuse
+    the same pool over several calls.
+
+    The parser is warmed up in the calling process first (only once) so
+    that, when workers are forked, they inherit the DFA states and do
+    not need to warm up again.
+    """
+    _warmup()
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+def _shared_executor(workers):
+    with _executors_lock:
+        try:
+            return _executors[workers]
+        except KeyError:
+            executor = _executors[workers] = make_executor(workers)
+            return executor
+
+def shutdown():
+    """
+    Shuts down the pools shared by the `parse_many` calls made without
+    an `executor`. Later calls create new ones.
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown()
+
+# a forked child can not use the pools of its parent
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_executors.clear)
+
+def parse_many(items, what="datetime", now=None, month_first=True, default_tz=None,
+               workers=None, chunksize=1000, executor=None, context=None, output="datetime"):
+    """
+    Same as `friendlydateparser.parse_many` but spreading the work over
+    `workers` processes (or over the given `executor`) in chunks of
+    `chunksize` distinct inputs. Results are returned in input order.
+
+    Without an `executor`, the pool of `workers` processes shared by
+    all the calls is used.
+    """
+    if what not in ("date", "datetime", "timezone"):
+        raise ValueError(f"Invalid value for 'what' parameter: {what}")
+    _check_output(output)
+    now, month_first, default_tz = _resolve(now, month_first, default_tz, context)
+
+    items = list(items)
+    index = {}
+    for text in items:
+        if isinstance(text, str) and text not in index:
+            index[text] = len(index)
+    uniques = list(index)
+    chunks = [uniques[i:i + chunksize] for i in range(0, len(uniques), chunksize)]
+    backend = tz_cache.default_backend()
+    args = [(chunk, what, now, month_first, default_tz, output, backend.name) for chunk in chunks]
+
+    if executor is None:
+        executor = _shared_executor(workers)
+        try:
+            encoded = list(executor.map(_parse_chunk, args))
+        except BrokenProcessPool:
+            # a worker died, the next call gets a new pool
+            with _executors_lock:
+                if _executors.get(workers) is executor:
+                    del _executors[workers]
+            raise
+    else:
+        encoded = list(executor.map(_parse_chunk, args))
+
+    if output == "datetime":
+        values = [_decode(v, backend) for chunk in encoded for v in chunk]
+    else:
+        values = [v for chunk in encoded for v in chunk]
+    return [values[index[text]] if isinstance(text, str)
+            else ValueError(f"Invalid {what} {text!r}, a string was expected")
+            for text in items]
+
+def _parse_chunk(args):
+    chunk, what, now, month_first, default_tz, output, backend = args
+    _warmup()
+    parser = _worker_parser(backend)
+    results = parser.parse_many(chunk, what, now=now, month_first=month_first, default_tz=default_tz,
+                                output=output)
+    if output != "datetime":
+        return results
+    return [_encode(v, parser._tz) for v in results]
+
+# Encoding, zones and offsets being those of the timezone backend:
+#   int                       -> date as a proleptic ordinal
+#   (int,)                    -> naive datetime in microseconds since the epoch
+#   (int, zone, state)        -> datetime in the named zone, with the
+#                                backend's local_state
+#   (int, offset_minutes)     -> datetime with a fixed offset
+#   str                       -> error message
+#   [zone] / [offset_minutes] -> timezone
+#   anything else is sent as is
+
+def _encode(v, backend):
+    if isinstance(v, ValueError):
+        return str(v)
+    if isinstance(v, datetime):
+        us = (v.replace(tzinfo=None) - _epoch) // _microsecond
+        if (tz := v.tzinfo) is None:
+            return (us,)
+        if (tz_code := backend.code(tz)) is None:
+            return v
+        if isinstance(tz_code, int):
+            return (us, tz_code)
+        return (us, tz_code, backend.local_state(v))
+    if isinstance(v, date):
+        return v.toordinal()
+    if (tz_code := backend.code(v)) is not None:
+        return [tz_code]
+    return v
+
+def _decode(v, backend):
+    if isinstance(v, str):
+        return ValueError(v)
+    if isinstance(v, int):
+        return date.fromordinal(v)
+    if isinstance(v, tuple):
+        d = _epoch + v[0] * _microsecond
+        if len(v) == 1:
+            return d
+        if len(v) == 2:
+            return d.replace(tzinfo=backend.from_code(v[1]))
+        return backend.attach(backend.from_code(v[1]), d, v[2])
+    if isinstance(v, list):
+        return backend.from_code(v[0])
+    return v
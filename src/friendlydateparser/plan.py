@@ -0,0 +1,20 @@
+"""
+Compiled expression plans.
+"""
+
+from collections import namedtuple
+from types import MappingProxyType
+
+class PlanNode(namedtuple('PlanNode', ['kind', 'fields'])):
+    """
+    Immutable, now-independent node of a compiled expression plan.
+
+    `kind` selects the `_make_*` method used to evaluate the node and
+    `fields` is a read-only view of the intermediate dict collected by
+    the visitor. Fields may contain nested nodes under the `date` and
+    `datetime` keys.
+    """
+    __slots__ = ()
+
+def _plan(kind, r):
+    return PlanNode(kind, MappingProxyType(r or {}))
@@ -0,0 +1,52 @@
+"""
+Cheap rejection of inputs which can not be dates, used by the
+`try_parse_*` functions before running ANTLR.
+
+It only looks at the lexer vocabulary: a text passes when all its
+characters appear in some lexer rule and, for dates and datetimes,
+when it contains a digit or one of the anchor words without which no
+date can be written.
+"""
+
+import re
+
+# Every date contains a number or one of these tokens, the rest of the
+# grammar (deltas, ordinals, times, timezones) qualifies a date. Their
+# shortest spelling is the lowercased token name.
+anchor_tokens = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN",
+                 "JUL", "AUG", "SEP", "OCT", "NOV", "DEC",
+                 "MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN",
+                 "TODAY", "TOMORROW", "YESTERDAY", "NOW",
+                 "WEEK", "MONTH", "YEAR")
+
+_anchor_re = re.compile(r'[0-9]|\b(?:' + '|'.join(t.lower() for t in anchor_tokens) + ')')
+
+_alnum_re = re.compile(r'[0-9a-z]')
+
+_charset_re = None
+
+def _build_charset_re():
+    # union of the labels of all the lexer ATN transitions
+    from friendlydateparser.antlr.FriendlyDateLexer import FriendlyDateLexer
+    chars = set()
+    for state in FriendlyDateLexer.atn.states:
+        for transition in state.transitions:
+            if (label := transition.label) is not None:
+                for interval in label.intervals:
+                    chars.update(map(chr, interval))
+    return re.compile('[' + re.escape(''.join(sorted(chars))) + ']*')
+
+def could_match(text, what):
+    """
+    Returns false when `text` can be discarded as a `what` without
+    parsing it. A true result does not mean the text is valid.
+    """
+    global _charset_re
+    if _charset_re is None:
+        _charset_re = _build_charset_re()
+    lower = text.lower()
+    if _charset_re.fullmatch(lower) is None:
+        return False
+    if what == "timezone":
+        return _alnum_re.search(lower) is not None
+    return _anchor_re.search(lower) is not None
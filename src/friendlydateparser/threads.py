@@ -0,0 +1,106 @@
+"""
+Concurrent parsing from many threads.
+
+A `DateParser` session must not be used by two threads at once, so
+every thread gets its own from a thread-local `ParserPool`. All the
+sessions share the plan cache, the timezone cache and the lexer and
+parser DFAs, which are safe to use concurrently (DFA updates are
+serialized, see `friendlydateparser.locking`).
+
+With the GIL, threads do not make parsing faster, use
+`friendlydateparser.parallel` for that. On free-threaded builds of
+Python (3.13t and later) they run in parallel.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from friendlydateparser import DateParser, _default_parser, _resolve, _check_output
+
+class ParserPool:
+    """
+    Thread-local pool of `DateParser` sessions created with the given
+    options, every thread calling `get` gets its own session.
+    """
+
+    def __init__(self, **options):
+        self._options = options
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._size = 0
+
+    def get(self):
+        try:
+            return self._local.parser
+        except AttributeError:
+            parser = self._local.parser = DateParser(**self._options)
+            with self._lock:
+                self._size += 1
+            return parser
+
+    def size(self):
+        """
+        Returns the number of sessions created.
+        """
+        return self._size
+
+    def parse_date(self, text, now=None, month_first=True, context=None, output="datetime"):
+        return self.get().parse_date(text, now=now, month_first=month_first, context=context, output=output)
+
+    def parse_datetime(self, text, now=None, month_first=True, default_tz=None, context=None, output="datetime"):
+        return self.get().parse_datetime(text, now=now, month_first=month_first, default_tz=default_tz,
+                                         context=context, output=output)
+
+    def parse_timezone(self, text):
+        return self.get().parse_timezone(text)
+
+    def try_parse_date(self, text, now=None, month_first=True, context=None, output="datetime"):
+        return self.get().try_parse_date(text, now=now, month_first=month_first, context=context, output=output)
+
+    def try_parse_datetime(self, text, now=None, month_first=True, default_tz=None, context=None,
+                           output="datetime"):
+        return self.get().try_parse_datetime(text, now=now, month_first=month_first, default_tz=default_tz,
+                                             context=context, output=output)
+
+    def parse_many(self, items, what="datetime", now=None, month_first=True, default_tz=None, context=None,
+                   output="datetime"):
+        return self.get().parse_many(items, what, now=now, month_first=month_first, default_tz=default_tz,
+                                     context=context, output=output)
+
+def parse_many(items, what="datetime", now=None, month_first=True, default_tz=None, context=None,
+               threads=None, chunksize=1000, pool=None, executor=None, output="datetime"):
+    """
+    Same as `friendlydateparser.parse_many` but spreading the distinct
+    inputs in chunks of `chunksize` over `threads` threads (or over the
+    given `executor`), each parsing with its session from `pool` (the
+    per-thread default sessions when not given). Results are returned
+    in input order.
+    """
+    if what not in ("date", "datetime", "timezone"):
+        raise ValueError(f"Invalid value for 'what' parameter: {what}")
+    _check_output(output)
+    now, month_first, default_tz = _resolve(now, month_first, default_tz, context)
+    get = _default_parser if pool is None else pool.get
+
+    def parse_chunk(chunk):
+        return get().parse_many(chunk, what, now=now, month_first=month_first, default_tz=default_tz,
+                                output=output)
+
+    items = list(items)
+    index = {}
+    for text in items:
+        if isinstance(text, str) and text not in index:
+            index[text] = len(index)
+    uniques = list(index)
+    chunks = [uniques[i:i + chunksize] for i in range(0, len(uniques), chunksize)]
+
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            parsed = list(executor.map(parse_chunk, chunks))
+    else:
+        parsed = list(executor.map(parse_chunk, chunks))
+
+    values = [v for chunk in parsed for v in chunk]
+    return [values[index[text]] if isinstance(text, str)
+            else ValueError(f"Invalid {what} {text!r}, a string was expected")
+            for text in items]
@@ -0,0 +1,248 @@
+"""
+Process-wide timezone cache and timezone backends.
+
+A backend turns zone names and fixed offsets into tzinfo objects:
+
+- `"pytz"` (the default) returns `pytz` zones and `pytz.FixedOffset`
+  objects, as earlier versions did.
+- `"zoneinfo"` returns `zoneinfo.ZoneInfo` zones and
+  `datetime.timezone` fixed offsets, and does not need `pytz`.
+
+Every backend keeps its own cache: zone names and abbreviations, fixed
+offsets and the texts given to `parse_timezone` are resolved once and
+then map to shared tzinfo singletons. Hits are plain dictionary reads,
+safe to do from any thread; concurrent misses may resolve the same key
+twice, but only the first result is kept.
+
+The zone libraries and the name index are only loaded when the first
+timezone is found, as most inputs do not have one.
+"""
+
+import threading
+from datetime import timedelta, timezone
+
+from friendlydateparser.tz_abbreviations import tz_abbreviations
+
+max_texts = 4096
+
+class _Backend:
+    """
+    Cache of the tzinfo objects of one backend. Subclasses provide the
+    zone names and build the zones and fixed offsets.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index = None
+        self._names = {}
+        self._offsets = {}
+        self._texts = {}
+
+    def _build_index(self):
+        # lowercase name -> zone name or offset in minutes, zone names
+        # take precedence over abbreviations
+        return {**{abv.lower(): offset for abv, offset in tz_abbreviations.items()},
+                **{name.lower(): name for name in self._zone_names()}}
+
+    def _get_index(self):
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._build_index()
+        return self._index
+
+    def from_name(self, name):
+        try:
+            return self._names[name]
+        except KeyError:
+            pass
+        try:
+            tz = self._get_index()[name]
+        except KeyError:
+            raise ValueError(f"Invalid timezone: unknown name '{name}'") from None
+        if isinstance(tz, int):
+            tz = self.from_offset(tz)
+        else:
+            tz = self._zone(tz)
+        return self._names.setdefault(name, tz)
+
+    def is_name(self, name):
+        return name in self._names or name in self._get_index()
+
+    def from_offset(self, minutes):
+        try:
+            return self._offsets[minutes]
+        except KeyError:
+            pass
+        return self._offsets.setdefault(minutes, self._fixed(minutes))
+
+    def lookup_text(self, text):
+        return self._texts.get(text.strip().lower())
+
+    def store_text(self, text, tz):
+        if len(self._texts) < max_texts:
+            self._texts.setdefault(text.strip().lower(), tz)
+
+    def clear(self):
+        self._names.clear()
+        self._offsets.clear()
+        self._texts.clear()
+
+    def from_code(self, code):
+        """
+        Returns the tzinfo for a code returned by `code`: a zone name or
+        an offset in minutes.
+        """
+        if isinstance(code, int):
+            return self.from_offset(code)
+        return self._zone(code)
+
+class PytzBackend(_Backend):
+    name = "pytz"
+
+    def _zone_names(self):
+        import pytz
+        return pytz.all_timezones
+
+    def _zone(self, name):
+        import pytz
+        return pytz.timezone(name)
+
+    def _fixed(self, minutes):
+        import pytz
+        return pytz.FixedOffset(minutes)
+
+    def code(self, tz):
+        """
+        Returns the zone name or the offset in minutes identifying `tz`
+        in `from_code`, or `None` when it is not one of the zones of the
+        backend.
+        """
+        import pytz
+        if isinstance(tz, pytz._FixedOffset):
+            return tz.utcoffset(None) // timedelta(minutes=1)
+        if isinstance(tz, pytz.BaseTzInfo) and tz.zone is not None:
+            return tz.zone
+        return None
+
+    def local_state(self, d):
+        # tells apart the two readings of an ambiguous local time
+        return bool(d.dst())
+
+    def attach(self, tz, d, state):
+        """
+        Attaches `tz` to the naive datetime `d` with the reading given
+        by `local_state`.
+        """
+        return tz.localize(d, is_dst=state)
+
+class ZoneInfoBackend(_Backend):
+    name = "zoneinfo"
+
+    def _zone_names(self):
+        import zoneinfo
+        return zoneinfo.available_timezones()
+
+    def _zone(self, name):
+        import zoneinfo
+        return zoneinfo.ZoneInfo(name)
+
+    def _fixed(self, minutes):
+        if minutes == 0:
+            return timezone.utc
+        return timezone(timedelta(minutes=minutes))
+
+    def code(self, tz):
+        import zoneinfo
+        if isinstance(tz, zoneinfo.ZoneInfo) and tz.key is not None:
+            return tz.key
+        if isinstance(tz, timezone):
+            return tz.utcoffset(None) // timedelta(minutes=1)
+        return None
+
+    def local_state(self, d):
+        return d.fold
+
+    def attach(self, tz, d, state):
+        return d.replace(tzinfo=tz, fold=state)
+
+_backends = { "pytz": PytzBackend(), "zoneinfo": ZoneInfoBackend() }
+_default = _backends["pytz"]
+
+def get_backend(name=None):
+    """
+    Returns the backend with the given name (`"pytz"` or `"zoneinfo"`),
+    or the default one when `name` is `None`.
+    """
+    if name is None:
+        return _default
+    if isinstance(name, _Backend):
+        return name
+    try:
+        return _backends[name]
+    except KeyError:
+        raise ValueError(f"Invalid timezone backend: {name}") from None
+
+def default_backend():
+    return _default
+
+def set_default_backend(name):
+    """
+    Selects the backend used by the module-level functions and by the
+    sessions created without an explicit one.
+    """
+    global _default
+    _default = get_backend(name)
+
+def localize(tz, d):
+    """
+    Attaches `tz` to the naive datetime `d`, using `localize` for pytz
+    zones and `replace` for any other tzinfo. Either way, local times
+    which are ambiguous or do not exist resolve to standard time.
+    """
+    if (localize := getattr(tz, 'localize', None)) is not None:
+        return localize(d)
+    aware = d.replace(tzinfo=tz)
+    if aware.dst():
+        # same as pytz with is_dst=False: the second occurrence of a
+        # repeated hour is the one in standard time
+        if not (later := d.replace(tzinfo=tz, fold=1)).dst():
+            return later
+    return aware
+
+def from_name(name, backend=None):
+    """
+    Returns the tzinfo for a lowercase zone name (`europe/paris`) or
+    abbreviation (`cest`, a fixed offset).
+    """
+    return get_backend(backend).from_name(name)
+
+def is_name(name, backend=None):
+    """
+    Tells whether the lowercase `name` is a known zone name or
+    abbreviation.
+    """
+    return get_backend(backend).is_name(name)
+
+def from_offset(minutes, backend=None):
+    """
+    Returns the fixed offset tzinfo for the given offset in minutes
+    (the backend's UTC singleton for zero).
+    """
+    return get_backend(backend).from_offset(minutes)
+
+def lookup_text(text, backend=None):
+    """
+    Returns the tzinfo stored for `text` by `store_text` or `None`.
+    """
+    return get_backend(backend).lookup_text(text)
+
+def store_text(text, tz, backend=None):
+    get_backend(backend).store_text(text, tz)
+
+def clear():
+    """
+    Empties the caches of all the backends.
+    """
+    for backend in _backends.values():
+        backend.clear()
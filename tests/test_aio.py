@@ -0,0 +1,122 @@
+import pytest
+import asyncio
+from datetime import datetime, date, timedelta
+from friendlydateparser import aio, parse_datetime, ParseContext
+from friendlydateparser.parallel import make_executor
+
+now = datetime(2023, 10, 12)
+
+def test_parse_date():
+    assert asyncio.run(aio.parse_date("tomorrow", now=now)) == date(2023, 10, 13)
+
+def test_parse_datetime():
+    result = asyncio.run(aio.parse_datetime("tomorrow at noon", now=now, default_tz="Europe/Paris"))
+    assert result == parse_datetime("tomorrow at noon", now=now, default_tz="Europe/Paris")
+
+def test_parse_timezone():
+    assert str(asyncio.run(aio.parse_timezone("Europe/Paris"))) == "Europe/Paris"
+
+def test_invalid_raises():
+    with pytest.raises(ValueError):
+        asyncio.run(aio.parse_date("tomorrow at", now=now))
+
+def test_parse_many():
+    result = asyncio.run(aio.parse_many(["tomorrow", "foo", "2023-01-01"], "date", now=now))
+    assert result[0] == date(2023, 10, 13)
+    assert isinstance(result[1], ValueError)
+    assert result[2] == date(2023, 1, 1)
+
+def test_context():
+    context = ParseContext(now, month_first=False)
+    assert asyncio.run(aio.parse_date("10/3/2017", context=context)) == date(2017, 3, 10)
+
+def test_requests_are_batched():
+    async def run(parser):
+        texts = [f"{i} days after tomorrow" for i in range(50)]
+        results = await asyncio.gather(*(parser.parse_date(t, now=now) for t in texts),
+                                       return_exceptions=True)
+        return texts, results
+    batches = []
+    parser = aio.AsyncParser(window=0.05, max_batch=20)
+    run_batch = parser._run
+    async def counting_run(items, args):
+        batches.append(len(items))
+        return await run_batch(items, args)
+    parser._run = counting_run
+    try:
+        texts, results = asyncio.run(run(parser))
+    finally:
+        parser.close()
+    assert batches == [20, 20, 10]
+    assert results == [date(2023, 10, 13) + timedelta(days=i) for i in range(50)]
+
+def test_clock_is_read_once_per_batch():
+    ticks = []
+    def clock():
+        ticks.append(1)
+        return now + timedelta(seconds=len(ticks))
+    context = ParseContext(clock=clock)
+    batches = []
+    parser = aio.AsyncParser(window=0.05)
+    run_batch = parser._run
+    async def counting_run(items, args):
+        batches.append(len(items))
+        return await run_batch(items, args)
+    parser._run = counting_run
+    async def run():
+        return await asyncio.gather(*(parser.parse_date(f"{i} days ago", context=context) for i in range(10)))
+    try:
+        results = asyncio.run(run())
+    finally:
+        parser.close()
+    assert batches == [10]
+    assert len(ticks) == 1
+    assert results == [date(2023, 10, 12) - timedelta(days=i) for i in range(10)]
+
+def test_parser_created_outside_the_loop():
+    parser = aio.AsyncParser()
+    try:
+        for _ in range(2):
+            # each run has its own loop
+            assert asyncio.run(parser.parse_date("tomorrow", now=now)) == date(2023, 10, 13)
+    finally:
+        parser.close()
+
+def test_different_arguments_are_not_mixed():
+    async def run():
+        return await asyncio.gather(aio.parse_date("10/3/2017", now=now, month_first=True),
+                                    aio.parse_date("10/3/2017", now=now, month_first=False))
+    assert asyncio.run(run()) == [date(2017, 10, 3), date(2017, 3, 10)]
+
+def test_process_executor():
+    executor = make_executor(1)
+    parser = aio.AsyncParser(executor)
+    try:
+        async def run():
+            return await asyncio.gather(parser.parse_datetime("tomorrow at noon europe/paris", now=now),
+                                        parser.parse_many(["2023-01-01", "foo"], "date"))
+        zoned, many = asyncio.run(run())
+    finally:
+        executor.shutdown()
+    assert zoned == parse_datetime("tomorrow at noon europe/paris", now=now)
+    assert many[0] == date(2023, 1, 1)
+    assert isinstance(many[1], ValueError)
+
+def test_event_loop_is_not_blocked():
+    # the latency itself is measured by benchmarks/bench_aio.py
+    async def run():
+        ticks = 0
+        done = False
+        async def ticker():
+            nonlocal ticks
+            while not done:
+                await asyncio.sleep(0.001)
+                ticks += 1
+        task = asyncio.ensure_future(ticker())
+        texts = [f"{i} weeks after the last day of next month at {i % 12 + 1}:15pm" for i in range(200)]
+        await asyncio.gather(*(aio.parse_datetime(t, now=now) for t in texts))
+        during = ticks
+        done = True
+        await task
+        return during
+    assert asyncio.run(run()) > 0
@@ -0,0 +1,164 @@
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from friendlydateparser import ordinal, parse_date
+from friendlydateparser.antlr.FriendlyDateVisitorPy import FriendlyDateVisitorPy
+
+# The index must give the same answers as datetime inside its range
+# and outside of it, and the week and day position rules evaluated with
+# it must match the date based algorithms used before.
+
+def week_one(year, month):
+    first = date(year, month, 1)
+    week = first - timedelta(days=first.weekday())
+    if first.weekday() > 3:
+        week += timedelta(days=7)
+    return week.toordinal()
+
+def next_month(year, month):
+    return (year + 1, 1) if month == 12 else (year, month + 1)
+
+@pytest.mark.parametrize("index", [
+    ordinal.CalendarIndex(),
+    ordinal.CalendarIndex(2000, 2001),
+    ordinal.CalendarIndex(9998, 9998),
+])
+def test_lookups(index):
+    for year in [1, 1582, 1899, 1900, 1999, 2000, 2001, 2002, 2024, 2100, 2200, 2201, 9998, 9999]:
+        for month in range(1, 13):
+            first = date(year, month, 1)
+            assert index.month_start(year, month) == first.toordinal()
+            assert index.first_weekday(year, month) == first.weekday()
+            assert index.month_length(year, month) == ordinal.month_length(year, month)
+            assert index.year_day(year, month) == first.timetuple().tm_yday - 1
+            assert index.week_one(year, month) == week_one(year, month)
+            end = date(*next_month(year, month), 1).toordinal() if (year, month) != (9999, 12) else \
+                date.max.toordinal() + 1
+            assert index.span(year, month) == (first.toordinal(), end)
+        assert index.span(year) == (date(year, 1, 1).toordinal(), index.span(year, 12)[1])
+
+def test_months_roll_over():
+    index = ordinal.CalendarIndex(2000, 2001)
+    assert index.month_start(2000, 13) == date(2001, 1, 1).toordinal()
+    assert index.month_start(2001, 13) == date(2002, 1, 1).toordinal()
+    assert index.week_one(2023, 13) == week_one(2024, 1)
+
+def test_tables_are_built_once():
+    index = ordinal.CalendarIndex(2000, 2009)
+    assert index._tables is None
+    index.month_start(1990, 1)
+    assert index._tables is None
+    index.month_start(2005, 6)
+    tables = index._tables
+    assert len(tables[0]) == 121 and all(len(t) == 120 for t in tables[1:])
+    index.week_one(2009, 12)
+    assert index._tables is tables
+
+@pytest.mark.parametrize("first_year, last_year", [(0, 2000), (2000, 1999), (1900, 9999)])
+def test_bad_ranges(first_year, last_year):
+    with pytest.raises(ValueError):
+        ordinal.CalendarIndex(first_year, last_year)
+
+def test_set_index_range():
+    default = ordinal.calendar_index
+    try:
+        ordinal.set_index_range(2020, 2030)
+        assert ordinal.calendar_index.first_year == 2020
+        assert parse_date("wed week 20 2018") == date(2018, 5, 16)
+        assert parse_date("wed week 20 2028") == date(2028, 5, 17)
+    finally:
+        ordinal.calendar_index = default
+
+# date based algorithms of the previous versions
+
+def by_week(year, month, week, weekday):
+    if week == -1:
+        week = 0
+        if month is None:
+            year += 1
+        elif month < 12:
+            month += 1
+        else:
+            month = 1
+            year += 1
+    first_day = date(year, month or 1, 1)
+    first_weekday = first_day.weekday()
+    if first_weekday <= 3:
+        week -= 1
+    monday = first_day + timedelta(days=7*week-first_weekday)
+    wednesday = monday + timedelta(days=3)
+    if wednesday.year > year or \
+       (month is not None and wednesday.year == year and wednesday.month > month):
+        raise ValueError("Invalid date: week value out of range")
+    return monday + timedelta(days=weekday)
+
+def by_day_position(year, month, day_position, weekday):
+    month1, year1 = month, year
+    if day_position == -1:
+        if month is None:
+            year += 1
+        elif month < 12:
+            month += 1
+        else:
+            month = 1
+            year += 1
+        day_position = 0
+    first_day = date(year, month or 1, 1)
+    if weekday is None:
+        d = first_day + timedelta(days=day_position-1)
+    else:
+        off = (weekday - first_day.weekday()) % 7
+        d = first_day + timedelta(days=off + 7*(day_position-1))
+    if d.year != year1 or (month1 is not None and d.month != month1):
+        raise ValueError("Invalid date: day ordinal out of range")
+    return d
+
+def outcome(f, *args):
+    try:
+        return f(*args)
+    except ValueError:
+        return ValueError
+
+def random_year(rnd):
+    return rnd.choice([rnd.randint(1899, 1901), rnd.randint(2199, 2201), rnd.randint(2, 9998)])
+
+visitor = FriendlyDateVisitorPy(now=datetime(2023, 10, 12), month_first=True, default_tz=None)
+
+@pytest.mark.parametrize("seed", range(3))
+def test_weeks(seed):
+    rnd = random.Random(seed)
+    for _ in range(3000):
+        year, month = random_year(rnd), rnd.choice([None, rnd.randint(1, 12)])
+        week, weekday = rnd.choice([-1, rnd.randint(1, 6), rnd.randint(1, 54)]), rnd.randint(0, 6)
+        r = {'year': year, 'week': week, 'weekday': weekday}
+        if month is not None:
+            r['month'] = month
+        assert outcome(visitor._make_date_absolute_by_week, r) == outcome(by_week, year, month, week, weekday)
+
+@pytest.mark.parametrize("seed", range(3))
+def test_day_positions(seed):
+    rnd = random.Random(seed)
+    for _ in range(3000):
+        year, month = random_year(rnd), rnd.choice([None, rnd.randint(1, 12)])
+        weekday = rnd.choice([None, rnd.randint(0, 6)])
+        day_position = rnd.choice([-1, rnd.randint(1, 6), rnd.randint(1, 60), rnd.randint(1, 367)])
+        r = {'year': year, 'day_position': day_position}
+        if month is not None:
+            r['month'] = month
+        if weekday is not None:
+            r['weekday'] = weekday
+        assert outcome(visitor._make_date_absolute_by_day_position, r) == \
+            outcome(by_day_position, year, month, day_position, weekday)
+
+@pytest.mark.parametrize("text, expected", [
+    ("monday week 45 1850", date(1850, 11, 4)),
+    ("wed week 20 2318", date(2318, 5, 15)),
+    ("last week of 9998", date(9998, 12, 28)),
+    ("the last friday of december 9999", date(9999, 12, 31)),
+    ("the 1st monday of december 9999", date(9999, 12, 6)),
+    ("the 100th day of 1600", date(1600, 4, 9)),
+])
+def test_outside_the_index(text, expected):
+    assert parse_date(text) == expected
@@ -0,0 +1,43 @@
+import io
+import sys
+from friendlydateparser.__main__ import main
+
+def _run(capsysbinary, monkeypatch, argv, stdin=None):
+    if stdin is not None:
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(stdin.encode())))
+    status = main(argv)
+    out, err = capsysbinary.readouterr()
+    return status, out.decode(), err.decode()
+
+def test_stdin_iso(capsysbinary, monkeypatch):
+    status, out, err = _run(capsysbinary, monkeypatch, ["--now", "2023-10-12"],
+                            stdin="tomorrow at noon\n15\n2h ago\n")
+    assert status == 0
+    assert out == "2023-10-13T12:00:00\n\n2023-10-11T22:00:00\n"
+    assert err == ""
+
+def test_files_epoch_with_error_column(capsysbinary, monkeypatch, tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1970-01-02\r\nfoo\n1969-12-31T23:59:59.5Z")
+    empty = tmp_path / "empty.txt"
+    empty.write_text("")
+    status, out, err = _run(capsysbinary, monkeypatch,
+                            ["--format", "epoch", "--error-column", "--strict", "--stats",
+                             str(path), str(empty)])
+    lines = out.split("\n")
+    assert lines[0] == "86400\t"
+    assert lines[1].startswith("\tInvalid datetime 'foo'")
+    assert lines[2] == "-0.5\t"
+    assert status == 1
+    assert "3 lines, 1 errors" in err
+
+def test_kind_and_options(capsysbinary, monkeypatch):
+    status, out, err = _run(capsysbinary, monkeypatch,
+                            ["--kind", "date", "--month-first", "false", "--batch-size", "1"],
+                            stdin="10/3/2017\n3/october/2017\n")
+    assert out == "2017-03-10\n2017-10-03\n"
+
+def test_default_tz(capsysbinary, monkeypatch):
+    status, out, err = _run(capsysbinary, monkeypatch, ["--default-tz", "europe/paris"],
+                            stdin="2023-01-01 at noon\n")
+    assert out == "2023-01-01T12:00:00+01:00\n"
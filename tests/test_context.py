@@ -0,0 +1,68 @@
+import pytest
+from datetime import datetime, date
+from friendlydateparser import (DateParser, ParseContext, parse_date, parse_datetime, parse_many,
+                                try_parse_datetime, parse_timezone)
+from friendlydateparser.antlr.FriendlyDateVisitorPy import FriendlyDateVisitorPy
+
+now = datetime(2023, 10, 12)
+
+def test_resolved_once():
+    context = ParseContext("2023-10-12 10:00", "locale", "Europe/Paris")
+    assert context.now == parse_datetime("2023-10-12 10:00", default_tz="Europe/Paris")
+    assert context.month_first in (True, False)
+    assert context.default_tz is parse_timezone("europe/paris")
+    assert context.resolve() == (context.now, context.month_first, context.default_tz)
+
+def test_immutable():
+    context = ParseContext(now)
+    with pytest.raises(AttributeError):
+        context.now = datetime(2024, 1, 1)
+
+def test_clock():
+    ticks = iter([datetime(2023, 1, 1), datetime(2024, 1, 1)])
+    context = ParseContext(clock=lambda: next(ticks))
+    assert context.now is None
+    assert parse_date("tomorrow", context=context) == date(2023, 1, 2)
+    assert parse_date("tomorrow", context=context) == date(2024, 1, 2)
+
+def test_default_clock():
+    assert parse_date("today", context=ParseContext()) == date.today()
+
+@pytest.mark.parametrize("text, month_first, expected", [
+    ("10/3/2017", True, datetime(2017, 10, 3)),
+    ("10/3/2017", False, datetime(2017, 3, 10)),
+    ("the first of next month", True, datetime(2023, 11, 1)),
+])
+def test_same_as_arguments(text, month_first, expected):
+    context = ParseContext(now, month_first)
+    assert parse_datetime(text, context=context) == expected
+    assert parse_datetime(text, now=now, month_first=month_first) == expected
+    assert DateParser().parse_datetime(text, context=context) == expected
+    assert try_parse_datetime(text, context=context) == expected
+    assert parse_many([text], context=context) == [expected]
+
+def test_default_tz():
+    context = ParseContext(now, default_tz="Europe/Paris")
+    result = parse_datetime("tomorrow at noon", context=context)
+    assert result.tzinfo.zone == "Europe/Paris"
+    assert result == parse_datetime("tomorrow at noon", now=now, default_tz="Europe/Paris")
+
+def test_no_resolution_per_call():
+    context = ParseContext("2023-10-12", default_tz="Europe/Paris")
+    parser = DateParser()
+    compiled = []
+    compile = parser.compile
+    parser.compile = lambda *args: compiled.append(args[0]) or compile(*args)
+    for _ in range(3):
+        parser.parse_date("tomorrow", context=context)
+    assert compiled == ["tomorrow"] * 3
+
+def test_evaluate():
+    parser = DateParser()
+    plan = parser.compile("tomorrow", "date")
+    assert parser.evaluate(plan, context=ParseContext(now)) == date(2023, 10, 13)
+
+def test_visitor():
+    visitor = FriendlyDateVisitorPy(context=ParseContext(now, False))
+    assert visitor._now == now
+    assert visitor._month_first is False
@@ -0,0 +1,65 @@
+import pytest
+from datetime import datetime, date
+from friendlydateparser import find_dates, parse_datetime, ParseContext
+from friendlydateparser.extract import DateExtractor
+
+now = datetime(2023, 10, 12)
+
+documents = [
+    ("Let's meet tomorrow at noon, or next friday at 10:00 cest.",
+     [("tomorrow at noon", "tomorrow at noon"),
+      ("next friday at 10:00 cest", "next friday at 10:00 cest")]),
+    ("Ticket opened 3 days ago; deadline: the last day of next month (see 2024-01-31)!",
+     [("3 days ago", "3 days ago"),
+      ("the last day of next month", "the last day of next month"),
+      ("2024-01-31", "2024-01-31")]),
+    ("May 3 hello, the meeting on 10/3/2017 14:30 Europe/Paris was moved",
+     [("May 3", "May 3"),
+      ("10/3/2017 14:30 Europe/Paris", "10/3/2017 14:30 Europe/Paris")]),
+    ("İstanbul closes on December 24th at 5pm.", [("December 24th", "December 24th")]),
+    ("from 3 may 2024 to 5 may 2024", [("3 may 2024", "3 may 2024"), ("5 may 2024", "5 may 2024")]),
+    ("2024-01-31t10:00z,2024-02-01", [("2024-01-31t10:00z", "2024-01-31t10:00z"),
+                                      ("2024-02-01", "2024-02-01")]),
+    ("nothing to see here", []),
+    ("see you at 5", []),
+    ("", []),
+]
+
+@pytest.mark.parametrize("text, expected", documents)
+def test_find_dates(text, expected):
+    matches = list(find_dates(text, now=now))
+    assert [text[start:end] for start, end, _ in matches] == [span for span, _ in expected]
+    assert [value for _, _, value in matches] == [parse_datetime(source, now=now) for _, source in expected]
+
+def test_dates():
+    text = "the report from march 15, 2024 at 10:00 is late"
+    assert list(find_dates(text, "date", now=now)) == [(16, 30, date(2024, 3, 15))]
+
+def test_month_first():
+    assert [v for _, _, v in find_dates("due 10/3/2017.", now=now, month_first=False)] == [datetime(2017, 3, 10)]
+    context = ParseContext(now, month_first=False)
+    assert [v for _, _, v in find_dates("due 10/3/2017.", context=context)] == [datetime(2017, 3, 10)]
+
+def test_invalid_date_shrinks():
+    assert [(s, e) for s, e, _ in find_dates("on december 24th at 5pm", now=now)] == [(3, 16)]
+
+def test_out_of_range_is_not_a_match():
+    text = "it was 999999999 days ago, then 999999999 weeks ago, tomorrow and 3 days ago"
+    assert [v for _, _, v in find_dates(text, now=now)] == [datetime(2023, 10, 13), datetime(2023, 10, 9)]
+    assert [v for _, _, v in find_dates(text, what="date", now=now)] == [date(2023, 10, 13), date(2023, 10, 9)]
+
+def test_interleaved_generators():
+    extractor = DateExtractor()
+    a = extractor.find("tomorrow and 2024-01-31 and next monday", now=now)
+    b = extractor.find("yesterday or 2023-01-01", now=now)
+    results = [next(a), next(b), next(a), next(b), next(a)]
+    assert [r[2] for r in results] == [datetime(2023, 10, 13), datetime(2023, 10, 11), datetime(2024, 1, 31),
+                                       datetime(2023, 1, 1), datetime(2023, 10, 16)]
+
+def test_no_stderr(capsys):
+    list(find_dates("weird ¿chars? ~ @ #1 and tomorrow", now=now))
+    assert capsys.readouterr().err == ""
+
+def test_invalid_what():
+    with pytest.raises(ValueError):
+        DateExtractor("timezone")
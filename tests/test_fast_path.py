@@ -0,0 +1,79 @@
+import pytest
+from friendlydateparser import DateParser
+from friendlydateparser.cache import PlanCache
+from friendlydateparser.fastpath import compile_fast
+
+import test_parse_date
+import test_parse_datetime
+import test_parse_timezone
+
+now = "2023-10-12"
+
+shapes = [
+    "2024-12-31T13:01+02:00",
+    "2024-12-31T13:01:59.123456789-2",
+    "2024-12-31T13:01:05.Z",
+    "2024-12-31t00:00-11:30",
+    "2024-12-31T13:01+0200",
+    "2024-12-31T13:01",
+    "2024-12-31T24:01Z",
+    "2024-12-31T13:60Z",
+    "2024-12-31T13:01+40:00",
+    "2024-1-5",
+    "2024-02-30",
+    "2024-13-01",
+    "20240131",
+    "20230229",
+    "20241301",
+    "20241232",
+    "10/3/2017 14:30",
+    "10/3/2017 2:30:15.5",
+    "10-3-2017 14:30",
+    "10/3-2017",
+    "10/3 9:05",
+    "10/3",
+    "31/12/2017",
+    "13/13/2017",
+    "10/3/2017 24:00",
+    "10/3/2017 14:61",
+    "10/3/17",
+    "  2023-10-12 ",
+    "2024-12-31 13:01",
+    "١٠/٣/٢٠١٧",
+]
+
+corpus = sorted({text for text, *_ in test_parse_date.dates} |
+                {text for text, *_ in test_parse_datetime.datetimes} |
+                {text for text, *_ in test_parse_timezone.datetimes} |
+                set(shapes))
+
+def _outcome(parser, what, text, month_first):
+    try:
+        if what == "date":
+            return parser.parse_date(text, now=now, month_first=month_first)
+        return parser.parse_datetime(text, now=now, month_first=month_first, default_tz="UTC")
+    except ValueError:
+        return ValueError
+
+@pytest.mark.parametrize("month_first", [True, False])
+@pytest.mark.parametrize("what", ["date", "datetime"])
+@pytest.mark.parametrize("text", corpus)
+def test_fast_path_matches_grammar(text, what, month_first):
+    fast = DateParser(cache=PlanCache(), fast_path=True)
+    slow = DateParser(cache=PlanCache(), fast_path=False)
+    assert _outcome(fast, what, text, month_first) == _outcome(slow, what, text, month_first)
+
+recognized = [
+    "2024-12-31T13:01+02:00",
+    "2024-12-31T13:01:59.123456789-2",
+    "2024-1-5",
+    "20240131",
+    "10/3/2017 14:30",
+    "10/3",
+    "  2023-10-12 ",
+]
+
+@pytest.mark.parametrize("text", recognized)
+def test_fast_path_recognizes(text):
+    parser = DateParser()
+    assert compile_fast(parser._visitor, text.lower(), "datetime", True) is not None
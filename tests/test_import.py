@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+import friendlydateparser
+
+# cumulative import time allowed for `import friendlydateparser`, in
+# microseconds; loading the grammar eagerly takes well over 100ms
+budget = 50000
+
+lazy_modules = [
+    "antlr4",
+    "friendlydateparser.antlr.FriendlyDateLexer",
+    "friendlydateparser.antlr.FriendlyDateParser",
+    "friendlydateparser.antlr.FriendlyDateVisitorPy",
+    "pytz",
+    "dateutil",
+    "logging",
+]
+
+def _run(code, *options):
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(friendlydateparser.__file__))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    return subprocess.run([sys.executable, *options, "-c", code], env=env,
+                          capture_output=True, text=True, check=True)
+
+def test_import_does_not_load_grammar_nor_tz():
+    out = _run("import sys, friendlydateparser\n"
+               f"print(' '.join(m for m in {lazy_modules!r} if m in sys.modules))").stdout
+    assert out.split() == []
+
+def test_first_parse_loads_grammar():
+    out = _run("import sys, friendlydateparser\n"
+               "friendlydateparser.parse_date('tomorrow')\n"
+               "print('antlr4' in sys.modules, 'pytz' in sys.modules)").stdout
+    assert out.split() == ["True", "False"]
+
+def test_import_time():
+    err = _run("import friendlydateparser", "-X", "importtime").stderr
+    for line in err.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == "friendlydateparser":
+            cumulative = int(fields[1])
+            break
+    else:
+        raise AssertionError(f"friendlydateparser not found in -X importtime output:\n{err}")
+    assert cumulative < budget, f"import took {cumulative}us"
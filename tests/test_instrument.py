@@ -0,0 +1,60 @@
+import pytest
+from friendlydateparser import DateParser, instrument
+from friendlydateparser.cache import PlanCache
+from datetime import datetime
+
+now = datetime(2023, 10, 12)
+
+@pytest.fixture
+def events():
+    events = []
+    instrument.add_hook(events.append)
+    yield events
+    instrument.remove_hook(events.append)
+    instrument.set_sample_rate(1.0)
+
+rules = [
+    ("wed week 20 2018", "dateWithWeek"),
+    ("the last day of next month", "dateRelativeMonth"),
+    ("2h ago", "dateTimeDelta"),
+    ("tomorrow at noon europe/paris", "tomorrow"),
+    ("march 15, 2017 11:59 pm", "dateMonthAsName"),
+]
+
+@pytest.mark.parametrize("text, rule", rules)
+def test_grammar_events(events, text, rule):
+    parser = DateParser(cache=PlanCache())
+    parser.parse_datetime(text, now=now)
+    event, = events
+    assert event.source == "grammar"
+    assert event.rule == rule
+    assert event.tokens > 0
+    assert event.lex > 0 and event.parse > 0 and event.visit > 0 and event.evaluate > 0
+    assert event.total >= event.lex + event.parse + event.visit + event.evaluate
+    assert event.error is None
+
+def test_sources(events):
+    parser = DateParser(cache=PlanCache())
+    for text in ("next friday", "next friday", "2024-01-01"):
+        parser.parse_datetime(text, now=now)
+    assert [e.source for e in events] == ["grammar", "cache", "fast"]
+    assert events[2].tz == 0
+    parser.parse_datetime("next friday", now=now, default_tz="europe/paris")
+    assert events[-1].tz > 0
+
+def test_errors(events):
+    parser = DateParser()
+    with pytest.raises(ValueError):
+        parser.parse_date("mondays", now=now)
+    assert events[0].error.startswith("Invalid date 'mondays'")
+
+def test_toggle_and_sampling(events):
+    parser = DateParser()
+    instrument.set_sample_rate(0.0)
+    parser.parse_date("today", now=now)
+    assert events == []
+    instrument.set_sample_rate(1.0)
+    instrument.remove_hook(events.append)
+    parser.parse_date("today", now=now)
+    instrument.add_hook(events.append)
+    assert events == []
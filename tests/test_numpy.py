@@ -0,0 +1,90 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from friendlydateparser import try_parse_date, try_parse_datetime
+from friendlydateparser.numpy import parse_array, evaluate_array, _units
+
+now = "2023-10-12"
+
+def test_parse_datetime_array():
+    arr = np.array(["2h ago", "15", "jan 1, 2017 at 14:30", "2h ago"])
+    result = parse_array(arr, now=now)
+    assert result.dtype == np.dtype("datetime64[us]")
+    expected = np.array(["2023-10-11T22:00", "NaT", "2017-01-01T14:30", "2023-10-11T22:00"], dtype="datetime64[us]")
+    np.testing.assert_array_equal(result, expected)
+    np.testing.assert_array_equal(np.isnat(result), [False, True, False, False])
+
+def test_parse_date_array_keeps_shape():
+    arr = np.array([["tomorrow", "yesterday"], ["tomorrow", "nope"]])
+    result = parse_array(arr, kind="date", now=now)
+    assert result.dtype == np.dtype("datetime64[D]")
+    expected = np.array([["2023-10-13", "2023-10-11"], ["2023-10-13", "NaT"]], dtype="datetime64[D]")
+    np.testing.assert_array_equal(result, expected)
+
+def test_aware_results_are_converted_to_utc():
+    result = parse_array(["jul 3rd 2023 at noon cest", "jul 3rd 2023 at noon"], now=now, default_tz="UTC")
+    expected = np.array(["2023-07-03T10:00", "2023-07-03T12:00"], dtype="datetime64[us]")
+    np.testing.assert_array_equal(result, expected)
+
+def test_object_arrays():
+    result = parse_array(np.array(["2017", None, 3.5], dtype=object), kind="date", now=now)
+    np.testing.assert_array_equal(result, np.array(["2017-01-01", "NaT", "NaT"], dtype="datetime64[D]"))
+
+def test_invalid_kind():
+    with pytest.raises(ValueError):
+        parse_array(["europe/paris"], kind="timezone")
+
+nows = np.array(["2024-01-31T10:00", "2023-12-31T23:00", "2024-02-29", "NaT"], dtype="datetime64[us]")
+
+@pytest.mark.parametrize("text, kind, expected", [
+    ("the last friday of next month", "date", ["2024-02-23", "2024-01-26", "2024-03-29", "NaT"]),
+    ("2 days before the first of next month", "date", ["2024-01-30", "2023-12-30", "2024-02-28", "NaT"]),
+    ("the 31st of next month", "date", ["NaT", "2024-01-31", "2024-03-31", "NaT"]),
+    ("1 month after today", "date", ["2024-02-29", "2024-01-31", "2024-03-29", "NaT"]),
+    ("next monday", "date", ["2024-02-05", "2024-01-01", "2024-03-04", "NaT"]),
+    ("week 1 next year", "date", ["2024-12-30", "2024-01-01", "2024-12-30", "NaT"]),
+    ("the 2nd tuesday of last month", "date", ["2023-12-12", "2023-11-14", "2024-01-09", "NaT"]),
+    ("2 hours ago", "datetime", ["2024-01-31T08:00", "2023-12-31T21:00", "2024-02-28T22:00", "NaT"]),
+    ("tomorrow at 10:00 cest", "datetime", ["2024-02-01T08:00", "2024-01-01T08:00", "2024-03-01T08:00", "NaT"]),
+    ("tomorrow at 10:00 europe/madrid", "datetime", ["2024-02-01T09:00", "2024-01-01T09:00", "2024-03-01T09:00", "NaT"]),
+])
+def test_evaluate_array(text, kind, expected):
+    result = evaluate_array(text, nows, kind=kind)
+    np.testing.assert_array_equal(result, np.array(expected, dtype=f"datetime64[{_units[kind]}]"))
+
+def test_evaluate_array_matches_parse():
+    days = np.arange("2023-01-01", "2025-01-01", dtype="datetime64[D]")
+    texts = ["the last friday of next month", "the last day of next year", "last monday",
+             "the 5th wednesday of next month", "friday week 5 of this month", "feb 29"]
+    for text in texts:
+        expected = [try_parse_date(text, now=now) for now in days.tolist()]
+        np.testing.assert_array_equal(evaluate_array(text, days, kind="date"),
+                                      np.array(["NaT" if d is None else d for d in expected],
+                                               dtype="datetime64[D]"))
+
+@pytest.mark.parametrize("kind", ["date", "datetime"])
+def test_evaluate_array_at_the_ends_of_the_calendar(kind):
+    # results before year 1 or after year 9999 are NaT
+    days = np.concatenate([np.arange("0001-01-01", "0001-02-15", dtype="datetime64[D]"),
+                           np.arange("9999-11-15", "10000-01-01", dtype="datetime64[D]")])
+    nows = days.astype("datetime64[us]") + np.timedelta64(23, "h")
+    texts = ["tomorrow", "yesterday", "next friday", "last friday", "monday next week", "last week",
+             "last year", "next month", "week 1 last year", "the last friday of next month",
+             "2 weeks after tomorrow", "1 month before today", "999999999 days ago"]
+    if kind == "datetime":
+        texts += ["3 hours ago", "tomorrow at noon", "2 days after tomorrow at 23:00", "999999999 weeks ago"]
+    parse = try_parse_date if kind == "date" else try_parse_datetime
+    for text in texts:
+        expected = [parse(text, now=now) for now in nows.tolist()]
+        np.testing.assert_array_equal(evaluate_array(text, nows, kind=kind),
+                                      np.array(["NaT" if d is None else d for d in expected],
+                                               dtype=f"datetime64[{_units[kind]}]"), err_msg=text)
+
+def test_evaluate_array_keeps_shape():
+    result = evaluate_array("tomorrow", [["2023-10-12", "2023-10-13"]], kind="date")
+    np.testing.assert_array_equal(result, np.array([["2023-10-13", "2023-10-14"]], dtype="datetime64[D]"))
+
+def test_evaluate_array_syntax_error():
+    with pytest.raises(ValueError):
+        evaluate_array("the day after the day", nows)
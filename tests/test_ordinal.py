@@ -0,0 +1,109 @@
+import calendar
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from friendlydateparser import ordinal
+
+# Property tests: the results of the ordinal core must match dateutil
+# for randomly drawn dates and deltas (with a fixed seed), including
+# month ends, leap days and both ends of the supported range.
+
+fields = ["years", "months", "weeks", "days", "hours", "minutes", "seconds", "microseconds"]
+
+def random_date(rnd):
+    choice = rnd.random()
+    if choice < 0.05:
+        year = rnd.choice([1, 2, 9998, 9999])
+    else:
+        year = rnd.randint(1, 9999)
+    month = rnd.randint(1, 12)
+    last_day = calendar.monthrange(year, month)[1]
+    day = last_day - rnd.randint(0, 3) if choice < 0.5 else rnd.randint(1, last_day)
+    return date(year, month, day)
+
+def random_datetime(rnd):
+    return datetime.combine(random_date(rnd), datetime.min.time()) + \
+        timedelta(microseconds=rnd.randrange(86_400_000_000))
+
+def random_fields(rnd, names):
+    scale = rnd.choice([2, 30, 400, 20000])
+    return {name: rnd.randint(-scale, scale) for name in names if rnd.random() < 0.5}
+
+def outcome(f):
+    # dateutil raises OverflowError or ValueError for results out of
+    # range, ordinal always ValueError
+    try:
+        return f()
+    except (ValueError, OverflowError):
+        return ValueError
+
+def draws(seed, count=3000):
+    # the same generator, once per case
+    rnd = random.Random(seed)
+    for _ in range(count):
+        yield rnd
+
+def test_month_length():
+    for year in [*range(1, 2401), 9999]:
+        for month in range(1, 13):
+            assert ordinal.month_length(year, month) == calendar.monthrange(year, month)[1]
+
+@pytest.mark.parametrize("month", [0, 13, -1])
+def test_month_length_out_of_range(month):
+    with pytest.raises(ValueError):
+        ordinal.month_length(2024, month)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_shift_months(seed):
+    for rnd in draws(seed):
+        d = random_date(rnd)
+        months = rnd.randint(-30000, 30000) if rnd.random() < 0.1 else rnd.randint(-40, 40)
+        assert outcome(lambda: ordinal.shift_months(d, months)) == \
+            outcome(lambda: d + relativedelta(months=months)), (d, months)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_shift_days_and_weekdays(seed):
+    for rnd in draws(seed):
+        d = random_date(rnd)
+        days = rnd.randint(-400, 400)
+        weekday = rnd.randint(0, 6)
+        assert outcome(lambda: ordinal.shift_days(d, days)) == outcome(lambda: d + relativedelta(days=days))
+        assert outcome(lambda: ordinal.this_weekday(d, weekday)) == \
+            outcome(lambda: d - relativedelta(days=d.weekday() - weekday))
+
+@pytest.mark.parametrize("seed", range(5))
+def test_date_deltas(seed):
+    for rnd in draws(seed):
+        d = random_date(rnd)
+        kwargs = random_fields(rnd, fields[:4])
+        delta = ordinal.delta(**kwargs)
+        rd = relativedelta(**kwargs)
+        added = outcome(lambda: ordinal.add(d, delta))
+        assert added == outcome(lambda: d + rd), (d, kwargs)
+        assert type(added) is type(outcome(lambda: d + rd))
+        assert outcome(lambda: ordinal.subtract(d, delta)) == outcome(lambda: d - rd), (d, kwargs)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_datetime_deltas(seed):
+    for rnd in draws(seed):
+        d = random_datetime(rnd)
+        kwargs = random_fields(rnd, fields)
+        delta = ordinal.delta(**kwargs)
+        rd = relativedelta(**kwargs)
+        assert outcome(lambda: ordinal.add(d, delta)) == outcome(lambda: d + rd), (d, kwargs)
+        assert outcome(lambda: ordinal.subtract(d, delta)) == outcome(lambda: d - rd), (d, kwargs)
+
+@pytest.mark.parametrize("kwargs", [
+    {"hours": 24}, {"hours": 25, "minutes": -60}, {"hours": -48}, {"hours": 1},
+    {"seconds": 86400}, {"minutes": 1439, "seconds": 60}, {"microseconds": -1},
+])
+def test_time_deltas_on_dates(kwargs):
+    # a whole number of days keeps a date, anything else gives a datetime
+    d = date(2024, 2, 29)
+    result = ordinal.add(d, ordinal.delta(**kwargs))
+    expected = d + relativedelta(**kwargs)
+    assert result == expected
+    assert type(result) is type(expected)
@@ -0,0 +1,86 @@
+import pickle
+from datetime import date, datetime, timezone, timedelta
+
+import pytest
+import pytz
+
+from friendlydateparser import (DateParser, parse_date, parse_datetime, parse_many, try_parse_datetime,
+                                outputs)
+from friendlydateparser.corpus import warmup_corpus
+
+now = datetime(2023, 10, 12, 9, 15)
+epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def convert(value, output):
+    # reference conversion of a datetime or date result
+    if output == "datetime":
+        return value
+    if output == "ordinal":
+        return value.toordinal()
+    if output == "iso":
+        return value.isoformat()
+    if not isinstance(value, datetime):
+        if output == "epoch_us":
+            return (value.toordinal() - date(1970, 1, 1).toordinal()) * 86_400_000_000
+        return (value.year, value.month, value.day)
+    if output == "epoch_us":
+        aware = value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+        return (aware - epoch) // timedelta(microseconds=1)
+    offset = value.utcoffset()
+    return (value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond,
+            None if offset is None else offset // timedelta(minutes=1))
+
+@pytest.mark.parametrize("text, output, expected", [
+    ("tomorrow", "ordinal", date(2023, 10, 13).toordinal()),
+    ("tomorrow", "iso", "2023-10-13"),
+    ("tomorrow", "tuple", (2023, 10, 13)),
+    ("1970-01-02", "epoch_us", 86_400_000_000),
+])
+def test_date_outputs(text, output, expected):
+    assert parse_date(text, now=now, output=output) == expected
+
+@pytest.mark.parametrize("text, default_tz, output, expected", [
+    ("2 hours ago", None, "iso", "2023-10-12T07:15:00"),
+    ("2 hours ago", "europe/madrid", "iso", "2023-10-12T07:15:00+02:00"),
+    ("tomorrow at 10:00 cest", None, "tuple", (2023, 10, 13, 10, 0, 0, 0, 120)),
+    ("jan 1 2023 at 10:00:00.25 europe/madrid", None, "tuple", (2023, 1, 1, 10, 0, 0, 250000, 60)),
+    ("1970-01-01T01:00:00+01:00", None, "epoch_us", 0),
+    ("1970-01-01 00:00:01", None, "epoch_us", 1_000_000),
+    ("tomorrow at 23:30 -03:30", None, "ordinal", date(2023, 10, 13).toordinal()),
+    ("tomorrow at 10:00 utc", None, "iso", "2023-10-13T10:00:00+00:00"),
+])
+def test_datetime_outputs(text, default_tz, output, expected):
+    assert parse_datetime(text, now=now, default_tz=default_tz, output=output) == expected
+
+@pytest.mark.parametrize("output", outputs)
+@pytest.mark.parametrize("default_tz", [None, "europe/madrid"])
+def test_outputs_match_datetime_results(output, default_tz):
+    parser = DateParser()
+    for what in ("date", "datetime"):
+        values = parser.parse_many(warmup_corpus, what, now=now, default_tz=default_tz)
+        converted = parser.parse_many(warmup_corpus, what, now=now, default_tz=default_tz, output=output)
+        for text, value, result in zip(warmup_corpus, values, converted):
+            if isinstance(value, ValueError):
+                assert isinstance(result, ValueError), text
+            else:
+                assert result == convert(value, output), text
+
+def test_aware_now():
+    aware_now = pytz.timezone("europe/madrid").localize(now)
+    assert parse_datetime("now", now=aware_now, output="iso") == "2023-10-12T09:15:00+02:00"
+    assert parse_datetime("now", now=aware_now, output="epoch_us") == \
+        (aware_now - epoch) // timedelta(microseconds=1)
+
+def test_results_pickle_compactly():
+    texts = [f"{n} days ago" for n in range(100)]
+    values = parse_many(texts, now=now, default_tz="europe/madrid")
+    encoded = parse_many(texts, now=now, default_tz="europe/madrid", output="epoch_us")
+    assert len(pickle.dumps(encoded)) < len(pickle.dumps(values)) / 2
+
+def test_invalid_output():
+    with pytest.raises(ValueError):
+        parse_date("today", output="string")
+    with pytest.raises(ValueError):
+        try_parse_datetime("today", output="string")
+    with pytest.raises(ValueError):
+        parse_many(["today"], output="string")
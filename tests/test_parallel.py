@@ -0,0 +1,98 @@
+import pytest
+from friendlydateparser import parse_many, parse_datetime, parse_timezone
+from friendlydateparser import tz as tz_cache
+from friendlydateparser.parallel import make_executor, _encode, _decode
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+import pytz
+
+import test_parse_date
+import test_parse_datetime
+
+now = "2023-10-12"
+
+def _same(a, b):
+    if isinstance(a, ValueError):
+        return isinstance(b, ValueError) and str(a) == str(b)
+    return a == b and type(a) is type(b) and getattr(a, 'tzinfo', None) is getattr(b, 'tzinfo', None)
+
+@pytest.mark.parametrize("what, corpus", [("date", test_parse_date.dates),
+                                          ("datetime", test_parse_datetime.datetimes)])
+def test_parallel_matches_serial(what, corpus):
+    items = [text for text, *_ in corpus] * 3 + [None]
+    serial = parse_many(items, what, now=now, default_tz="Europe/Madrid")
+    parallel = parse_many(items, what, now=now, default_tz="Europe/Madrid", workers=2, chunksize=7)
+    assert len(serial) == len(parallel)
+    for a, b in zip(serial, parallel):
+        assert _same(a, b)
+
+def test_reused_executor():
+    with make_executor(2) as executor:
+        from friendlydateparser.parallel import parse_many as parse_many_parallel
+        for _ in range(2):
+            result = parse_many_parallel(["now", "europe/paris", "+01:30"], "timezone", executor=executor)
+            assert result[1] is pytz.timezone("Europe/Paris")
+            assert result[2] == pytz.FixedOffset(90)
+            assert isinstance(result[0], ValueError)
+
+def test_shared_executor(monkeypatch):
+    from friendlydateparser import parallel
+    calls = []
+    monkeypatch.setattr(parallel, "warmup", lambda: calls.append(1))
+    monkeypatch.setattr(parallel, "_warm", False)
+    parallel.shutdown()
+    try:
+        for _ in range(3):
+            assert parse_many(["tomorrow", "15"], "date", now=now, workers=2)[0] == date(2023, 10, 13)
+        assert list(parallel._executors) == [2]
+        executor = parallel._executors[2]
+        parse_many(["tomorrow"], "date", now=now, workers=2)
+        assert parallel._executors[2] is executor
+        assert calls == [1]
+    finally:
+        parallel.shutdown()
+    assert parallel._executors == {}
+
+madrid = ZoneInfo("Europe/Madrid")
+
+values = [
+    ("pytz", datetime(2023, 10, 29, 2, 30)),
+    ("pytz", pytz.timezone("Europe/Madrid").localize(datetime(2023, 10, 29, 2, 30), is_dst=True)),
+    ("pytz", pytz.timezone("Europe/Madrid").localize(datetime(2023, 10, 29, 2, 30), is_dst=False)),
+    ("pytz", pytz.FixedOffset(-150).localize(datetime(1900, 1, 1))),
+    ("pytz", pytz.UTC.localize(datetime(2100, 1, 1))),
+    ("pytz", datetime(2023, 1, 1, tzinfo=timezone.utc)),
+    ("zoneinfo", datetime(2023, 10, 29, 2, 30, tzinfo=madrid)),
+    ("zoneinfo", datetime(2023, 10, 29, 2, 30, tzinfo=madrid, fold=1)),
+    ("zoneinfo", datetime(1900, 1, 1, tzinfo=timezone(timedelta(minutes=-150)))),
+    ("zoneinfo", datetime(2100, 1, 1, tzinfo=timezone.utc)),
+    ("zoneinfo", pytz.UTC.localize(datetime(2100, 1, 1))),
+]
+
+@pytest.mark.parametrize("backend, value", values)
+def test_encoding_roundtrip(backend, value):
+    backend = tz_cache.get_backend(backend)
+    decoded = _decode(_encode(value, backend), backend)
+    assert decoded == value
+    assert decoded.tzinfo is value.tzinfo or decoded.tzinfo == value.tzinfo
+    assert decoded.utcoffset() == value.utcoffset()
+    assert decoded.fold == value.fold
+
+@pytest.mark.parametrize("backend", ["pytz", "zoneinfo"])
+def test_timezone_backend(backend):
+    from friendlydateparser import parallel
+    texts = ["tomorrow at noon europe/madrid", "today at 10:00 +05:30"]
+    try:
+        with make_executor(2) as executor:
+            for name in ("pytz", backend):
+                tz_cache.set_default_backend(name)
+                expected = [parse_datetime(text, now=now) for text in texts]
+                zone = parse_timezone("europe/paris")
+                for kwargs in ({"workers": 2}, {"executor": executor}):
+                    result = parallel.parse_many(texts, now=now, **kwargs)
+                    assert result == expected
+                    assert [type(r.tzinfo) for r in result] == [type(e.tzinfo) for e in expected]
+                    assert parallel.parse_many(["europe/paris"], "timezone", **kwargs) == [zone]
+    finally:
+        tz_cache.set_default_backend("pytz")
+        parallel.shutdown()
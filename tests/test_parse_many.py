@@ -0,0 +1,49 @@
+import pytest
+from friendlydateparser import DateParser, parse_many, parse_dates, parse_datetimes
+from datetime import date, datetime
+
+now = "2023-10-12"
+
+def test_parse_dates_in_order():
+    result = parse_dates(["tomorrow", "2017", "yesterday", "tomorrow"], now=now)
+    assert result == [date(2023, 10, 13), date(2017, 1, 1), date(2023, 10, 11), date(2023, 10, 13)]
+
+def test_bad_rows_are_reported_per_item():
+    result = parse_datetimes(["2h ago", "15", None, "today at noon"], now=now)
+    assert result[0] == datetime(2023, 10, 11, 22)
+    assert isinstance(result[1], ValueError)
+    assert isinstance(result[2], ValueError)
+    assert result[3] == datetime(2023, 10, 12, 12)
+
+def test_out_of_range_rows_are_reported_per_item():
+    result = parse_dates(["tomorrow", "999999999 days ago", "999999999 weeks ago", "yesterday"], now=now)
+    assert result[0] == date(2023, 10, 13)
+    assert isinstance(result[1], ValueError)
+    assert isinstance(result[2], ValueError)
+    assert result[3] == date(2023, 10, 11)
+    result = DateParser().parse_many(["999999999 hours ago", "2h ago"], "datetime", now=now)
+    assert isinstance(result[0], ValueError)
+    assert result[1] == datetime(2023, 10, 11, 22)
+
+def test_shared_context():
+    result = parse_datetimes(["jan 1 2020", "jan 1 2020 cest"], now=now, default_tz="UTC")
+    assert [r.utcoffset().total_seconds() for r in result] == [0, 7200]
+
+def test_invalid_context_raises():
+    with pytest.raises(ValueError):
+        parse_dates(["today"], now="not a date")
+    with pytest.raises(ValueError):
+        parse_many(["today"], what="year")
+
+def test_duplicates_are_parsed_once():
+    parser = DateParser(cache=None)
+    calls = []
+    compile = parser.compile
+    parser.compile = lambda *args: calls.append(args) or compile(*args)
+    parser.parse_dates(["next monday", "next monday", "last monday", "next monday"], now=now)
+    assert len(calls) == 2
+
+def test_timezones():
+    result = parse_many(["europe/paris", "cest", "+02:00", "mars"], "timezone")
+    assert [str(r.zone) for r in result[:1]] == ["Europe/Paris"]
+    assert isinstance(result[3], ValueError)
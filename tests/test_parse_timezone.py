@@ -8,6 +8,14 @@ datetimes = [
     ("january 1, 2017 at 14:30", None, "2017-01-01T14:30:00.000000", "OK"),
     ("january 1, 2017 at 14:30", 'CEST', "2017-01-01T12:30:00.000000", "OK"),
     ("february 14, 2017 at 2:45:00.654 PM", 'Z', "2017-02-14T14:45:00.654000", "OK"),
+    ("january 1, 2017 at 14:30 etc/gmt+5", None, "2017-01-01T19:30:00.000000", "OK"),
+    ("january 1, 2017 at 14:30 est5edt", None, "2017-01-01T19:30:00.000000", "OK"),
+    ("january 1, 2017 at 14:30 gmt0", None, "2017-01-01T14:30:00.000000", "OK"),
+    ("january 1, 2017 at 14:30 America/Port-au-Prince", None, "2017-01-01T19:30:00.000000", "OK"),
+    ("january 1, 2017 at 14:30 PST", 'CEST', "2017-01-01T22:30:00.000000", "OK"),
+    ("january 1, 2017 at 14:30 mars/olympus_mons", None, ValueError, "OK"),
+    ("january 1, 2017 at 14:30 gmt+5", None, ValueError, "OK"),
+    ("january 1, 2017 at 14:30 cest-eest", None, ValueError, "OK"),
 ]
 
 @pytest.mark.parametrize("input_text, default_tz, expected, tag", datetimes)
@@ -0,0 +1,54 @@
+import pytest
+from friendlydateparser import DateParser, parse_date
+from friendlydateparser.cache import PlanCache
+from datetime import date, datetime
+
+nows = [
+    (datetime(2023, 10, 12), "2023-11-30"),
+    (datetime(2024, 1, 31), "2024-02-29"),
+    (datetime(2024, 12, 5), "2025-01-31"),
+]
+
+@pytest.mark.parametrize("now, expected", nows)
+def test_plan_evaluated_against_now(now, expected):
+    parser = DateParser(cache=PlanCache())
+    plan = parser.compile("the last day of next month", "date")
+    result = parser.evaluate(plan, now=now)
+    assert result.strftime('%Y-%m-%d') == expected
+
+def test_cache_hits():
+    cache = PlanCache()
+    parser = DateParser(cache=cache)
+    for now in ("2023-10-12", "2024-01-31", "2024-12-05"):
+        parser.parse_date("The last day of next month", now=now)
+    info = cache.info()
+    assert info.currsize == 1
+    assert info.hits == 2
+    assert info.misses == 1
+    assert cache.hit_rate == pytest.approx(2 / 3)
+
+def test_cache_key_includes_month_first():
+    parser = DateParser(cache=PlanCache())
+    assert parser.parse_date("10/3/2017", month_first=True) == date(2017, 10, 3)
+    assert parser.parse_date("10/3/2017", month_first=False) == date(2017, 3, 10)
+
+def test_cache_eviction():
+    cache = PlanCache(maxsize=2)
+    parser = DateParser(cache=cache)
+    for text in ("2017", "2018", "2019", "2017"):
+        parser.parse_date(text)
+    info = cache.info()
+    assert info.currsize == 2
+    assert info.hits == 0
+
+def test_errors_are_not_cached():
+    cache = PlanCache()
+    parser = DateParser(cache=cache)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            parser.parse_date("15")
+    assert cache.info().currsize == 0
+
+def test_module_functions_share_cache():
+    assert parse_date("2 days before the first of next month", now="2023-10-12") == date(2023, 10, 30)
+    assert parse_date("2 days before the first of next month", now="2024-03-02") == date(2024, 3, 30)
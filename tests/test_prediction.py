@@ -0,0 +1,57 @@
+import pytest
+from datetime import datetime
+from friendlydateparser import DateParser, PredictionInfo, instrument
+
+import test_fast_path
+
+now = "2023-10-12"
+
+def _outcome(parser, what, text):
+    try:
+        if what == "date":
+            return parser.parse_date(text, now=now)
+        if what == "timezone":
+            return parser.parse_timezone(text)
+        return parser.parse_datetime(text, now=now)
+    except ValueError as e:
+        return str(e)
+
+@pytest.fixture(scope="module")
+def parsers():
+    return (DateParser(cache=None, fast_path=False, prediction="ll"),
+            DateParser(cache=None, fast_path=False, prediction="two_stage"))
+
+@pytest.mark.parametrize("what", ["date", "datetime", "timezone"])
+@pytest.mark.parametrize("text", test_fast_path.corpus)
+def test_two_stage_matches_ll(parsers, text, what):
+    ll, two_stage = parsers
+    assert _outcome(two_stage, what, text) == _outcome(ll, what, text)
+
+def test_prediction_info():
+    parser = DateParser(cache=None)
+    parser.parse_datetime("the last day of next month", now=now)
+    assert parser.prediction_info() == PredictionInfo(1, 0)
+    with pytest.raises(ValueError):
+        parser.parse_datetime("the last day of next", now=now)
+    assert parser.prediction_info() == PredictionInfo(1, 1)
+
+def test_ll_prediction():
+    parser = DateParser(cache=None, prediction="ll")
+    parser.parse_datetime("the last day of next month", now=now)
+    assert parser.prediction_info() == PredictionInfo(0, 0)
+
+def test_invalid_prediction():
+    with pytest.raises(ValueError):
+        DateParser(prediction="sll")
+
+def test_fallback_event():
+    events = []
+    instrument.add_hook(events.append)
+    try:
+        parser = DateParser(cache=None)
+        parser.parse_date("tomorrow", now=datetime(2023, 10, 12))
+        with pytest.raises(ValueError):
+            parser.parse_date("tomorrow at", now=datetime(2023, 10, 12))
+    finally:
+        instrument.remove_hook(events.append)
+    assert [e.fallback for e in events] == [False, True]
@@ -0,0 +1,150 @@
+import pytest
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.LexerATNSimulator import LexerATNSimulator
+from antlr4.dfa.DFA import DFA
+from antlr4.PredictionContext import PredictionContextCache
+
+from friendlydateparser import DateParser
+from friendlydateparser import threads as fdp_threads
+from friendlydateparser.antlr.FriendlyDateLexer import FriendlyDateLexer
+from friendlydateparser.antlr.FriendlyDateParser import FriendlyDateParser
+
+import test_fast_path
+
+now = datetime(2023, 10, 12)
+
+def _outcome(parser, text):
+    try:
+        return parser.parse_datetime(text, now=now)
+    except ValueError as e:
+        return str(e)
+
+def _check_dfas(decisions):
+    # every edge leads to the state registered in the DFA and state
+    # numbers are not repeated
+    errors = (ATNSimulator.ERROR, LexerATNSimulator.ERROR)
+    for dfa in decisions:
+        assert all(key is state for key, state in dfa.states.items())
+        numbers = [s.stateNumber for s in dfa.states]
+        assert len(numbers) == len(set(numbers))
+        for state in dfa.states:
+            for target in state.edges or ():
+                if target is not None and target not in errors:
+                    assert dfa.states.get(target) is target
+
+def _run_threads(target, args):
+    # runs target(*a) for every a in args on its own thread and returns
+    # the results, exceptions raised by the threads fail the test
+    results = [None] * len(args)
+    errors = []
+    def run(i):
+        try:
+            results[i] = target(*args[i])
+        except BaseException as e:
+            errors.append(e)
+    workers = [threading.Thread(target=run, args=(i,)) for i in range(len(args))]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    if errors:
+        raise errors[0]
+    return results
+
+@pytest.fixture
+def fresh_dfas(monkeypatch):
+    # sessions created from now on start with empty DFAs
+    lexer_dfas = [DFA(s, i) for i, s in enumerate(FriendlyDateLexer.atn.decisionToState)]
+    parser_dfas = [DFA(s, i) for i, s in enumerate(FriendlyDateParser.atn.decisionToState)]
+    monkeypatch.setattr(FriendlyDateLexer, "decisionsToDFA", lexer_dfas)
+    monkeypatch.setattr(FriendlyDateParser, "decisionsToDFA", parser_dfas)
+    monkeypatch.setattr(FriendlyDateParser, "sharedContextCache", PredictionContextCache())
+    return lexer_dfas, parser_dfas
+
+def test_stress(fresh_dfas):
+    texts = test_fast_path.corpus
+    reference = DateParser(cache=None, fast_path=False)
+    expected = {text: _outcome(reference, text) for text in texts}
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    barrier = threading.Barrier(8)
+    def worker(seed):
+        parser = DateParser(cache=None, fast_path=False)
+        order = list(texts)
+        random.Random(seed).shuffle(order)
+        barrier.wait()
+        return [(text, result) for text in order if (result := _outcome(parser, text)) != expected[text]]
+    try:
+        failures = _run_threads(worker, [(seed,) for seed in range(8)])
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert failures == [[]] * 8
+    for decisions in fresh_dfas:
+        _check_dfas(decisions)
+
+class _SlowDict(dict):
+    # gives other threads the chance to run between the lookup of a
+    # missing DFA state and its insertion
+    def get(self, key, default=None):
+        value = super().get(key, default)
+        if value is default:
+            time.sleep(0.0002)
+        return value
+
+def test_dfa_updates_are_atomic(fresh_dfas):
+    for decisions in fresh_dfas:
+        for dfa in decisions:
+            dfa._states = _SlowDict()
+    texts = test_fast_path.corpus[:40]
+    barrier = threading.Barrier(4)
+    def worker():
+        parser = DateParser(cache=None, fast_path=False)
+        barrier.wait()
+        for text in texts:
+            _outcome(parser, text)
+    _run_threads(worker, [()] * 4)
+    for decisions in fresh_dfas:
+        _check_dfas(decisions)
+
+def test_pool():
+    pool = fdp_threads.ParserPool(cache=None)
+    barrier = threading.Barrier(4)
+    def worker():
+        session = pool.get()
+        result = pool.parse_datetime("tomorrow at noon", now=now)
+        # keeps every thread alive until all have taken their session
+        barrier.wait()
+        return session, pool.get(), result
+    results = _run_threads(worker, [()] * 4)
+    assert pool.size() == 4
+    assert len({id(session) for session, _, _ in results}) == 4
+    for session, again, result in results:
+        assert again is session
+        assert result == datetime(2023, 10, 13, 12)
+
+@pytest.mark.parametrize("threads, chunksize", [(1, 1000), (4, 7)])
+def test_parse_many(threads, chunksize):
+    texts = test_fast_path.corpus + ["foo", 42] + test_fast_path.corpus[:10]
+    expected = [_outcome(DateParser(), text) if isinstance(text, str) else None for text in texts]
+    results = fdp_threads.parse_many(texts, now=now, threads=threads, chunksize=chunksize)
+    for text, result, want in zip(texts, results, expected):
+        if not isinstance(text, str):
+            assert isinstance(result, ValueError)
+        elif isinstance(result, ValueError):
+            assert str(result) == want
+        else:
+            assert result == want
+
+def test_parse_many_with_pool():
+    pool = fdp_threads.ParserPool()
+    assert fdp_threads.parse_many(["2023-01-01", "tomorrow"], "date", now=now, threads=2, chunksize=1,
+                                  pool=pool) == [datetime(2023, 1, 1).date(), datetime(2023, 10, 13).date()]
+    assert 1 <= pool.size() <= 2
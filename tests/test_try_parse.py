@@ -0,0 +1,124 @@
+import pytest
+from datetime import datetime
+from friendlydateparser import (DateParser, try_parse_date, try_parse_datetime, try_parse_timezone,
+                                instrument)
+from friendlydateparser.prefilter import could_match, anchor_tokens
+
+import test_fast_path
+import test_parse_timezone
+
+now = datetime(2023, 10, 12)
+
+def _outcome(parser, what, text):
+    try:
+        if what == "date":
+            return parser.parse_date(text, now=now)
+        if what == "timezone":
+            return parser.parse_timezone(text)
+        return parser.parse_datetime(text, now=now)
+    except ValueError:
+        return None
+
+def _try_outcome(parser, what, text):
+    if what == "date":
+        return parser.try_parse_date(text, now=now)
+    if what == "timezone":
+        return parser.try_parse_timezone(text)
+    return parser.try_parse_datetime(text, now=now)
+
+texts = sorted(set(test_fast_path.corpus) | {text for text, *_ in test_parse_timezone.datetimes})
+
+timezones = ["z", "utc", "CEST", "Europe/Paris", "etc/gmt+5", "est5edt", "+05:30", "-3",
+             "mars/olympus_mons", "gmt+5", "cest-eest", "utc later"]
+
+@pytest.fixture(scope="module")
+def parsers():
+    return (DateParser(cache=None), DateParser(cache=None))
+
+@pytest.mark.parametrize("what", ["date", "datetime", "timezone"])
+@pytest.mark.parametrize("text", texts + timezones)
+def test_try_parse_matches_parse(parsers, text, what):
+    parser, try_parser = parsers
+    assert _try_outcome(try_parser, what, text) == _outcome(parser, what, text)
+
+rejected = [
+    ("", "datetime"),
+    ("hello world", "datetime"),
+    ("the day after", "date"),
+    ("call me at noon", "datetime"),
+    ("ticket #1234", "datetime"),
+    ("price: $10", "date"),
+    ("user@example.com", "datetime"),
+    ("", "timezone"),
+    ("  ", "timezone"),
+    ("+", "timezone"),
+    ("ñ", "timezone"),
+]
+
+@pytest.mark.parametrize("text, what", rejected)
+def test_prefilter_rejects(text, what):
+    assert not could_match(text, what)
+
+@pytest.mark.parametrize("text", ["January", "next WEEK", "the 3rd", "sun", "now"])
+def test_prefilter_accepts(text):
+    assert could_match(text, "datetime")
+
+@pytest.mark.parametrize("token", anchor_tokens)
+def test_anchor_tokens(token):
+    parser = DateParser()
+    parser._reset(token.lower())
+    tokens = parser._token_stream
+    tokens.fill()
+    assert [parser._lexer.symbolicNames[t.type] for t in tokens.tokens[:-1]] == [token]
+
+invalid = [
+    "today #",
+    ". today",
+    "tomorrow at",
+    "31/31/2020",
+    "the last day of next",
+    "2 days after",
+    "feb 30 2020",
+    "2023-13-01",
+    42,
+    None,
+]
+
+@pytest.mark.parametrize("text", invalid)
+def test_try_parse_invalid(text, capsys):
+    assert try_parse_date(text, now=now) is None
+    assert try_parse_datetime(text, now=now) is None
+    assert capsys.readouterr().err == ""
+
+@pytest.mark.parametrize("text", ["999999999 days ago", "999999999 weeks ago", "99999 years ago"])
+def test_try_parse_out_of_range(text):
+    assert try_parse_date(text, now=now) is None
+    assert try_parse_datetime(text, now=now) is None
+    assert try_parse_datetime("999999999 hours ago", now=now) is None
+    assert DateParser().try_parse_date(text, now=now) is None
+
+def test_try_parse_valid():
+    assert try_parse_date("tomorrow", now=now) == datetime(2023, 10, 13).date()
+    assert try_parse_datetime("tomorrow at noon", now=now) == datetime(2023, 10, 13, 12)
+    assert str(try_parse_timezone("Europe/Paris")) == "Europe/Paris"
+    assert try_parse_timezone("europe/nowhere") is None
+
+def test_try_parse_does_not_build_tree_string(monkeypatch):
+    from antlr4 import ParserRuleContext
+    def fail(*args, **kwargs):
+        raise AssertionError("toStringTree called")
+    monkeypatch.setattr(ParserRuleContext, "toStringTree", fail)
+    parser = DateParser(cache=None)
+    assert parser.try_parse_datetime("tomorrow at", now=now) is None
+    assert parser.try_parse_datetime("the last day of next year", now=now) == datetime(2024, 12, 31)
+
+def test_try_parse_skips_antlr():
+    events = []
+    instrument.add_hook(events.append)
+    try:
+        parser = DateParser(cache=None)
+        assert parser.try_parse_datetime("hello world", now=now) is None
+        assert parser.try_parse_datetime("tomorrow at", now=now) is None
+    finally:
+        instrument.remove_hook(events.append)
+    assert [(e.text, e.source, e.error is not None) for e in events] == [("tomorrow at", "grammar", True)]
@@ -0,0 +1,90 @@
+import os
+import subprocess
+import sys
+import zoneinfo
+from datetime import datetime, timezone, timedelta
+
+import pytest
+import pytz
+
+import friendlydateparser
+from friendlydateparser import DateParser, parse_datetime, parse_timezone
+from friendlydateparser import tz as tz_cache
+from friendlydateparser.corpus import warmup_corpus
+
+now = datetime(2023, 10, 12)
+
+@pytest.mark.parametrize("text, expected", [
+    ("europe/paris", zoneinfo.ZoneInfo("Europe/Paris")),
+    ("cest", timezone(timedelta(hours=2))),
+    ("+05:30", timezone(timedelta(hours=5, minutes=30))),
+    ("z", timezone.utc),
+    ("utc", zoneinfo.ZoneInfo("UTC")),
+])
+def test_zoneinfo_timezones(text, expected):
+    assert DateParser(tz_backend="zoneinfo").parse_timezone(text) == expected
+
+@pytest.mark.parametrize("text", [
+    "tomorrow at 10:00 europe/madrid",
+    "jul 3rd 2023 at noon cest",
+    "2024-12-31t13:01+02:00",
+    "2024-03-31 02:30 europe/madrid",
+    "2024-10-27 02:30 europe/madrid",
+])
+def test_backends_agree(text):
+    a = DateParser(tz_backend="pytz").parse_datetime(text, now=now)
+    b = DateParser(tz_backend="zoneinfo").parse_datetime(text, now=now)
+    assert a.replace(tzinfo=None) == b.replace(tzinfo=None)
+    assert a.utcoffset() == b.utcoffset()
+    assert not isinstance(b.tzinfo, pytz.BaseTzInfo)
+
+@pytest.mark.parametrize("default_tz", [None, "europe/madrid", "cest"])
+def test_backends_agree_on_corpus(default_tz):
+    a = DateParser(tz_backend="pytz").parse_datetimes(warmup_corpus, now=now, default_tz=default_tz)
+    b = DateParser(tz_backend="zoneinfo").parse_datetimes(warmup_corpus, now=now, default_tz=default_tz)
+    for text, x, y in zip(warmup_corpus, a, b):
+        if isinstance(x, ValueError):
+            assert isinstance(y, ValueError), text
+        else:
+            assert x.replace(tzinfo=None) == y.replace(tzinfo=None), text
+            assert x.utcoffset() == y.utcoffset(), text
+
+def test_zoneinfo_singletons():
+    parser = DateParser(tz_backend="zoneinfo", cache=None)
+    assert parser.parse_datetime("today at 10:00 cest", now=now).tzinfo is tz_cache.from_offset(120, "zoneinfo")
+    assert parser.parse_timezone("Europe/Paris") is tz_cache.from_name("europe/paris", "zoneinfo")
+
+def test_plan_cache_is_per_backend():
+    text = "tomorrow at 10:00 cest"
+    assert isinstance(DateParser(tz_backend="pytz").parse_datetime(text, now=now).tzinfo, pytz.BaseTzInfo)
+    assert isinstance(DateParser(tz_backend="zoneinfo").parse_datetime(text, now=now).tzinfo, timezone)
+
+def test_default_tz_objects_from_any_backend():
+    parser = DateParser(tz_backend="pytz")
+    result = parser.parse_datetime("tomorrow at 10:00", now=now, default_tz=zoneinfo.ZoneInfo("Europe/Madrid"))
+    assert result.utcoffset() == timedelta(hours=2)
+
+def test_set_default_backend():
+    try:
+        tz_cache.set_default_backend("zoneinfo")
+        assert isinstance(parse_datetime("tomorrow at 10:00 europe/madrid", now=now).tzinfo, zoneinfo.ZoneInfo)
+        assert isinstance(parse_timezone("cest"), timezone)
+    finally:
+        tz_cache.set_default_backend("pytz")
+    assert isinstance(parse_timezone("cest"), pytz.BaseTzInfo)
+
+def test_invalid_backend():
+    with pytest.raises(ValueError):
+        DateParser(tz_backend="dateutil")
+
+def test_zoneinfo_does_not_load_pytz():
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(friendlydateparser.__file__))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    code = ("import sys, friendlydateparser\n"
+            "from friendlydateparser import tz\n"
+            "tz.set_default_backend('zoneinfo')\n"
+            "friendlydateparser.parse_datetime('tomorrow at 10:00 europe/madrid', default_tz='cest')\n"
+            "print('pytz' in sys.modules)")
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout
+    assert out.split() == ["False"]
@@ -0,0 +1,68 @@
+import pytest
+import threading
+from datetime import datetime
+from friendlydateparser import DateParser, parse_timezone, parse_datetime, try_parse_timezone
+from friendlydateparser import tz as tz_cache
+
+now = datetime(2023, 10, 12)
+
+@pytest.mark.parametrize("text", ["Europe/Paris", "CEST", "+05:30", "-3", "z", "utc"])
+def test_parse_timezone_returns_singletons(text):
+    parser = DateParser(cache=None)
+    assert parse_timezone(text) is parse_timezone(text.upper()) is parser.parse_timezone(f" {text} ")
+
+@pytest.mark.parametrize("text, tz", [
+    ("today at 10:00 cest", "CEST"),
+    ("today at 10:00 +02:00", "+02:00"),
+    ("2024-12-31t13:01+02:00", "+02:00"),
+    ("2024-12-31t13:01z", "z"),
+    ("today at 10:00 utc", "z"),
+])
+def test_fixed_offsets_are_shared(text, tz):
+    result = DateParser(cache=None).parse_datetime(text, now=now)
+    assert result.tzinfo is parse_timezone(tz)
+
+@pytest.mark.parametrize("offset", [0, 120, -300, 330])
+def test_offsets_are_shared(offset):
+    assert tz_cache.from_offset(offset) is tz_cache.from_offset(offset)
+
+def test_names_are_shared():
+    assert tz_cache.from_name("europe/paris") is parse_timezone("Europe/Paris")
+    assert tz_cache.from_name("cest") is tz_cache.from_offset(120)
+
+def test_unknown_name():
+    with pytest.raises(ValueError):
+        tz_cache.from_name("mars/olympus_mons")
+    with pytest.raises(ValueError):
+        parse_timezone("mars/olympus_mons")
+    assert try_parse_timezone("mars/olympus_mons") is None
+
+def test_default_tz_resolved_from_cache():
+    parse_timezone("Europe/Paris")
+    parser = DateParser(cache=None)
+    compiled = []
+    compile = parser.compile
+    parser.compile = lambda *args: compiled.append(args) or compile(*args)
+    result = parser.parse_datetime("tomorrow", now=now, default_tz="Europe/Paris")
+    assert result.tzinfo.zone == "Europe/Paris"
+    result = parse_datetime("tomorrow", now=now, default_tz="Europe/Paris")
+    assert result.tzinfo.zone == "Europe/Paris"
+    assert [args[0] for args in compiled] == ["tomorrow"]
+
+def test_threads_share_singletons():
+    tz_cache.clear()
+    names = ["europe/paris", "america/new_york", "cest", "est", "asia/tokyo"]
+    results = []
+    barrier = threading.Barrier(8)
+    def worker():
+        barrier.wait()
+        results.append([tz_cache.from_name(name) for name in names] +
+                       [parse_timezone(name) for name in names])
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(results) == 8
+    for row in results[1:]:
+        assert all(a is b for a, b in zip(row, results[0]))
@@ -0,0 +1,38 @@
+from antlr4 import ParserRuleContext
+from friendlydateparser import DateParser, WarmupInfo, warmup
+from friendlydateparser.corpus import warmup_corpus
+
+# rules which are not referenced from the entry rules
+unused_rules = {"iso8601Month", "iso8601MonthDay", "last"}
+
+def test_warmup_builds_dfa_states_once():
+    info = warmup()
+    assert isinstance(info, WarmupInfo)
+    assert info.inputs == len(warmup_corpus)
+    assert warmup() == (len(warmup_corpus), 0, 0)
+
+def test_warmup_custom_corpus():
+    assert warmup(["tomorrow", "not a date"]).inputs == 2
+
+def test_corpus_covers_grammar():
+    session = DateParser(cache=None, fast_path=False)
+    parser = session._parser
+    rules, tokens = set(), set()
+
+    def walk(ctx):
+        rules.add(parser.ruleNames[ctx.getRuleIndex()])
+        for child in ctx.getChildren():
+            if isinstance(child, ParserRuleContext):
+                walk(child)
+
+    for text in warmup_corpus:
+        for entry in (parser.friendlyDate, parser.friendlyDateTime, parser.friendlyTimezone):
+            session._reset(text)
+            tree = entry()
+            tokens.update(token.type for token in session._token_stream.tokens)
+            if session._error_listener.count == 0:
+                walk(tree)
+
+    assert set(parser.ruleNames) - unused_rules - rules == set()
+    names = parser.symbolicNames
+    assert {names[t] for t in range(1, len(names)) if t not in tokens} == {"WS"}